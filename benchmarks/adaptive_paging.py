@@ -0,0 +1,179 @@
+"""Listing throughput with fixed and adaptive page sizes.
+
+Lists every item of boards with 5 to 150 columns from a local fake
+Monday.com server whose per-page complexity and latency grow with the number
+of columns, and which rejects pages above the per-query complexity ceiling.
+Fixed page sizes are compared with the adaptive mode of
+``monday-list-items-in-groups`` (no ``limit``):
+
+    uv run python benchmarks/adaptive_paging.py --items 2000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Scaled down from the real API so that a run takes seconds.
+os.environ.setdefault("MONDAY_PAGE_LATENCY_TARGET", "0.5")
+
+COLUMN_COUNTS = (5, 20, 80, 150)
+MAX_COMPLEXITY = 5_000_000
+POINTS_PER_CELL = 1_000
+SECONDS_PER_REQUEST = 0.03
+SECONDS_PER_CELL = 0.00004
+
+
+def serve(items_per_board: int) -> str:
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            query = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            query = query["query"]
+            # Board IDs are their column counts.
+            columns = int(re.search(r"boards \(ids: (\d+)\)", query).group(1))
+            limit = int(re.search(r"limit: (\d+)", query).group(1))
+            cursor = re.search(r'cursor: "(\d+)"', query)
+            offset = int(cursor.group(1)) if cursor else 0
+
+            complexity = limit * columns * POINTS_PER_CELL
+            if complexity > MAX_COMPLEXITY:
+                time.sleep(SECONDS_PER_REQUEST)
+                return self.reply(
+                    {
+                        "errors": [
+                            {
+                                "message": f"Query has complexity of {complexity}, "
+                                f"which exceeds max complexity of {MAX_COMPLEXITY}",
+                                "extensions": {"code": "maxComplexityExceeded"},
+                            }
+                        ]
+                    }
+                )
+
+            end = min(items_per_board, offset + limit)
+            time.sleep(
+                SECONDS_PER_REQUEST + (end - offset) * columns * SECONDS_PER_CELL
+            )
+            items = [
+                {
+                    "id": str(i),
+                    "name": f"Item {i}",
+                    "updates": [],
+                    "column_values": [
+                        {"id": f"text{c}", "type": "text", "text": "x", "value": '"x"'}
+                        for c in range(columns)
+                    ],
+                }
+                for i in range(offset, end)
+            ]
+            self.reply(
+                {
+                    "data": {
+                        "complexity": {"query": complexity, "after": 10_000_000},
+                        "boards": [
+                            {
+                                "items_page": {
+                                    "cursor": str(end)
+                                    if end < items_per_board
+                                    else None,
+                                    "items": items,
+                                }
+                            }
+                        ],
+                    }
+                }
+            )
+
+        def reply(self, body: dict) -> None:
+            payload = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}/v2"
+
+
+def list_board(endpoint: str, board_id: str, limit) -> dict:
+    from mcp_server_monday.client import create_monday_client
+    from mcp_server_monday.item import handle_monday_list_items_in_groups
+    from mcp_server_monday.pagesize import budget_remaining, page_sizer_for
+
+    client = create_monday_client("benchmark")
+    for resource in vars(client).values():
+        if hasattr(getattr(resource, "client", None), "endpoint"):
+            resource.client.endpoint = endpoint
+
+    adaptive = limit is None
+    cursor = None
+    pages = items = 0
+    started_at = time.perf_counter()
+    while True:
+        if adaptive:
+            limit = page_sizer_for(client).suggest(board_id, budget_remaining(client))
+        try:
+            result = asyncio.run(
+                handle_monday_list_items_in_groups(
+                    board_id, [], limit, client, cursor, adaptive
+                )
+            )
+        except Exception as e:
+            return {"error": str(e)[:60], "pages": pages, "items": items}
+        text = result[0].text
+        page = json.loads(text[text.index('{"data"') :])["data"]["boards"][0]
+        page = page["items_page"]
+        pages += 1
+        items += len(page["items"])
+        cursor = page["cursor"]
+        if not cursor:
+            break
+    seconds = time.perf_counter() - started_at
+    return {
+        "pages": pages,
+        "items": items,
+        "seconds": seconds,
+        "items_per_second": items / seconds,
+        "failures": page_sizer_for(client).failures,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=2000)
+    parser.add_argument("--sizes", default="25,100,500")
+    args = parser.parse_args()
+
+    endpoint = serve(args.items)
+    modes = [int(size) for size in args.sizes.split(",")] + [None]
+    target = os.environ["MONDAY_PAGE_LATENCY_TARGET"]
+    print(f"{args.items} items per board, latency target {target}s")
+    for columns in COLUMN_COUNTS:
+        print(f"\n{columns} columns")
+        for limit in modes:
+            result = list_board(endpoint, str(columns), limit)
+            label = "adaptive" if limit is None else f"limit {limit}"
+            if "error" in result:
+                print(
+                    f"  {label:>10}: failed after {result['pages']} pages: "
+                    f"{result['error']}"
+                )
+                continue
+            print(
+                f"  {label:>10}: {result['pages']:>3} pages, "
+                f"{result['seconds']:6.2f}s, {result['items_per_second']:7.0f} items/s"
+                + (f", {result['failures']} failed pages" if limit is None else "")
+            )
+
+
+if __name__ == "__main__":
+    main()
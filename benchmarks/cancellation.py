@@ -0,0 +1,173 @@
+"""How quickly cancelled tool calls stop using upstream capacity.
+
+Points the server at a local API that holds every request for ``--delay``
+seconds, starts ``--calls`` tool calls, and then stops them, once by sending
+MCP ``notifications/cancelled`` for each and once by letting them run past a
+tool deadline. Reports how long after that the scheduler slots were free again
+and the upstream connections were closed, with requests aborted and with
+plain connections that cannot be (where only the deadline, which also shortens
+request timeouts, frees the upstream):
+
+    uv run python benchmarks/cancellation.py --calls 4 --delay 5
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import select
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEADLINE = 1.0
+
+# Set before the server is imported, which reads its settings.
+os.environ.setdefault("MONDAY_API_KEY", "benchmark")
+os.environ.pop("MONDAY_RECORD_CASSETTE", None)
+os.environ["MONDAY_TOOL_DEADLINES"] = f"monday_get_board_columns={DEADLINE}"
+
+
+class SlowUpstream:
+    """Holds each request for ``delay`` seconds, noting when clients hang up."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.in_flight = 0
+        self.closed_at: list[float] = []
+        self._lock = threading.Lock()
+        upstream = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                with upstream._lock:
+                    upstream.in_flight += 1
+                try:
+                    # Readable before the reply is sent only once the client
+                    # has closed its end.
+                    readable, _, _ = select.select(
+                        [self.connection], [], [], upstream.delay
+                    )
+                    if readable:
+                        with upstream._lock:
+                            upstream.closed_at.append(time.perf_counter())
+                        self.close_connection = True
+                        return
+                    payload = b'{"data": {"boards": []}}'
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(payload)))
+                    self.end_headers()
+                    self.wfile.write(payload)
+                finally:
+                    with upstream._lock:
+                        upstream.in_flight -= 1
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.endpoint = f"http://127.0.0.1:{self.server.server_port}/v2"
+
+
+async def wait_until(condition, timeout: float) -> float:
+    """Seconds until ``condition()`` held, or ``inf``."""
+    started_at = time.perf_counter()
+    while not condition():
+        if time.perf_counter() - started_at > timeout:
+            return float("inf")
+        await asyncio.sleep(0.0005)
+    return time.perf_counter() - started_at
+
+
+async def run(upstream: SlowUpstream, calls: int, abort: bool) -> dict:
+    from fastmcp import Client
+    from requests.adapters import HTTPAdapter
+
+    from mcp_server_monday.fastmcp_server import get_monday_client, mcp
+    from mcp_server_monday.scheduler import scheduler_for
+
+    logging.getLogger("mcp").setLevel(logging.WARNING)
+
+    monday_client = get_monday_client()
+    for resource in vars(monday_client).values():
+        if hasattr(getattr(resource, "client", None), "endpoint"):
+            resource.client.endpoint = upstream.endpoint
+    if not abort:
+        monday_client.http_session.mount("http://", HTTPAdapter())
+    scheduler = scheduler_for(monday_client)
+    results = {}
+
+    async with Client(mcp) as client:
+        for mode, tool in (
+            ("cancel", "monday_get_board_groups"),
+            ("deadline", "monday_get_board_columns"),
+        ):
+            upstream.closed_at.clear()
+            board_ids = [f"{mode}{abort:d}{i}" for i in range(calls)]
+            first_request_id = client.session._request_id
+            started_at = time.perf_counter()
+            tasks = [
+                asyncio.create_task(
+                    client.call_tool(tool, {"boardId": board_id}, raise_on_error=False)
+                )
+                for board_id in board_ids
+            ]
+            await wait_until(lambda: upstream.in_flight == calls, 5)
+
+            if mode == "cancel":
+                stopped_at = time.perf_counter()
+                for request_id in range(first_request_id, first_request_id + calls):
+                    await client.cancel(request_id)
+            else:
+                # The calls get their slots at once, starting their deadlines.
+                stopped_at = started_at + DEADLINE
+                await asyncio.wait(tasks, timeout=DEADLINE * 2)
+                await asyncio.sleep(max(0.0, stopped_at - time.perf_counter()))
+            slots_free = await wait_until(
+                lambda: scheduler.available == scheduler.concurrency, DEADLINE
+            )
+            upstream_free = await wait_until(
+                lambda: upstream.in_flight == 0, upstream.delay * 2
+            )
+            closed = [t - stopped_at for t in upstream.closed_at]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            results[mode] = {
+                "slots_free": slots_free,
+                "upstream_free": upstream_free,
+                "closed": closed,
+            }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=4)
+    parser.add_argument("--delay", type=float, default=5.0)
+    args = parser.parse_args()
+
+    upstream = SlowUpstream(args.delay)
+    print(f"{args.calls} calls held {args.delay:g}s upstream; ms after stopping them")
+    print(f"{'':>24} {'slots free':>11} {'upstream idle':>14} {'closed p50':>11}")
+    for abort in (True, False):
+        results = asyncio.run(run(upstream, args.calls, abort))
+        for mode, result in results.items():
+            closed = result["closed"]
+            median = statistics.median(closed) * 1000 if closed else float("nan")
+            label = f"{mode}, {'aborted' if abort else 'not aborted'}"
+            print(
+                f"{label:>24} {result['slots_free'] * 1000:>11.1f} "
+                f"{result['upstream_free'] * 1000:>14.1f} {median:>11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Latency of the first tool call of a freshly started server process.
+
+``just bench-startup`` only measures how long the server takes to import.
+This starts ``--runs`` fresh processes instead, each answering the first tool
+call recorded in a cassette (see ``MONDAY_RECORD_CASSETTE``) from a local
+replay server, so it runs offline. Reports the median time to import the
+server, to connect an in-memory MCP client, and to answer the call, which
+includes creating the Monday.com client and whatever each call imports lazily:
+
+    uv run python benchmarks/first_call.py traffic.jsonl --runs 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+
+def child(tool: str, arguments: dict) -> None:
+    """Run in the fresh process: time each step and print them as JSON."""
+    started_at = time.perf_counter()
+    import asyncio
+
+    from mcp_server_monday.fastmcp_server import mcp
+
+    imported_at = time.perf_counter()
+
+    async def first_call() -> tuple[float, float, bool]:
+        from fastmcp import Client
+
+        async with Client(mcp) as client:
+            connected_at = time.perf_counter()
+            result = await client.call_tool(tool, arguments, raise_on_error=False)
+            return connected_at, time.perf_counter(), result.is_error
+
+    connected_at, answered_at, failed = asyncio.run(first_call())
+    print(
+        json.dumps(
+            {
+                "import": imported_at - started_at,
+                "connect": connected_at - imported_at,
+                "call": answered_at - connected_at,
+                "failed": failed,
+            }
+        )
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("cassette")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=0.0,
+        help="Divide recorded upstream latencies by this (0: no delay)",
+    )
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(args.child[0], json.loads(args.child[1]))
+        return
+
+    sys.path.insert(0, SRC)
+    from mcp_server_monday.cassette import ReplayServer, load_cassette
+
+    events = load_cassette(args.cassette)
+    calls = [event for event in events if event.get("type") == "call"]
+    if not calls:
+        sys.exit("The cassette has no tool calls to replay")
+    first = calls[0]
+    replay = ReplayServer(events, args.speed)
+    env = dict(
+        os.environ,
+        MONDAY_API_KEY=os.environ.get("MONDAY_API_KEY", "replay"),
+        MONDAY_API_BASE_URL=replay.start(),
+        PYTHONPATH=os.pathsep.join(filter(None, [SRC, os.environ.get("PYTHONPATH")])),
+    )
+    env.pop("MONDAY_RECORD_CASSETTE", None)
+
+    timings: dict[str, list[float]] = {
+        "process": [],
+        "import": [],
+        "connect": [],
+        "call": [],
+    }
+    failures = 0
+    for _ in range(args.runs):
+        started_at = time.perf_counter()
+        output = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                args.cassette,
+                "--child",
+                first["tool"],
+                json.dumps(first["arguments"]),
+            ],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        total = time.perf_counter() - started_at
+        run = json.loads(output.strip().splitlines()[-1])
+        # What the process spent before and after the timed steps: interpreter
+        # start-up and shutdown.
+        timings["process"].append(total - run["import"] - run["connect"] - run["call"])
+        for step in ("import", "connect", "call"):
+            timings[step].append(run[step])
+        failures += run["failed"]
+    replay.stop()
+
+    print(
+        f"First call to {first['tool']} in {args.runs} fresh processes "
+        f"({failures} failed; recorded: {first['seconds'] * 1000:.1f} ms); "
+        f"upstream matches: {replay.metrics()}"
+    )
+    print(f"{'step':<10} {'p50 ms':>8} {'min ms':>8} {'max ms':>8}")
+    for step, values in timings.items():
+        print(
+            f"{step:<10} {statistics.median(values) * 1000:>8.1f} "
+            f"{min(values) * 1000:>8.1f} {max(values) * 1000:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Peak RSS of concurrent large item listings, with and without streaming parsing.
+
+Serves a synthetic items page (with updates and column values) from a local
+HTTP server and lists it from several threads at once through the same code
+path as the ``monday-list-items-in-groups`` tool. Each mode runs in its own
+process so that peak RSS is measured independently:
+
+    uv run python benchmarks/memory_listing.py --items 500 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def synthetic_page(items: int) -> bytes:
+    page = {
+        "data": {
+            "boards": [
+                {
+                    "items_page": {
+                        "cursor": "next-page-cursor",
+                        "items": [
+                            {
+                                "id": str(1000 + i),
+                                "name": f"Item {i}",
+                                "updates": [
+                                    {
+                                        "id": f"{i}-{u}",
+                                        "body": "<p>" + "x" * 800 + "</p>",
+                                    }
+                                    for u in range(5)
+                                ],
+                                "column_values": [
+                                    {
+                                        "id": f"text{c}",
+                                        "type": "text",
+                                        "text": f"value {c} of item {i}",
+                                        "value": json.dumps(f"value {c} of item {i}"),
+                                    }
+                                    for c in range(20)
+                                ],
+                            }
+                            for i in range(items)
+                        ],
+                    }
+                }
+            ]
+        }
+    }
+    return json.dumps(page).encode()
+
+
+def serve(payload: bytes) -> str:
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            view = memoryview(payload)
+            for start in range(0, len(payload), 64 * 1024):
+                self.wfile.write(view[start : start + 64 * 1024])
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}/v2"
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def run_mode(items: int, concurrency: int) -> dict:
+    from mcp_server_monday.client import create_monday_client
+    from mcp_server_monday.item import handle_monday_list_items_in_groups
+
+    endpoint = serve(synthetic_page(items))
+    client = create_monday_client("benchmark")
+    for resource_ in vars(client).values():
+        if hasattr(getattr(resource_, "client", None), "endpoint"):
+            resource_.client.endpoint = endpoint
+
+    baseline = peak_rss_mb()
+    lengths = []
+
+    def list_items():
+        result = asyncio.run(
+            handle_monday_list_items_in_groups("1", ["topics"], items, client)
+        )
+        lengths.append(len(result[0].text))
+
+    threads = [threading.Thread(target=list_items) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return {
+        "baseline_mb": round(baseline, 1),
+        "peak_mb": round(peak_rss_mb(), 1),
+        "growth_mb": round(peak_rss_mb() - baseline, 1),
+        "output_chars": lengths[0],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--mode", choices=["streaming", "whole"])
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args.items, args.concurrency)))
+        return
+
+    for mode in ("whole", "streaming"):
+        env = {**os.environ, "MONDAY_STREAM_RESPONSES": str(mode == "streaming")}
+        output = subprocess.run(
+            [sys.executable, __file__, "--mode", mode]
+            + ["--items", str(args.items), "--concurrency", str(args.concurrency)],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(
+            f"{mode:>9}: {args.concurrency} concurrent listings of {args.items} items, "
+            f"peak RSS growth {result['growth_mb']} MB "
+            f"({result['growth_mb'] / args.concurrency:.1f} MB per listing)"
+        )
+
+
+if __name__ == "__main__":
+    main()
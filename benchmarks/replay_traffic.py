@@ -0,0 +1,115 @@
+"""Replay recorded traffic against this build and compare handler latencies.
+
+Serves the upstream responses of a cassette (recorded with
+``MONDAY_RECORD_CASSETTE``) from a local replay server, then issues the
+recorded tool calls to this build's server with their original arrival times,
+both divided by ``--speed``. Reports throughput, and latency per tool next to
+the latency recorded in production:
+
+    uv run python benchmarks/replay_traffic.py traffic.jsonl --speed 2
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from collections import defaultdict
+
+# Set before the server is imported, which reads its settings.
+os.environ.setdefault("MONDAY_API_KEY", "replay")
+os.environ.pop("MONDAY_RECORD_CASSETTE", None)
+
+
+def percentile(values: list[float], share: float) -> float:
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[int(share * 100) - 1]
+
+
+async def replay_calls(
+    endpoint: str, calls: list[dict], speed: float, concurrency: int
+) -> dict:
+    from fastmcp import Client
+
+    from mcp_server_monday.fastmcp_server import get_monday_client, mcp
+
+    for resource in vars(get_monday_client()).values():
+        if hasattr(getattr(resource, "client", None), "endpoint"):
+            resource.client.endpoint = endpoint
+
+    latencies: dict[str, list[float]] = defaultdict(list)
+    errors: dict[str, int] = defaultdict(int)
+    slots = asyncio.Semaphore(concurrency)
+
+    async with Client(mcp) as client:
+        started_at = time.perf_counter()
+
+        async def call(event: dict) -> None:
+            if speed:
+                delay = event["t"] / speed - (time.perf_counter() - started_at)
+                await asyncio.sleep(max(0.0, delay))
+            async with slots:
+                call_started_at = time.perf_counter()
+                try:
+                    result = await client.call_tool(
+                        event["tool"], event["arguments"], raise_on_error=False
+                    )
+                    failed = result.is_error
+                except Exception:
+                    failed = True
+                latencies[event["tool"]].append(time.perf_counter() - call_started_at)
+                errors[event["tool"]] += failed
+
+        await asyncio.gather(*(call(event) for event in calls))
+        seconds = time.perf_counter() - started_at
+    return {"seconds": seconds, "latencies": latencies, "errors": errors}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("cassette")
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    from mcp_server_monday.cassette import ReplayServer, load_cassette
+
+    events = load_cassette(args.cassette)
+    replay = ReplayServer(events, args.speed)
+    endpoint = replay.start()
+
+    calls = [event for event in events if event.get("type") == "call"]
+    if not calls:
+        sys.exit("The cassette has no tool calls to replay")
+    first = calls[0]["t"]
+    calls = [{**event, "t": event["t"] - first} for event in calls]
+
+    result = asyncio.run(replay_calls(endpoint, calls, args.speed, args.concurrency))
+    recorded: dict[str, list[float]] = defaultdict(list)
+    for event in calls:
+        recorded[event["tool"]].append(event["seconds"])
+
+    print(
+        f"{len(calls)} calls in {result['seconds']:.2f}s "
+        f"({len(calls) / result['seconds']:.1f} calls/s) at speed {args.speed:g}; "
+        f"upstream matches: {replay.metrics()}"
+    )
+    print(
+        f"\n{'tool':<36} {'calls':>5} {'errors':>6}  "
+        f"{'recorded p50/p95 ms':>20}  {'replayed p50/p95 ms':>20}"
+    )
+    for tool in sorted(recorded):
+        before = recorded[tool]
+        after = result["latencies"][tool]
+        print(
+            f"{tool:<36} {len(after):>5} {result['errors'][tool]:>6}  "
+            f"{percentile(before, 0.5) * 1000:>9.1f}/{percentile(before, 0.95) * 1000:<10.1f}"
+            f"  {percentile(after, 0.5) * 1000:>9.1f}/{percentile(after, 0.95) * 1000:<10.1f}"
+        )
+    replay.stop()
+
+
+if __name__ == "__main__":
+    main()
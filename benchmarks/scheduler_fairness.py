@@ -0,0 +1,103 @@
+"""How the upstream scheduler shares slots between interactive and batch sessions.
+
+Runs a synthetic workload through ``UpstreamScheduler`` against a stand-in
+upstream call that sleeps for ``--service`` seconds: ``--interactive`` sessions
+each make cheap calls with ``--think`` seconds between them, while ``--batch``
+sessions crawl, making calls of ``--batch-cost`` back to back. Reports the
+wait for a slot per priority class next to a first-come-first-served
+semaphore with the same number of slots:
+
+    uv run python benchmarks/scheduler_fairness.py --interactive 8 --batch 16
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+
+from mcp_server_monday.scheduler import UpstreamScheduler
+
+
+class FifoScheduler:
+    """The baseline: one queue for all sessions."""
+
+    def __init__(self, concurrency: int):
+        self._slots = asyncio.Semaphore(concurrency)
+
+    @asynccontextmanager
+    async def slot(self, session_id: str, priority_class: str, cost: int):
+        async with self._slots:
+            yield
+
+
+async def workload(scheduler, args: argparse.Namespace) -> dict:
+    waits: dict[str, list[float]] = defaultdict(list)
+    stop_at = time.perf_counter() + args.seconds
+
+    async def session(session_id: str, priority_class: str, cost: int, think: float):
+        while time.perf_counter() < stop_at:
+            queued_at = time.perf_counter()
+            async with scheduler.slot(session_id, priority_class, cost):
+                waits[priority_class].append(time.perf_counter() - queued_at)
+                await asyncio.sleep(args.service)
+            await asyncio.sleep(think)
+
+    await asyncio.gather(
+        *(
+            session(f"interactive-{i}", "interactive", 1, args.think)
+            for i in range(args.interactive)
+        ),
+        *(
+            session(f"batch-{i}", "batch", args.batch_cost, 0)
+            for i in range(args.batch)
+        ),
+    )
+    return waits
+
+
+def percentile(values: list[float], share: float) -> float:
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[int(share * 100) - 1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--interactive", type=int, default=8)
+    parser.add_argument("--batch", type=int, default=16)
+    parser.add_argument("--batch-cost", type=int, default=4)
+    parser.add_argument("--service", type=float, default=0.02)
+    parser.add_argument("--think", type=float, default=0.1)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    print(
+        f"{args.interactive} interactive and {args.batch} batch sessions on "
+        f"{args.concurrency} slots, {args.service * 1000:g}ms per call, "
+        f"{args.seconds:g}s per run"
+    )
+    print(
+        f"{'scheduler':<10} {'class':<12} {'calls/s':>8} "
+        f"{'wait p50 ms':>12} {'wait p95 ms':>12}"
+    )
+    for name, scheduler in (
+        ("fifo", FifoScheduler(args.concurrency)),
+        ("drr", UpstreamScheduler(concurrency=args.concurrency)),
+    ):
+        waits = asyncio.run(workload(scheduler, args))
+        for priority_class in ("interactive", "batch"):
+            values = waits[priority_class]
+            if not values:
+                continue
+            print(
+                f"{name:<10} {priority_class:<12} {len(values) / args.seconds:>8.1f} "
+                f"{percentile(values, 0.5) * 1000:>12.1f} "
+                f"{percentile(values, 0.95) * 1000:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Memory and query latency of board snapshots against plain item dicts.
+
+Builds a synthetic board of status, number, date and text columns, then
+compares the memory held per item by the raw ``items_page`` items, by items
+decoded to ``{column ID: value}`` dicts and by a ``BoardSnapshot``, and times
+a filter, a sort and a top-10 query over each (the snapshot with and without
+NumPy):
+
+    uv run python benchmarks/snapshot_queries.py --items 100000
+"""
+
+import argparse
+import gc
+import heapq
+import json
+import random
+import time
+import tracemalloc
+
+STATUSES = ["Working on it", "Done", "Stuck", "Not started", "Waiting for review"]
+OWNERS = [f"Owner {i}" for i in range(40)]
+
+
+def make_items(count: int) -> list[dict]:
+    rng = random.Random(7)
+    items = []
+    for i in range(count):
+        amount = rng.randint(0, 100_000)
+        due = f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        status = rng.choice(STATUSES)
+        items.append(
+            {
+                "id": str(1_000_000_000 + i),
+                "name": f"Deal {i}",
+                "state": "active",
+                "group": {"id": "topics", "title": rng.choice(["Open", "Closed"])},
+                "column_values": [
+                    {
+                        "id": "status",
+                        "type": "status",
+                        "text": status,
+                        "value": json.dumps({"index": STATUSES.index(status)}),
+                    },
+                    {
+                        "id": "amount",
+                        "type": "numbers",
+                        "text": str(amount),
+                        "value": json.dumps(str(amount)),
+                    },
+                    {
+                        "id": "due",
+                        "type": "date",
+                        "text": due,
+                        "value": json.dumps({"date": due}),
+                    },
+                    {
+                        "id": "owner",
+                        "type": "text",
+                        "text": (owner := rng.choice(OWNERS)),
+                        "value": json.dumps(owner),
+                    },
+                ],
+            }
+        )
+    # Round-trip through JSON so that strings are not shared, as after parsing.
+    return json.loads(json.dumps(items))
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def decode(items: list[dict]) -> list[dict]:
+    from mcp_server_monday.columns import decode_column_value
+
+    return [
+        {
+            "id": item["id"],
+            "name": item["name"],
+            "group": item["group"]["title"],
+            **{cv["id"]: decode_column_value(cv) for cv in item["column_values"]},
+        }
+        for item in items
+    ]
+
+
+def best_of(fn, runs: int = 5) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        started_at = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started_at)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100_000)
+    args = parser.parse_args()
+
+    from mcp_server_monday import snapshot as snapshots
+
+    raw, raw_bytes = measure(lambda: make_items(args.items))
+    decoded, decoded_bytes = measure(lambda: decode(raw))
+
+    def build():
+        board = snapshots.BoardSnapshot("1")
+        for start in range(0, len(raw), 500):
+            board.add_items(raw[start : start + 500])
+        return board
+
+    board, board_bytes = measure(build)
+
+    print(f"{args.items} items, bytes per item")
+    for label, size in (
+        ("raw items", raw_bytes),
+        ("decoded dicts", decoded_bytes),
+        ("snapshot", board_bytes),
+    ):
+        print(f"  {label:>14}: {size / args.items:8.1f}")
+
+    filters = [
+        {"column": "status", "op": "eq", "value": "Done"},
+        {"column": "amount", "op": "gt", "value": 50_000},
+        {"column": "due", "op": "lt", "value": "2025-07-01"},
+    ]
+
+    def dict_filter():
+        return [
+            item
+            for item in decoded
+            if item["status"] == "Done"
+            and item["amount"] > 50_000
+            and item["due"] < "2025-07-01"
+        ]
+
+    def dict_sort():
+        return sorted(decoded, key=lambda item: item["amount"], reverse=True)[:50]
+
+    def dict_top():
+        return heapq.nlargest(10, dict_filter(), key=lambda item: item["amount"])
+
+    queries = {
+        "filter": (dict_filter, dict(filters=filters)),
+        "sort": (dict_sort, dict(sort_by="amount", descending=True)),
+        "filter + top 10": (
+            dict_top,
+            dict(filters=filters, sort_by="amount", descending=True, limit=10),
+        ),
+    }
+    has_numpy = snapshots._numpy() is not None
+    print("\nquery latency, ms")
+    for name, (dict_query, kwargs) in queries.items():
+        times = {"dicts": best_of(dict_query)}
+        if has_numpy:
+            times["snapshot (numpy)"] = best_of(
+                lambda kwargs=kwargs: board.query(**kwargs)
+            )
+        snapshots._numpy_module = False
+        times["snapshot (loops)"] = best_of(lambda kwargs=kwargs: board.query(**kwargs))
+        snapshots._numpy_module = None
+        print(
+            f"  {name:>15}: "
+            + ", ".join(f"{label} {t * 1000:8.2f}" for label, t in times.items())
+        )
+
+
+if __name__ == "__main__":
+    main()
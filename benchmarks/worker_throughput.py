@@ -0,0 +1,211 @@
+"""Tool calls per second served by the pre-fork mode as workers are added.
+
+Points the server at a local API that answers every query with a board list
+after ``--delay`` seconds, starts it with ``FASTMCP_WORKERS`` set to each of
+``--workers``, and has ``--clients`` MCP sessions call ``monday_list_boards``
+(uncached) back to back for ``--seconds``. The workers only add throughput
+when there are cores for them to run on:
+
+    uv run python benchmarks/worker_throughput.py --workers 1 2 4 --clients 32
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import socket
+import subprocess
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing.connection import Connection
+
+import httpx
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json, text/event-stream",
+}
+BOARDS = json.dumps(
+    {
+        "data": {
+            "boards": [
+                {"id": str(1000 + i), "name": f"Board {i}", "state": "active"}
+                for i in range(50)
+            ]
+        }
+    }
+).encode()
+
+
+def upstream_main(delay: float, conn: Connection) -> None:
+    """Serve the stand-in API in its own process, sending back its endpoint."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            time.sleep(delay)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(BOARDS)))
+            self.end_headers()
+            self.wfile.write(BOARDS)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    conn.send(f"http://127.0.0.1:{server.server_port}/v2")
+    server.serve_forever()
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workers: int, port: int, endpoint: str) -> subprocess.Popen:
+    env = dict(
+        os.environ,
+        MONDAY_API_KEY="benchmark",
+        MONDAY_API_BASE_URL=endpoint,
+        MONDAY_CACHE_TTL="0",
+        MONDAY_CACHE_STALE_TTL="0",
+        FASTMCP_HOST="127.0.0.1",
+        FASTMCP_PORT=str(port),
+        FASTMCP_WORKERS=str(workers),
+        PYTHONPATH=os.pathsep.join(filter(None, [SRC, os.environ.get("PYTHONPATH")])),
+    )
+    env.pop("MONDAY_RECORD_CASSETTE", None)
+    return subprocess.Popen(
+        [sys.executable, "-c", "from mcp_server_monday import main; main()"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+async def initialize(client: httpx.AsyncClient, url: str) -> httpx.Response:
+    return await client.post(
+        url,
+        headers=HEADERS,
+        json={
+            "jsonrpc": "2.0",
+            "id": 0,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "2025-06-18",
+                "capabilities": {},
+                "clientInfo": {"name": "benchmark", "version": "1"},
+            },
+        },
+    )
+
+
+async def session(client: httpx.AsyncClient, url: str, stop_at: float) -> int:
+    """Call the tool until ``stop_at``; return the number of calls completed."""
+    response = await initialize(client, url)
+    response.raise_for_status()
+    headers = {**HEADERS, "mcp-session-id": response.headers["mcp-session-id"]}
+    await client.post(
+        url,
+        headers=headers,
+        json={"jsonrpc": "2.0", "method": "notifications/initialized"},
+    )
+    calls = 0
+    while time.perf_counter() < stop_at:
+        response = await client.post(
+            url,
+            headers=headers,
+            json={
+                "jsonrpc": "2.0",
+                "id": calls + 1,
+                "method": "tools/call",
+                "params": {
+                    "name": "monday_list_boards",
+                    "arguments": {"limit": 50, "page": 1},
+                },
+            },
+        )
+        response.raise_for_status()
+        calls += 1
+    return calls
+
+
+async def measure(url: str, workers: int, clients: int, seconds: float) -> float:
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(timeout=60, limits=limits) as client:
+        # The router answers before its workers do; wait until all of them can.
+        deadline = time.perf_counter() + 60
+        ready = 0
+        while ready < workers:
+            try:
+                response = await initialize(client, url)
+                ready = ready + 1 if response.is_success else 0
+            except httpx.TransportError:
+                ready = 0
+            if not ready:
+                if time.perf_counter() > deadline:
+                    raise RuntimeError(f"{url} did not start")
+                await asyncio.sleep(0.2)
+        # Warm up every worker before measuring.
+        await asyncio.gather(
+            *(session(client, url, time.perf_counter() + 1) for _ in range(clients))
+        )
+        started_at = time.perf_counter()
+        calls = await asyncio.gather(
+            *(session(client, url, started_at + seconds) for _ in range(clients))
+        )
+        return sum(calls) / (time.perf_counter() - started_at)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--delay", type=float, default=0.02)
+    args = parser.parse_args()
+
+    # The stand-in runs in a process of its own so that it does not compete
+    # with the clients for the GIL; on few CPUs it still competes for cores.
+    conn, child_conn = multiprocessing.Pipe()
+    upstream = multiprocessing.Process(
+        target=upstream_main, args=(args.delay, child_conn), daemon=True
+    )
+    upstream.start()
+    endpoint = conn.recv()
+    print(
+        f"{args.clients} sessions, upstream delay {args.delay * 1000:g}ms, "
+        f"{args.seconds:g}s per run, {os.cpu_count()} CPUs"
+    )
+    print(f"{'workers':>8} {'calls/s':>9} {'speedup':>8}")
+    baseline = None
+    for workers in args.workers:
+        port = free_port()
+        server = start_server(workers, port, endpoint)
+        try:
+            rate = asyncio.run(
+                measure(
+                    f"http://127.0.0.1:{port}/api/mcp/",
+                    workers,
+                    args.clients,
+                    args.seconds,
+                )
+            )
+        finally:
+            server.terminate()
+            server.wait()
+        baseline = baseline or rate
+        print(f"{workers:>8} {rate:>9.1f} {rate / baseline:>7.2f}x")
+    upstream.terminate()
+
+
+if __name__ == "__main__":
+    main()
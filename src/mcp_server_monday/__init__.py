@@ -1,11 +1,35 @@
 import asyncio
-
-from . import fastmcp_server
+import importlib
+import sys
 
 
 def main():
     """Main entry point for the package."""
+    if sys.argv[1:2] == ["export"]:
+        from .export import cli
+
+        cli(sys.argv[2:])
+        return
+    if sys.argv[1:2] == ["import"]:
+        from .importer import cli
+
+        cli(sys.argv[2:])
+        return
+    if sys.argv[1:2] == ["replay"]:
+        from .cassette import cli
+
+        cli(sys.argv[2:])
+        return
+
+    fastmcp_server = importlib.import_module(".fastmcp_server", __name__)
     asyncio.run(fastmcp_server.run_server())
 
 
-__all__ = ["main", "fastmcp_server"]
\ No newline at end of file
+def __getattr__(name):
+    # Importing the server pulls in fastmcp, so only do it when it is used.
+    if name == "fastmcp_server":
+        return importlib.import_module(".fastmcp_server", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["main", "fastmcp_server"]
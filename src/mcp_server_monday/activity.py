@@ -0,0 +1,199 @@
+"""Incremental board changes built from a board's ``activity_logs``.
+
+A watermark marks the point up to which changes have been seen. It is either
+an ISO 8601 timestamp supplied by the caller or the opaque token returned by
+the previous call, which also remembers the log entries sharing its timestamp
+so that none are reported twice or skipped.
+
+Logs are compacted per item: an item that changed several times since the
+watermark is reported once, with its latest name, group and column values.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Optional
+
+from mcp import types
+
+from mcp_server_monday.cache import board_key, invalidate
+from mcp_server_monday.coalesce import coalescer_for
+
+if TYPE_CHECKING:
+    from monday import MondayClient
+
+ACTIVITY_LOGS_PAGE_SIZE = 500
+# activity_logs timestamps are 17-digit integers in units of 100 nanoseconds.
+TICKS_PER_SECOND = 10_000_000
+
+CREATE_EVENTS = {"create_pulse", "create_subitem"}
+DELETE_EVENTS = {"delete_pulse", "batch_delete_pulses", "delete_subitem"}
+ARCHIVE_EVENTS = {"archive_pulse", "batch_archive_pulses"}
+MOVE_EVENTS = {"move_pulse_into_group", "move_pulse_into_board"}
+STRUCTURE_EVENTS = {"create_column", "delete_column", "update_column_settings"}
+STRUCTURE_EVENTS |= {"create_group", "delete_group", "update_group_name"}
+
+
+def encode_watermark(ticks: int, seen: list[str]) -> str:
+    payload = json.dumps({"t": ticks, "seen": seen}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_watermark(watermark: str) -> tuple[int, set[str]]:
+    """Return ``(ticks, log IDs already seen at that tick)`` for a watermark."""
+    try:
+        moment = datetime.fromisoformat(watermark.replace("Z", "+00:00"))
+    except ValueError:
+        pass
+    else:
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        return int(moment.timestamp() * TICKS_PER_SECOND), set()
+    try:
+        padded = watermark + "=" * (-len(watermark) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        return int(payload["t"]), set(payload["seen"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid watermark {watermark!r}") from e
+
+
+def _ticks_to_iso(ticks: int) -> str:
+    moment = datetime.fromtimestamp(ticks // TICKS_PER_SECOND, tz=timezone.utc)
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def fetch_activity_logs(
+    monday_client: MondayClient, board_id: str, since_ticks: int
+) -> list[dict[str, Any]]:
+    """All activity log entries of a board from the second of ``since_ticks`` on."""
+    logs: list[dict[str, Any]] = []
+    page = 1
+    while True:
+        query = f"""
+        query {{
+            boards (ids: {board_id}) {{
+                activity_logs (
+                    from: "{_ticks_to_iso(since_ticks)}",
+                    limit: {ACTIVITY_LOGS_PAGE_SIZE},
+                    page: {page}
+                ) {{
+                    id
+                    event
+                    entity
+                    data
+                    created_at
+                    user_id
+                }}
+            }}
+        }}
+        """
+        response = monday_client.custom._query(query)
+        boards = (response.get("data") or {}).get("boards") or [{}]
+        entries = boards[0].get("activity_logs") or []
+        logs.extend(entries)
+        if len(entries) < ACTIVITY_LOGS_PAGE_SIZE:
+            return logs
+        page += 1
+
+
+def _item_id(data: dict[str, Any]) -> Optional[str]:
+    pulse = data.get("pulse") if isinstance(data.get("pulse"), dict) else {}
+    item_id = data.get("pulse_id") or data.get("item_id") or pulse.get("id")
+    return str(item_id) if item_id else None
+
+
+def compact_changes(logs: list[dict[str, Any]]) -> dict[str, Any]:
+    """Fold activity log entries (in any order) into one net change per item."""
+    items: dict[str, dict[str, Any]] = {}
+    structure_changed = False
+    for log in sorted(logs, key=lambda log: int(log["created_at"])):
+        event = log.get("event", "")
+        if event in STRUCTURE_EVENTS:
+            structure_changed = True
+        try:
+            data = json.loads(log.get("data") or "{}")
+        except json.JSONDecodeError:
+            continue
+        item_ids = [_item_id(data)]
+        if event.startswith("batch_"):
+            item_ids = [str(i) for i in data.get("pulse_ids") or data.get("ids") or []]
+        for item_id in filter(None, item_ids):
+            item = items.setdefault(item_id, {"item_id": item_id})
+            item["changed_at"] = log["created_at"]
+            name = data.get("pulse_name") or (data.get("pulse") or {}).get("name")
+            if name:
+                item["name"] = name
+            if event in CREATE_EVENTS:
+                item["created"] = True
+            elif event in DELETE_EVENTS:
+                item["deleted"] = True
+            elif event in ARCHIVE_EVENTS:
+                item["archived"] = True
+            elif event in MOVE_EVENTS:
+                destination = data.get("dest_group") or {}
+                item["group_id"] = destination.get("id") or data.get("dest_group_id")
+                if data.get("dest_board"):
+                    item["board_id"] = str(data["dest_board"].get("id"))
+            elif event == "update_name":
+                item["name"] = (data.get("value") or {}).get("name", name)
+            elif data.get("column_id"):
+                item.setdefault("columns", {})[data["column_id"]] = data.get("value")
+            else:
+                item.setdefault("other_events", [])
+                if event not in item["other_events"]:
+                    item["other_events"].append(event)
+    # Items created and deleted within the window never existed for the caller.
+    changes = [
+        item
+        for item in items.values()
+        if not (item.get("created") and item.get("deleted"))
+    ]
+    return {"items": changes, "structure_changed": structure_changed}
+
+
+def get_board_changes(
+    monday_client: MondayClient, board_id: str, since: Optional[str] = None
+) -> dict[str, Any]:
+    """Net item changes of a board since ``since``, with the watermark to use next."""
+    if since is None:
+        now = int(datetime.now(timezone.utc).timestamp() * TICKS_PER_SECOND)
+        return {"items": [], "events": 0, "watermark": encode_watermark(now, [])}
+
+    since_ticks, seen = decode_watermark(since)
+    coalescer_for(monday_client).flush(board_id=board_id)
+    logs = [
+        log
+        for log in fetch_activity_logs(monday_client, board_id, since_ticks)
+        if int(log["created_at"]) > since_ticks
+        or (int(log["created_at"]) == since_ticks and log["id"] not in seen)
+    ]
+    result = compact_changes(logs)
+    if result.pop("structure_changed"):
+        invalidate(board_key(board_id))
+
+    if logs:
+        latest = max(int(log["created_at"]) for log in logs)
+        if latest > since_ticks:
+            seen = set()
+        seen |= {log["id"] for log in logs if int(log["created_at"]) == latest}
+        since_ticks = latest
+    return {
+        **result,
+        "events": len(logs),
+        "watermark": encode_watermark(since_ticks, sorted(seen)),
+    }
+
+
+async def handle_monday_get_board_changes(
+    boardId: str, monday_client: MondayClient, since: Optional[str] = None
+) -> list[types.TextContent]:
+    """Get the item changes of a Monday.com board since a watermark."""
+    changes = get_board_changes(monday_client, boardId, since)
+    return [
+        types.TextContent(
+            type="text",
+            text=f"Changes of Monday.com board {boardId}. {json.dumps(changes)}",
+        )
+    ]
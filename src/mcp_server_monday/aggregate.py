@@ -0,0 +1,333 @@
+"""Server-side summaries of a board's items.
+
+Items are fetched page by page with only the columns a summary needs, folded
+into per-group accumulators and dropped, so memory use depends on the number
+of groups in the summary rather than on the size of the board. Pages are sized
+by the board's page sizer (see ``pagesize.py``).
+
+A summary groups items by their group (``group``) and/or column values, and
+optionally by a date column truncated to a day, week, month or year. For each
+group it reports the number of items and any requested metrics, written
+``<op>:<column ID>`` with ``op`` one of ``sum``, ``avg``, ``min``, ``max`` and
+``count`` (items where the column is not empty).
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Optional
+
+from mcp import types
+
+from mcp_server_monday.coalesce import coalescer_for
+from mcp_server_monday.columns import decode_column_value
+from mcp_server_monday.fanout import graphql_rules
+from mcp_server_monday.pagesize import (
+    MIN_PAGE_SIZE,
+    budget_remaining,
+    is_page_failure,
+    page_sizer_for,
+)
+from mcp_server_monday.paging import items_page_query, parse_items_page
+
+if TYPE_CHECKING:
+    from monday import MondayClient
+
+METRIC_OPS = ("sum", "avg", "min", "max", "count")
+DATE_INTERVALS = ("day", "week", "month", "year")
+# Groups beyond this many are folded into one "(other)" row.
+MAX_GROUPS = 10_000
+OTHER = "(other)"
+EMPTY = "(empty)"
+
+
+def _parse_metric(metric: str) -> tuple[str, str]:
+    op, _, column_id = metric.partition(":")
+    if op not in METRIC_OPS or not column_id:
+        raise ValueError(
+            f"Invalid metric {metric!r}; use <op>:<column ID> with op one of "
+            f"{', '.join(METRIC_OPS)}"
+        )
+    return op, column_id
+
+
+def _parse_histogram(histogram: str) -> tuple[str, str]:
+    column_id, _, interval = histogram.rpartition(":")
+    if not column_id or interval not in DATE_INTERVALS:
+        raise ValueError(
+            f"Invalid date histogram {histogram!r}; use <column ID>:<interval> with "
+            f"interval one of {', '.join(DATE_INTERVALS)}"
+        )
+    return column_id, interval
+
+
+def _group_label(value: Any) -> str:
+    if value in (None, [], ""):
+        return EMPTY
+    if isinstance(value, list):
+        return ", ".join(str(v) for v in value)
+    if isinstance(value, dict):
+        return str(value.get("from"))
+    return str(value)
+
+
+def _date_bucket(value: Any, interval: str) -> str:
+    if isinstance(value, dict):
+        value = value.get("from")
+    if not value:
+        return EMPTY
+    try:
+        day = datetime.fromisoformat(str(value)[:10]).date()
+    except ValueError:
+        return EMPTY
+    if interval == "day":
+        return day.isoformat()
+    if interval == "week":
+        year, week, _ = day.isocalendar()
+        return f"{year}-W{week:02d}"
+    if interval == "month":
+        return day.strftime("%Y-%m")
+    return str(day.year)
+
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_empty(value: Any) -> bool:
+    # By identity and type: 0 and 0.0 are values, even though they equal False.
+    if value is None or value is False:
+        return True
+    return isinstance(value, (str, list)) and not value
+
+
+def _comparable(value: Any) -> Any:
+    """Numbers compare as numbers, dates and everything else as text."""
+    if isinstance(value, dict):
+        value = value.get("from")
+    number = _number(value)
+    if number is not None:
+        return number
+    return None if _is_empty(value) else _group_label(value)
+
+
+class _Accumulator:
+    __slots__ = ("count", "sums", "counts", "mins", "maxs")
+
+    def __init__(self, metric_count: int):
+        self.count = 0
+        self.sums = [0.0] * metric_count
+        self.counts = [0] * metric_count
+        self.mins: list[Any] = [None] * metric_count
+        self.maxs: list[Any] = [None] * metric_count
+
+    def add(self, metrics: list[tuple[str, str]], values: dict[str, Any]) -> None:
+        self.count += 1
+        for i, (op, column_id) in enumerate(metrics):
+            value = values.get(column_id)
+            if op in ("sum", "avg"):
+                value = _number(value)
+            elif op in ("min", "max"):
+                value = _comparable(value)
+            elif _is_empty(value):
+                value = None
+            if value is None:
+                continue
+            self.counts[i] += 1
+            if op in ("sum", "avg"):
+                self.sums[i] += value
+            elif op in ("min", "max"):
+                try:
+                    if self.mins[i] is None or value < self.mins[i]:
+                        self.mins[i] = value
+                    if self.maxs[i] is None or value > self.maxs[i]:
+                        self.maxs[i] = value
+                except TypeError:
+                    # A column mixing numbers and text: compare as text.
+                    self.mins[i] = min(str(self.mins[i]), str(value))
+                    self.maxs[i] = max(str(self.maxs[i]), str(value))
+
+    def result(self, metrics: list[tuple[str, str]]) -> dict[str, Any]:
+        row: dict[str, Any] = {"count": self.count}
+        for i, (op, column_id) in enumerate(metrics):
+            name = f"{op}:{column_id}"
+            if op == "sum":
+                row[name] = _round(self.sums[i])
+            elif op == "avg":
+                row[name] = (
+                    _round(self.sums[i] / self.counts[i]) if self.counts[i] else None
+                )
+            elif op == "min":
+                row[name] = self.mins[i]
+            elif op == "max":
+                row[name] = self.maxs[i]
+            else:
+                row[name] = self.counts[i]
+        return row
+
+
+def _round(number: float) -> Any:
+    number = round(number, 6)
+    return int(number) if float(number).is_integer() else number
+
+
+def _fields(column_ids: list[str]) -> str:
+    fields = """
+        id
+        group {
+            id
+            title
+        }
+    """
+    if column_ids:
+        fields += f"""
+        column_values (ids: [{", ".join(json.dumps(c) for c in column_ids)}]) {{
+            id
+            type
+            text
+            value
+        }}
+        """
+    return fields
+
+
+def aggregate_board(
+    monday_client: MondayClient,
+    board_id: str,
+    group_by: Optional[list[str]] = None,
+    metrics: Optional[list[str]] = None,
+    date_histogram: Optional[str] = None,
+    rules: Optional[list[dict[str, Any]]] = None,
+    max_rows: int = 100,
+) -> dict[str, Any]:
+    """Summarize the items of a board (see the module docstring)."""
+    group_by = list(group_by or [])
+    parsed_metrics = [_parse_metric(metric) for metric in metrics or []]
+    histogram = _parse_histogram(date_histogram) if date_histogram else None
+    keys = group_by + ([date_histogram] if histogram else [])
+
+    column_ids = [key for key in group_by if key != "group"]
+    column_ids += [column_id for _, column_id in parsed_metrics]
+    if histogram:
+        column_ids.append(histogram[0])
+    column_ids = list(dict.fromkeys(column_ids))
+    fields = _fields(column_ids)
+    query_params = graphql_rules(rules) if rules else None
+
+    coalescer_for(monday_client).flush(board_id=board_id)
+    sizer = page_sizer_for(monday_client)
+    groups: dict[tuple[str, ...], _Accumulator] = {}
+    scanned = pages = 0
+    grouped_into_other = False
+    cursor = None
+    started_at = time.monotonic()
+    while True:
+        limit = sizer.suggest(board_id, budget_remaining(monday_client))
+        query = items_page_query(board_id, limit, cursor, fields, query_params)
+        page_started_at = time.monotonic()
+        try:
+            response = monday_client.custom._query(query) or {}
+        except Exception as e:
+            if limit <= MIN_PAGE_SIZE or not is_page_failure(e):
+                raise
+            sizer.failed(board_id, limit)
+            continue
+        sizer.observe(board_id, limit, time.monotonic() - page_started_at)
+        items, cursor = parse_items_page(response)
+        pages += 1
+
+        for item in items:
+            values = {
+                cv["id"]: decode_column_value(cv)
+                for cv in item.get("column_values") or []
+            }
+            key = []
+            for column_id in group_by:
+                if column_id == "group":
+                    key.append((item.get("group") or {}).get("title") or EMPTY)
+                else:
+                    key.append(_group_label(values.get(column_id)))
+            if histogram:
+                key.append(_date_bucket(values.get(histogram[0]), histogram[1]))
+            key = tuple(key)
+            accumulator = groups.get(key)
+            if accumulator is None:
+                if len(groups) >= MAX_GROUPS:
+                    key = (OTHER,) * len(keys)
+                    grouped_into_other = True
+                    accumulator = groups.get(key)
+                if accumulator is None:
+                    accumulator = groups[key] = _Accumulator(len(parsed_metrics))
+            accumulator.add(parsed_metrics, values)
+        scanned += len(items)
+        if not cursor:
+            break
+
+    rows = [
+        {**dict(zip(keys, key)), **accumulator.result(parsed_metrics)}
+        for key, accumulator in groups.items()
+    ]
+    rows.sort(key=lambda row: (-row["count"], [str(row[k]) for k in keys]))
+    total = _Accumulator(len(parsed_metrics))
+    for accumulator in groups.values():
+        _merge(total, accumulator, parsed_metrics)
+    return {
+        "board_id": str(board_id),
+        "items": scanned,
+        "group_by": keys,
+        "rows": rows[:max_rows],
+        "total": total.result(parsed_metrics),
+        "groups": len(rows),
+        "rows_omitted": max(0, len(rows) - max_rows),
+        "groups_folded_into_other": grouped_into_other,
+        "pages": pages,
+        "seconds": round(time.monotonic() - started_at, 3),
+    }
+
+
+def _merge(
+    total: _Accumulator, part: _Accumulator, metrics: list[tuple[str, str]]
+) -> None:
+    total.count += part.count
+    for i in range(len(metrics)):
+        total.sums[i] += part.sums[i]
+        total.counts[i] += part.counts[i]
+        for bound, pick in ((total.mins, min), (total.maxs, max)):
+            value = (part.mins if pick is min else part.maxs)[i]
+            if value is None:
+                continue
+            try:
+                bound[i] = value if bound[i] is None else pick(bound[i], value)
+            except TypeError:
+                bound[i] = pick(str(bound[i]), str(value))
+
+
+async def handle_monday_aggregate_board(
+    boardId: str,
+    monday_client: MondayClient,
+    groupBy: Optional[list[str]] = None,
+    aggregates: Optional[list[str]] = None,
+    dateHistogram: Optional[str] = None,
+    rules: Optional[list[dict[str, Any]]] = None,
+    maxRows: int = 100,
+) -> list[types.TextContent]:
+    """Summarize the items of a Monday.com board by group and column values."""
+    summary = aggregate_board(
+        monday_client, boardId, groupBy, aggregates, dateHistogram, rules, maxRows
+    )
+    return [
+        types.TextContent(
+            type="text",
+            text=f"Summary of {summary['items']} items of Monday.com board "
+            f"{boardId}: {json.dumps(summary)}",
+        )
+    ]
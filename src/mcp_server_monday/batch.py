@@ -0,0 +1,79 @@
+"""Aliased multi-field GraphQL documents.
+
+Packing many mutations into one document as ``r0: create_item(...)``,
+``r1: create_item(...)`` etc. replaces one HTTP round trip per operation with
+one per batch. Errors are attributed to the alias they belong to, so a failing
+operation does not hide the results of the others.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from monday import MondayClient
+
+# Each mutation costs roughly 10-30k complexity points, so this stays well
+# under the per-query limit while still amortizing the round trip.
+DEFAULT_BATCH_SIZE = 25
+# Documents sent at once by one tool call; the scheduler already bounds the
+# calls per API key, this bounds the worker threads a single call may start.
+MAX_CONCURRENCY = 8
+
+
+def clamp_concurrency(concurrency: int) -> int:
+    """``concurrency`` brought into ``1..MAX_CONCURRENCY``."""
+    return max(1, min(int(concurrency), MAX_CONCURRENCY))
+
+
+def graphql_string(value: Any) -> str:
+    """Encode ``value`` as a GraphQL string literal (JSON-encoding non-strings first)."""
+    if not isinstance(value, str):
+        value = json.dumps(value)
+    return json.dumps(value)
+
+
+def execute_aliased(
+    monday_client: MondayClient,
+    fields: list[str],
+    operation: str = "mutation",
+) -> list[tuple[Optional[Any], Optional[str]]]:
+    """Run ``fields`` as aliases of one document.
+
+    Returns a ``(data, error)`` pair per field, in order.
+    """
+    document = "\n".join(f"r{i}: {field}" for i, field in enumerate(fields))
+    query = f"{operation} {{\n{document}\n}}"
+
+    from monday.exceptions import MondayQueryError
+
+    graphql_client = monday_client.custom.client
+    if hasattr(graphql_client, "execute_partial"):
+        response = graphql_client.execute_partial(query)
+    else:
+        try:
+            response = monday_client.custom._query(query)
+        except MondayQueryError as e:
+            return [(None, str(e))] * len(fields)
+
+    data = response.get("data") or {}
+    errors: dict[str, str] = {}
+    general_error = None
+    for error in response.get("errors") or []:
+        path = error.get("path") or []
+        if path:
+            errors.setdefault(str(path[0]), error.get("message", "Unknown error"))
+        else:
+            general_error = error.get("message", "Unknown error")
+    if response.get("error_message"):
+        general_error = response["error_message"]
+
+    results = []
+    for i in range(len(fields)):
+        alias = f"r{i}"
+        if data.get(alias) is not None:
+            results.append((data[alias], None))
+        else:
+            results.append((None, errors.get(alias) or general_error or "No result"))
+    return results
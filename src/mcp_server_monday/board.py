@@ -1,15 +1,51 @@
+from __future__ import annotations
+
 import json
+from typing import TYPE_CHECKING
 
 from mcp import types
-from monday import MondayClient
-from monday.resources.types import BoardKind
+
+from mcp_server_monday.cache import board_key, cache_for, invalidate
+
+if TYPE_CHECKING:
+    from monday import MondayClient
+
+
+BOARDS_PAGE_SIZE = 100
+
+
+def get_board_groups(monday_client: MondayClient, boardId: str) -> dict:
+    """Fetch the groups of a board, through the board cache."""
+    return cache_for(monday_client).get_or_load(
+        board_key(boardId, "groups"),
+        lambda: monday_client.groups.get_groups_by_board(board_ids=boardId),
+    )
+
+
+def list_all_boards(monday_client: MondayClient) -> list[dict]:
+    """Fetch every board (ID and name) page by page, through the board cache."""
+    boards: list[dict] = []
+    page = 1
+    while True:
+        response = cache_for(monday_client).get_or_load(
+            f"boards:{BOARDS_PAGE_SIZE}:{page}",
+            # Bound now: the loader may run later, to refresh the entry.
+            lambda page=page: monday_client.boards.fetch_boards(
+                limit=BOARDS_PAGE_SIZE, page=page
+            ),
+        )
+        batch = response["data"]["boards"]
+        boards.extend({"id": board["id"], "name": board["name"]} for board in batch)
+        if len(batch) < BOARDS_PAGE_SIZE:
+            return boards
+        page += 1
 
 
 async def handle_monday_get_board_groups(
     boardId: str, monday_client: MondayClient
 ) -> list[types.TextContent]:
     """Get the Groups of a Monday.com Board."""
-    response = monday_client.groups.get_groups_by_board(board_ids=boardId)
+    response = get_board_groups(monday_client, boardId)
     return [
         types.TextContent(
             type="text",
@@ -18,10 +54,13 @@ async def handle_monday_get_board_groups(
     ]
 
 
-async def handle_monday_get_board_columns(
-    boardId: str, monday_client: MondayClient
-) -> list[types.TextContent]:
-    """Get the Columns of a Monday.com Board."""
+def get_board_columns(
+    monday_client: MondayClient, boardId: str, fresh: bool = False
+) -> dict:
+    """Fetch the columns of a board (with their labels), through the board cache.
+
+    With ``fresh`` set, the cached columns are only used if reloading fails.
+    """
     query = f"""
         query {{
             boards(ids: {boardId}) {{
@@ -34,18 +73,40 @@ async def handle_monday_get_board_columns(
             }}
         }}
     """
-    response = monday_client.custom._query(query)
-    for board in response.get("data", {}).get("boards", []):
-        for column in board["columns"]:
-            settings_str = column.pop("settings_str", None)
-            if settings_str:
-                if isinstance(settings_str, str):
-                    try:
-                        settings_obj = json.loads(settings_str)
-                        if settings_obj.get("labels"):
-                            column["available_labels"] = settings_obj["labels"]
-                    except json.JSONDecodeError:
-                        pass
+
+    def load_columns() -> dict:
+        response = monday_client.custom._query(query)
+        for board in response.get("data", {}).get("boards", []):
+            for column in board["columns"]:
+                settings_str = column.pop("settings_str", None)
+                if settings_str:
+                    if isinstance(settings_str, str):
+                        try:
+                            settings_obj = json.loads(settings_str)
+                            if settings_obj.get("labels"):
+                                column["available_labels"] = settings_obj["labels"]
+                            if settings_obj.get("boardIds"):
+                                column["subitem_board_ids"] = [
+                                    str(board_id)
+                                    for board_id in settings_obj["boardIds"]
+                                ]
+                        except json.JSONDecodeError:
+                            pass
+        return response
+
+    return cache_for(monday_client).get_or_load(
+        board_key(boardId, "columns"),
+        load_columns,
+        max_age=0 if fresh else None,
+        background=not fresh,
+    )
+
+
+async def handle_monday_get_board_columns(
+    boardId: str, monday_client: MondayClient
+) -> list[types.TextContent]:
+    """Get the Columns of a Monday.com Board."""
+    response = get_board_columns(monday_client, boardId)
 
     return [
         types.TextContent(
@@ -59,7 +120,10 @@ async def handle_monday_list_boards(
     monday_client: MondayClient, limit: int, page: int
 ) -> list[types.TextContent]:
     """List all available Monday.com boards"""
-    response = monday_client.boards.fetch_boards(limit=limit, page=page)
+    response = cache_for(monday_client).get_or_load(
+        f"boards:{limit}:{page}",
+        lambda: monday_client.boards.fetch_boards(limit=limit, page=page),
+    )
     boards = response["data"]["boards"]
 
     board_list = "\n".join(
@@ -84,10 +148,13 @@ async def handle_monday_create_board(
         board_name (str): The name of the board.
         board_kind (str): The kind of board to create. Must be one of "public" or "private". Defaults to "public".
     """
+    from monday.resources.types import BoardKind
+
     actual_board_kind = BoardKind(board_kind)
     board = monday_client.boards.create_board(
         board_name=board_name, board_kind=actual_board_kind
     )
+    cache_for(monday_client).invalidate("boards:")
     return [
         types.TextContent(
             type="text",
@@ -108,6 +175,7 @@ async def handle_monday_create_new_board_group(
         group_name (str): The name of the group.
     """
     group = monday_client.groups.create_group(board_id=board_id, group_name=group_name)
+    invalidate(board_key(board_id))
     return [
         types.TextContent(
             type="text",
@@ -0,0 +1,363 @@
+"""Process-local TTL caches for Monday.com reads.
+
+Caches are keyed by strings such as ``board:<id>:columns`` so that a whole board
+can be invalidated by prefix. Invalidations can be fanned out to other server
+processes through publishers registered with ``add_invalidation_publisher``, and
+observed (wherever they came from) through ``add_invalidation_listener``.
+
+Reads through ``get_or_load`` follow a stale-while-revalidate policy: an entry
+older than ``ttl`` (the soft TTL) but younger than ``stale_ttl`` (the hard TTL)
+is returned at once while it is reloaded in the background, through the
+upstream scheduler of the API key when the cache has one. If loading fails
+because Monday.com is down, slow or throttling, the last known value is served
+instead, and noted in ``collect_stale_reads`` so that the tool can say so.
+Nothing older than the hard TTL is ever served. A load that was in flight
+when its key was invalidated does not store its (possibly outdated) result.
+"""
+
+import contextvars
+import logging
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Optional
+
+from mcp_server_monday.constants import (
+    MONDAY_CACHE_MAX_ENTRIES,
+    MONDAY_CACHE_STALE_TTL,
+    MONDAY_CACHE_TTL,
+)
+from mcp_server_monday.scheduler import UpstreamScheduler, scheduler_for
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+@dataclass
+class StaleRead:
+    key: str
+    age: float
+    # Why the value could not be refreshed.
+    error: str
+
+
+# The stale values served during the tool call in progress, if collected.
+_stale_reads: contextvars.ContextVar[Optional[list[StaleRead]]] = (
+    contextvars.ContextVar("stale_reads", default=None)
+)
+
+
+@contextmanager
+def collect_stale_reads() -> Iterator[list[StaleRead]]:
+    """Collect the stale values served by ``get_or_load`` within the block."""
+    reads: list[StaleRead] = []
+    token = _stale_reads.set(reads)
+    try:
+        yield reads
+    finally:
+        _stale_reads.reset(token)
+
+
+def staleness_note(reads: list[StaleRead]) -> str:
+    """A line telling the reader that (part of) an answer is out of date."""
+    oldest = max(read.age for read in reads)
+    return (
+        f"[Stale data: Monday.com could not be reached ({reads[-1].error}); "
+        f"showing values cached up to {oldest:.0f} seconds ago.]"
+    )
+
+
+def is_upstream_failure(error: Exception) -> bool:
+    """Whether ``error`` means Monday.com is unavailable rather than the query wrong."""
+    import requests
+
+    if isinstance(
+        error,
+        (
+            requests.ConnectionError,
+            requests.Timeout,
+            requests.exceptions.ChunkedEncodingError,
+        ),
+    ):
+        return True
+    if isinstance(error, requests.HTTPError):
+        response = error.response
+        return (
+            response is None
+            or response.status_code in (408, 429)
+            or (response.status_code >= 500)
+        )
+    if "complexity budget exhausted" in str(error).lower():
+        return True
+    return any(
+        (detail.get("extensions") or {}).get("code")
+        in ("ComplexityException", "RATE_LIMIT_EXCEEDED", "INTERNAL_SERVER_ERROR")
+        for detail in getattr(error, "original_errors", None) or []
+    )
+
+
+class _Entry:
+    __slots__ = ("stored_at", "value", "error")
+
+    def __init__(self, value: Any):
+        self.stored_at = time.monotonic()
+        self.value = value
+        # Set while the last refresh failed.
+        self.error: Optional[str] = None
+
+
+class TTLCache:
+    """A small thread-safe cache whose entries expire after ``ttl`` seconds.
+
+    With ``stale_ttl`` above ``ttl``, ``get_or_load`` keeps serving expired
+    entries up to ``stale_ttl`` seconds (see the module docstring). Background
+    refreshes wait for a slot from ``scheduler`` if given.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_entries: int = 1024,
+        stale_ttl: Optional[float] = None,
+        scheduler: Optional[UpstreamScheduler] = None,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stale_ttl = max(ttl, stale_ttl or 0)
+        self.scheduler = scheduler
+        self._entries: dict[str, _Entry] = {}
+        self._refreshing: set[str] = set()
+        # Keys being loaded: [loads in flight, invalidations since the first].
+        self._loads: dict[str, list[int]] = {}
+        self._lock = threading.Lock()
+        self.served_stale = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+        self.served_on_error = 0
+
+    def _entry(self, key: str, max_age: float) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        age = time.monotonic() - entry.stored_at
+        if age >= self.stale_ttl:
+            del self._entries[key]
+            return None
+        return entry if age < max_age else None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entry(key, self.ttl)
+            return default if entry is None else entry.value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._store(key, value)
+
+    def _store(self, key: str, value: Any) -> None:
+        if self.ttl <= 0:
+            return
+        if key not in self._entries and len(self._entries) >= self.max_entries:
+            # Dicts keep insertion order, so this drops the oldest entry.
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = _Entry(value)
+
+    def _start_load(self, key: str) -> int:
+        """Note a load of ``key``; returns the generation to pass to ``_end_load``."""
+        load = self._loads.setdefault(key, [0, 0])
+        load[0] += 1
+        return load[1]
+
+    def _end_load(self, key: str, generation: int, value: Any = _MISSING) -> bool:
+        """Store ``value`` unless ``key`` was invalidated during the load."""
+        load = self._loads[key]
+        current = load[1] == generation
+        load[0] -= 1
+        if not load[0]:
+            del self._loads[key]
+        if current and value is not _MISSING:
+            self._store(key, value)
+        return current
+
+    def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        max_age: Optional[float] = None,
+        background: bool = True,
+    ) -> Any:
+        """The cached value of ``key``, loading it when missing or expired.
+
+        ``max_age`` overrides the soft TTL for this read. Without
+        ``background``, expired entries are reloaded before returning and only
+        served if that fails.
+        """
+        max_age = self.ttl if max_age is None else max_age
+        with self._lock:
+            entry = self._entry(key, self.stale_ttl)
+            if entry is not None:
+                age = time.monotonic() - entry.stored_at
+                if age < max_age:
+                    return entry.value
+                if background and entry.error is None:
+                    self.served_stale += 1
+                    if key not in self._refreshing:
+                        self._refreshing.add(key)
+                        self._start_refresh(key, loader, self._start_load(key))
+                    return entry.value
+            generation = self._start_load(key)
+        try:
+            value = loader()
+        except Exception as e:
+            with self._lock:
+                self._end_load(key, generation)
+                if entry is None or not is_upstream_failure(e):
+                    raise
+                entry.error = str(e)
+            return self._serve_on_error(key, entry)
+        with self._lock:
+            self._end_load(key, generation, value)
+        return value
+
+    def _start_refresh(
+        self, key: str, loader: Callable[[], Any], generation: int
+    ) -> None:
+        if self.scheduler is not None:
+            self.scheduler.submit(
+                "cache-refresh", lambda: self._refresh(key, loader, generation)
+            )
+        else:
+            threading.Thread(
+                target=self._refresh, args=(key, loader, generation), daemon=True
+            ).start()
+
+    def _serve_on_error(self, key: str, entry: _Entry) -> Any:
+        with self._lock:
+            self.served_on_error += 1
+        reads = _stale_reads.get()
+        if reads is not None:
+            reads.append(
+                StaleRead(key, time.monotonic() - entry.stored_at, entry.error)
+            )
+        return entry.value
+
+    def _refresh(self, key: str, loader: Callable[[], Any], generation: int) -> None:
+        try:
+            value = loader()
+        except Exception as e:
+            logger.warning(f"Refreshing {key} failed: {e}")
+            with self._lock:
+                self.refresh_failures += 1
+                # An entry stored since the refresh started is left alone.
+                entry = self._entries.get(key)
+                if not self._end_load(key, generation) or entry is None:
+                    return
+                if is_upstream_failure(e):
+                    # Later reads retry in the foreground and mark what they serve.
+                    entry.error = str(e)
+                else:
+                    del self._entries[key]
+        else:
+            with self._lock:
+                if self._end_load(key, generation, value):
+                    self.refreshes += 1
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def invalidate(self, prefix: str) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+            for key, load in self._loads.items():
+                if key.startswith(prefix):
+                    load[1] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            for load in self._loads.values():
+                load[1] += 1
+
+    def metrics(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "served_stale": self.served_stale,
+                "refreshes": self.refreshes,
+                "refresh_failures": self.refresh_failures,
+                "served_on_error": self.served_on_error,
+            }
+
+
+_caches: "weakref.WeakKeyDictionary[Any, TTLCache]" = weakref.WeakKeyDictionary()
+_caches_lock = threading.Lock()
+_publishers: list[Callable[[str], None]] = []
+_listeners: list[Callable[[str], None]] = []
+
+
+def cache_for(owner: Any) -> TTLCache:
+    """Return the cache belonging to ``owner`` (usually a MondayClient)."""
+    with _caches_lock:
+        cache = _caches.get(owner)
+        if cache is None:
+            cache = TTLCache(
+                MONDAY_CACHE_TTL,
+                MONDAY_CACHE_MAX_ENTRIES,
+                MONDAY_CACHE_STALE_TTL,
+                scheduler_for(owner),
+            )
+            _caches[owner] = cache
+        return cache
+
+
+def board_key(board_id: str, kind: Optional[str] = None) -> str:
+    key = f"board:{board_id}:"
+    return key + kind if kind else key
+
+
+def add_invalidation_publisher(publisher: Callable[[str], None]) -> None:
+    """Register a callable that forwards local invalidations to other processes."""
+    _publishers.append(publisher)
+
+
+def add_invalidation_listener(listener: Callable[[str], None]) -> None:
+    """Register a callable told about every invalidation, local or from siblings."""
+    _listeners.append(listener)
+
+
+def invalidate(prefix: str, broadcast: bool = True) -> None:
+    """Drop matching entries from every cache in this process.
+
+    With ``broadcast`` set, the invalidation is also handed to the registered
+    publishers so that sibling worker processes drop their copies too.
+    """
+    with _caches_lock:
+        caches = list(_caches.values())
+    for cache in caches:
+        cache.invalidate(prefix)
+    for listener in _listeners:
+        listener(prefix)
+    if broadcast:
+        for publisher in _publishers:
+            publisher(prefix)
+
+
+def read_cache_metrics() -> dict[str, int]:
+    """Read cache counters summed over all API keys."""
+    with _caches_lock:
+        caches = list(_caches.values())
+    totals = {
+        "entries": 0,
+        "served_stale": 0,
+        "refreshes": 0,
+        "refresh_failures": 0,
+        "served_on_error": 0,
+    }
+    for cache in caches:
+        for name, value in cache.metrics().items():
+            totals[name] += value
+    return totals
@@ -0,0 +1,220 @@
+"""Stopping the upstream work of tool calls that were cancelled or timed out.
+
+Handlers make their blocking Monday.com calls in a worker thread, which asyncio
+cannot interrupt. ``run_upstream`` therefore gives each call an
+``UpstreamCall`` that the worker thread sees through a context variable.
+``PooledGraphQLClient`` checks it before every request, bounds the request's
+timeout by the call's deadline, and marks the connection the request is sent
+on as belonging to the call. Cancelling the call shuts those connections down,
+so a request waiting for Monday.com fails at once instead of running on.
+
+A tool call is cancelled when the MCP client sends ``notifications/cancelled``
+(the MCP SDK then cancels the task running it), and when it runs past its
+deadline: ``MONDAY_TOOL_DEADLINE`` seconds after it got its first scheduler
+slot, or the tool's own entry in ``MONDAY_TOOL_DEADLINES``. Either way the
+call's scheduler slot is given back as soon as the task is cancelled.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import socket
+import threading
+import time
+import weakref
+from collections import Counter
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, TypeVar
+
+from fastmcp.exceptions import ToolError
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+from mcp_server_monday.constants import MONDAY_TOOL_DEADLINE, MONDAY_TOOL_DEADLINES
+
+if TYPE_CHECKING:
+    from urllib3.connection import HTTPConnection
+
+T = TypeVar("T")
+
+# The upstream call the current thread works for, if any.
+current_call: contextvars.ContextVar[Optional[UpstreamCall]] = contextvars.ContextVar(
+    "current_upstream_call", default=None
+)
+# The deadline of the tool call in progress, if it has one.
+_deadline: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar(
+    "tool_deadline", default=None
+)
+
+_counts: Counter[str] = Counter()
+_deadlines_exceeded: Counter[str] = Counter()
+_counts_lock = threading.Lock()
+
+
+class UpstreamCancelled(Exception):
+    """The tool call a request was made for was cancelled or ran out of time."""
+
+
+def deadline_for(tool: str) -> float:
+    """Seconds ``tool`` may run for; ``0`` means no limit."""
+    return MONDAY_TOOL_DEADLINES.get(tool, MONDAY_TOOL_DEADLINE)
+
+
+class Deadline:
+    """How long a tool call may run once it got its first scheduler slot.
+
+    Time spent queued for the slot does not count. When the deadline passes,
+    the task running the call is cancelled, like a cancellation by the client.
+    """
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires_at: Optional[float] = None
+        self.expired = False
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def start(self) -> None:
+        if self.expires_at is not None:
+            return
+        self.expires_at = time.monotonic() + self.seconds
+        self._timer = asyncio.get_running_loop().call_later(
+            self.seconds, self._expire, asyncio.current_task()
+        )
+
+    def _expire(self, task: asyncio.Task) -> None:
+        self.expired = True
+        task.cancel()
+
+    def stop(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+
+
+class UpstreamCall:
+    """The upstream work done on behalf of one ``run_upstream`` call."""
+
+    def __init__(self, deadline: Optional[float] = None):
+        self.deadline = deadline
+        self.cancelled = threading.Event()
+        self._connections: weakref.WeakSet[HTTPConnection] = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    def check(self) -> None:
+        """Raise ``UpstreamCancelled`` if no more requests should be made."""
+        if self.cancelled.is_set():
+            raise UpstreamCancelled("The tool call was cancelled")
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise UpstreamCancelled("The tool call ran out of time")
+
+    def timeout(self, timeout: Optional[float]) -> Optional[float]:
+        """``timeout``, shortened to end at the deadline."""
+        if self.deadline is None:
+            return timeout
+        remaining = max(0.001, self.deadline - time.monotonic())
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def attach(self, connection: HTTPConnection) -> None:
+        connection.upstream_call = self
+        with self._lock:
+            self._connections.add(connection)
+        if self.cancelled.is_set():
+            _abort(connection)
+
+    def cancel(self) -> None:
+        """Stop making requests and abort the ones in flight."""
+        self.cancelled.set()
+        with self._lock:
+            connections = list(self._connections)
+        aborted = 0
+        for connection in connections:
+            # A pooled connection may since have been taken by another call.
+            if getattr(connection, "upstream_call", None) is self:
+                aborted += _abort(connection)
+        with _counts_lock:
+            _counts["cancelled"] += 1
+            _counts["aborted_requests"] += aborted
+
+
+def _abort(connection: HTTPConnection) -> bool:
+    sock = connection.sock
+    if sock is None:
+        return False
+    try:
+        # The plain socket's shutdown: wakes a thread blocked reading from it
+        # without touching the TLS state that thread is using.
+        socket.socket.shutdown(sock, socket.SHUT_RDWR)
+    except OSError:
+        return False
+    return True
+
+
+@contextmanager
+def upstream_call() -> Iterator[UpstreamCall]:
+    """Run the block as an upstream call, cancelled if the block is.
+
+    Threads started with ``asyncio.to_thread`` inside the block see the call.
+    The deadline of the tool call, if any, starts counting here.
+    """
+    deadline = _deadline.get()
+    if deadline is not None:
+        deadline.start()
+    call = UpstreamCall(deadline.expires_at if deadline else None)
+    token = current_call.set(call)
+    try:
+        yield call
+    except asyncio.CancelledError:
+        call.cancel()
+        raise
+    finally:
+        current_call.reset(token)
+
+
+def bind(fn: Callable[..., T]) -> Callable[..., T]:
+    """``fn``, run under the caller's upstream call; for worker pools."""
+    call = current_call.get()
+
+    def run(*args: Any, **kwargs: Any) -> T:
+        token = current_call.set(call)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            current_call.reset(token)
+
+    return run
+
+
+class DeadlineMiddleware(Middleware):
+    """Fails tool calls that run past their deadline, stopping their requests."""
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        tool = context.message.name
+        seconds = deadline_for(tool)
+        if not seconds:
+            return await call_next(context)
+        deadline = Deadline(seconds)
+        token = _deadline.set(deadline)
+        try:
+            return await call_next(context)
+        except asyncio.CancelledError:
+            if not deadline.expired:
+                raise
+            task = asyncio.current_task()
+            if hasattr(task, "uncancel"):
+                task.uncancel()
+            with _counts_lock:
+                _deadlines_exceeded[tool] += 1
+            raise ToolError(
+                f"{tool} did not finish within {seconds:g} seconds"
+            ) from None
+        finally:
+            deadline.stop()
+            _deadline.reset(token)
+
+
+def cancellation_metrics() -> dict[str, Any]:
+    with _counts_lock:
+        return {
+            "cancelled": _counts["cancelled"],
+            "aborted_requests": _counts["aborted_requests"],
+            "deadlines_exceeded": dict(_deadlines_exceeded),
+        }
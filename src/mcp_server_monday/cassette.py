@@ -0,0 +1,418 @@
+"""Recording upstream traffic to a cassette file, and replaying it locally.
+
+With ``MONDAY_RECORD_CASSETTE`` set to a path, the server appends one JSON line
+per event to that file (gzipped if it ends in ``.gz``):
+
+- ``upstream``: a GraphQL query sent to Monday.com, with the HTTP status, the
+  seconds until the whole response had arrived, and the response itself
+- ``call``: a tool call, with its arguments and duration
+
+Every event carries ``t``, the seconds since recording started. API keys and
+authorization headers are never written, and values of secret-looking fields
+(tokens, passwords, signed asset URLs) are redacted. Unless
+``MONDAY_RECORD_CONTENT`` is enabled, so is the content written to Monday.com:
+the string literals of mutations, and the names, texts, column values and
+filter values passed to tools. Responses are kept as they are, so a cassette
+still holds whatever the recorded reads returned.
+
+Worker processes (see ``workers.py``) each record to a file of their own, with
+their process ID inserted into the name (``traffic.<pid>.jsonl.gz``), and
+``load_cassette`` merges those files back into one timeline.
+
+``mcp-server-monday replay <cassette>`` serves the recorded responses as a local
+Monday.com API, with the recorded latencies divided by ``--speed``. Point a
+server at it with ``MONDAY_API_BASE_URL``. Queries are matched exactly
+(ignoring whitespace), then by shape (ignoring literal values), so a build whose
+queries differ only in IDs or limits is still answered.
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import gzip
+import io
+import json
+import logging
+import multiprocessing
+import os
+import re
+import threading
+import time
+from collections import defaultdict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, Optional
+
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+from mcp_server_monday.constants import MONDAY_RECORD_CASSETTE, MONDAY_RECORD_CONTENT
+
+if TYPE_CHECKING:
+    import requests
+
+logger = logging.getLogger(__name__)
+
+REDACTED = "[redacted]"
+_SECRET_FIELD_RE = re.compile(r"token|password|secret|api_?key|public_url", re.I)
+_STRING_RE = re.compile(r'"(?:[^"\\]|\\.)*"')
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+# Tool arguments holding content rather than IDs and options; inside them only
+# the column IDs and operators of filter rules are kept.
+_CONTENT_ARGUMENTS = {
+    "boardName",
+    "groupName",
+    "itemTitle",
+    "updateText",
+    "columnValues",
+    "rules",
+    "filters",
+}
+_KEPT_RULE_FIELDS = {"column_id", "operator"}
+
+
+def sanitize(value: Any) -> Any:
+    """``value`` with the values of secret-looking fields redacted."""
+    if isinstance(value, dict):
+        return {
+            key: REDACTED
+            if _SECRET_FIELD_RE.search(key) and item is not None
+            else sanitize(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [sanitize(item) for item in value]
+    return value
+
+
+def _redact_content(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            key: item if key in _KEPT_RULE_FIELDS else _redact_content(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_redact_content(item) for item in value]
+    return value if value is None or isinstance(value, bool) else REDACTED
+
+
+def redact_arguments(arguments: dict[str, Any]) -> dict[str, Any]:
+    """Tool ``arguments`` with the content written or searched for redacted."""
+    return {
+        key: _redact_content(value) if key in _CONTENT_ARGUMENTS else value
+        for key, value in arguments.items()
+    }
+
+
+def redact_mutation(query: str) -> str:
+    """``query`` with its string literals redacted if it is a mutation.
+
+    Replays still find the recorded response, which is matched by shape.
+    """
+    if not query.lstrip().startswith("mutation"):
+        return query
+    return _STRING_RE.sub(json.dumps(REDACTED), query)
+
+
+def process_path(path: str, pid: int) -> str:
+    """``path`` with ``pid`` inserted before its extensions."""
+    directory, name = os.path.split(path)
+    base, _, extensions = name.partition(".")
+    name = f"{base}.{pid}.{extensions}" if extensions else f"{name}.{pid}"
+    return os.path.join(directory, name)
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.split())
+
+
+def query_shape(query: str) -> str:
+    """The query with its string and number literals replaced by ``?``."""
+    return _NUMBER_RE.sub("?", _STRING_RE.sub("?", normalize_query(query)))
+
+
+def _open(path: str, mode: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class CassetteRecorder:
+    """Appends upstream queries and tool calls to a cassette file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.started_at = time.monotonic()
+        self.events = 0
+        self._file = _open(path, "a")
+        self._lock = threading.Lock()
+        self._write({"type": "start", "recorded_at": time.time()})
+
+    def _write(self, event: dict[str, Any]) -> None:
+        event["t"] = round(time.monotonic() - self.started_at, 4)
+        line = json.dumps(event)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            self.events += 1
+
+    def capture(
+        self,
+        query: str,
+        response: requests.Response,
+        started_at: float,
+        stream: bool = False,
+    ) -> None:
+        """Record the response to ``query``, reading its body if it is streamed.
+
+        A streamed response is read whole, and then handed back to the caller
+        as an in-memory stream.
+        """
+        body = response.content
+        seconds = time.monotonic() - started_at
+        if stream:
+            response.raw = io.BytesIO(body)
+        try:
+            content = sanitize(json.loads(body))
+        except ValueError:
+            content = body.decode("utf-8", "replace")
+        self._write(
+            {
+                "type": "upstream",
+                "query": query if MONDAY_RECORD_CONTENT else redact_mutation(query),
+                "status": response.status_code,
+                "seconds": round(seconds, 4),
+                "response": content,
+            }
+        )
+
+    def record_call(
+        self, tool: str, arguments: Any, seconds: float, error: Optional[str]
+    ) -> None:
+        arguments = arguments or {}
+        self._write(
+            {
+                "type": "call",
+                "tool": tool,
+                "arguments": sanitize(
+                    arguments if MONDAY_RECORD_CONTENT else redact_arguments(arguments)
+                ),
+                "seconds": round(seconds, 4),
+                "error": error,
+            }
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+_recorder: Optional[CassetteRecorder] = None
+_recorder_lock = threading.Lock()
+
+
+def get_recorder() -> Optional[CassetteRecorder]:
+    """The recorder of this process, if ``MONDAY_RECORD_CASSETTE`` is set.
+
+    Worker processes record to a file of their own, as appends of several
+    processes to one (gzipped) file would interleave.
+    """
+    global _recorder
+    if _recorder is None and MONDAY_RECORD_CASSETTE:
+        with _recorder_lock:
+            if _recorder is None:
+                path = MONDAY_RECORD_CASSETTE
+                if multiprocessing.parent_process() is not None:
+                    path = process_path(path, os.getpid())
+                _recorder = CassetteRecorder(path)
+                logger.info(f"Recording upstream traffic to {path}")
+    return _recorder
+
+
+class RecordingMiddleware(Middleware):
+    """Records every tool call, with its duration, to the cassette."""
+
+    def __init__(self, recorder: CassetteRecorder):
+        self.recorder = recorder
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        started_at = time.monotonic()
+        error = None
+        try:
+            return await call_next(context)
+        except Exception as e:
+            error = str(e)
+            raise
+        finally:
+            self.recorder.record_call(
+                context.message.name,
+                context.message.arguments,
+                time.monotonic() - started_at,
+                error,
+            )
+
+
+def _load_file(path: str) -> list[dict[str, Any]]:
+    events = []
+    with _open(path, "r") as f:
+        for line in f:
+            if line.strip():
+                events.append(json.loads(line))
+    return events
+
+
+def load_cassette(path: str) -> list[dict[str, Any]]:
+    """The events of a cassette, in recording order.
+
+    The files recorded by worker processes next to ``path`` are merged in,
+    their times shifted by when each started recording.
+    """
+    directory, name = os.path.split(path)
+    base, _, extensions = name.partition(".")
+    worker_file = re.compile(
+        rf"{re.escape(base)}\.\d+"
+        + (rf"\.{re.escape(extensions)}" if extensions else "")
+    )
+    paths = [path] if os.path.exists(path) else []
+    paths += sorted(
+        candidate
+        for candidate in glob.glob(
+            os.path.join(glob.escape(directory), f"{glob.escape(base)}.*")
+        )
+        if worker_file.fullmatch(os.path.basename(candidate))
+    )
+    if not paths:
+        raise FileNotFoundError(path)
+    files = [_load_file(candidate) for candidate in paths]
+    if len(files) == 1:
+        return files[0]
+
+    def started_at(events: list[dict[str, Any]]) -> float:
+        return next((e["recorded_at"] for e in events if e.get("type") == "start"), 0.0)
+
+    first = min(started_at(events) for events in files)
+    merged = []
+    for events in files:
+        offset = started_at(events) - first
+        merged.extend({**event, "t": event.get("t", 0) + offset} for event in events)
+    merged.sort(key=lambda event: event["t"])
+    return merged
+
+
+class ReplayServer:
+    """Answers GraphQL queries with the responses recorded in a cassette.
+
+    Repeated queries get their recorded responses in turn, starting over once
+    all were used. Each answer waits for the recorded latency divided by
+    ``speed`` (``0`` answers at once).
+    """
+
+    def __init__(self, events: list[dict[str, Any]], speed: float = 1.0):
+        self.speed = speed
+        self._exact: dict[str, deque] = defaultdict(deque)
+        self._shapes: dict[str, deque] = defaultdict(deque)
+        for event in events:
+            if event.get("type") == "upstream":
+                self._exact[normalize_query(event["query"])].append(event)
+                self._shapes[query_shape(event["query"])].append(event)
+        self._lock = threading.Lock()
+        self.exact_hits = self.shape_hits = self.misses = 0
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def answer(self, query: str) -> tuple[Optional[dict[str, Any]], str]:
+        """The recorded event answering ``query`` and how it matched."""
+        with self._lock:
+            for recorded, match in (
+                (self._exact.get(normalize_query(query)), "exact"),
+                (self._shapes.get(query_shape(query)), "shape"),
+            ):
+                if recorded:
+                    event = recorded[0]
+                    recorded.rotate(-1)
+                    if match == "exact":
+                        self.exact_hits += 1
+                    else:
+                        self.shape_hits += 1
+                    return event, match
+            self.misses += 1
+            return None, "miss"
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Serve in a background thread and return the endpoint URL."""
+        replay = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                try:
+                    query = json.loads(self.rfile.read(length))["query"]
+                except (ValueError, KeyError):
+                    return self.reply(400, {"error_message": "Expected a query"})
+                event, _ = replay.answer(query)
+                if event is None:
+                    return self.reply(
+                        200,
+                        {"errors": [{"message": "No recorded response for query"}]},
+                    )
+                if replay.speed:
+                    time.sleep(event["seconds"] / replay.speed)
+                self.reply(event["status"], event["response"])
+
+            def reply(self, status: int, body: Any) -> None:
+                payload = (body if isinstance(body, str) else json.dumps(body)).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return f"http://{host}:{self._server.server_port}/v2"
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def metrics(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "exact_hits": self.exact_hits,
+                "shape_hits": self.shape_hits,
+                "misses": self.misses,
+            }
+
+
+def cli(argv: Optional[list[str]] = None) -> None:
+    """``mcp-server-monday replay`` subcommand."""
+    parser = argparse.ArgumentParser(
+        prog="mcp-server-monday replay",
+        description="Serve the Monday.com responses recorded in a cassette as a "
+        "local API, for MONDAY_API_BASE_URL.",
+    )
+    parser.add_argument("cassette")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="Divide recorded latencies by this (0: no delay)",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    events = load_cassette(args.cassette)
+    replay = ReplayServer(events, args.speed)
+    endpoint = replay.start(args.host, args.port)
+    upstream = sum(1 for event in events if event.get("type") == "upstream")
+    logger.info(f"Replaying {upstream} recorded responses at {endpoint}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        replay.stop()
+        print(json.dumps(replay.metrics()))
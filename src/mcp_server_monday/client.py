@@ -0,0 +1,329 @@
+"""Construction of Monday.com API clients with pooled HTTP connections.
+
+The ``monday`` SDK opens a new HTTP connection (and TLS handshake) for every
+query. Clients built here route all resources through one ``requests.Session``
+so that connections to api.monday.com are kept alive and reused. Requests made
+for a tool call that gets cancelled are aborted (see ``cancellation.py``).
+
+Each API key gets its own client, and with it its own connection pool, cache
+and complexity budget. ``ClientRegistry`` keeps a bounded number of them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Iterator, Optional
+
+import requests
+from monday import MondayClient
+from monday.exceptions import MondayQueryError
+from monday.graphqlclient.client import GraphQLClient
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from mcp_server_monday.cancellation import current_call
+from mcp_server_monday.constants import MONDAY_API_BASE_URL, MONDAY_RECORD_CASSETTE
+
+_RESET_IN_RE = re.compile(r"reset in (\d+) seconds?")
+# Where the SDK sends queries, and file uploads to below.
+_DEFAULT_ENDPOINT = "https://api.monday.com/v2"
+
+
+class ComplexityBudget:
+    """Tracks the complexity budget of one API key as reported by Monday.com.
+
+    Once the API rejects a query for exhausting the budget, further queries
+    fail locally until the reported reset time instead of spending a round trip.
+    """
+
+    def __init__(self):
+        self.remaining: Optional[int] = None
+        self.exhausted_until = 0.0
+        self._lock = threading.Lock()
+
+    def check(self) -> None:
+        wait = self.exhausted_until - time.monotonic()
+        if wait > 0:
+            raise MondayQueryError(
+                f"Complexity budget exhausted, resets in {wait:.0f} seconds"
+            )
+
+    def observe(self, response_data: dict[str, Any]) -> None:
+        complexity = (response_data.get("data") or {}).get("complexity")
+        if isinstance(complexity, dict) and complexity.get("after") is not None:
+            with self._lock:
+                self.remaining = complexity["after"]
+
+    def exhaust(self, message: str) -> None:
+        match = _RESET_IN_RE.search(message)
+        reset_in = int(match.group(1)) if match else 60
+        with self._lock:
+            self.remaining = 0
+            self.exhausted_until = time.monotonic() + reset_in
+
+
+class _AbortableHTTPConnection(HTTPConnection):
+    def request(self, *args: Any, **kwargs: Any) -> None:
+        call = current_call.get()
+        self.upstream_call = call
+        if call is not None:
+            call.attach(self)
+        super().request(*args, **kwargs)
+
+
+class _AbortableHTTPSConnection(_AbortableHTTPConnection, HTTPSConnection):
+    pass
+
+
+class _AbortableHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _AbortableHTTPConnection
+
+
+class _AbortableHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _AbortableHTTPSConnection
+
+
+class AbortableAdapter(HTTPAdapter):
+    """Transport adapter whose connections can be aborted by ``UpstreamCall``."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _AbortableHTTPConnectionPool,
+            "https": _AbortableHTTPSConnectionPool,
+        }
+
+
+def _read_stream(events: Iterator[Any]) -> Iterator[Any]:
+    """``events`` of a response body, with urllib3 errors as ``requests`` ones."""
+    from urllib3.exceptions import HTTPError, ProtocolError, ReadTimeoutError
+
+    while True:
+        try:
+            event = next(events)
+        except StopIteration:
+            return
+        except ReadTimeoutError as e:
+            _check_call()
+            raise requests.exceptions.ReadTimeout(e) from e
+        except ProtocolError as e:
+            _check_call()
+            raise requests.exceptions.ChunkedEncodingError(e) from e
+        except HTTPError as e:
+            _check_call()
+            raise requests.exceptions.ConnectionError(e) from e
+        yield event
+
+
+def _check_call() -> None:
+    call = current_call.get()
+    if call is not None:
+        # Aborted because the tool call was cancelled.
+        call.check()
+
+
+class PooledGraphQLClient(GraphQLClient):
+    """GraphQLClient that sends queries through a shared ``requests.Session``."""
+
+    def __init__(
+        self,
+        base: GraphQLClient,
+        session: requests.Session,
+        budget: ComplexityBudget,
+    ):
+        super().__init__(base.endpoint, timeout=base.timeout)
+        self.token = base.token
+        self.headers = base.headers
+        self.session = session
+        self.budget = budget
+
+    def _send(self, query: str, variables: Optional[dict] = None) -> dict[str, Any]:
+        if variables is not None:
+            # File uploads are rare; let the SDK handle the multipart encoding.
+            return super()._send(query, variables)
+
+        response_data = self._post(query)
+        self._throw_on_error(response_data)
+        return response_data
+
+    def execute_partial(self, query: str) -> dict[str, Any]:
+        """Run ``query`` and return the response even if some fields failed.
+
+        Used for multi-field documents, where the ``errors`` of some aliases
+        must not discard the ``data`` of the others.
+        """
+        return self._post(query)
+
+    def iter_events(self, query: str) -> Iterator[tuple[str, str, Any]]:
+        """Run ``query`` and yield ``ijson`` parse events as the response arrives.
+
+        Lets callers handle large responses piece by piece instead of holding
+        the whole document. Raises ``MondayQueryError`` at the end of the stream
+        if the response carried errors. A connection failing halfway raises
+        the ``requests`` exception that reading the whole body would have.
+        """
+        import ijson
+
+        errors = complexity = None
+        with self._request(query, stream=True) as response:
+            response.raw.decode_content = True
+            for prefix, event, value in _read_stream(
+                ijson.parse(response.raw, use_float=True)
+            ):
+                if prefix == "errors" and event == "start_array":
+                    errors = ijson.ObjectBuilder()
+                if errors is not None and prefix.startswith("errors"):
+                    errors.event(event, value)
+                if prefix == "data.complexity" and event == "start_map":
+                    complexity = ijson.ObjectBuilder()
+                if complexity is not None and prefix.startswith("data.complexity"):
+                    complexity.event(event, value)
+                yield prefix, event, value
+        if complexity is not None:
+            self.budget.observe({"data": {"complexity": complexity.value}})
+        if errors is not None and errors.value:
+            response_data = {"errors": errors.value}
+            if _is_complexity_error(response_data):
+                self.budget.exhaust(json.dumps(response_data))
+            self._throw_on_error(response_data)
+
+    def _post(self, query: str) -> dict[str, Any]:
+        response = self._request(query)
+        response_data = response.json()
+        if _is_complexity_error(response_data):
+            self.budget.exhaust(json.dumps(response_data))
+        self.budget.observe(response_data)
+        return response_data
+
+    def _request(self, query: str, stream: bool = False) -> requests.Response:
+        headers = {"Content-Type": "application/json", **self.headers}
+        if self.token is not None:
+            headers["Authorization"] = self.token
+
+        call = current_call.get()
+        if call is not None:
+            call.check()
+        self.budget.check()
+        started_at = time.monotonic()
+        try:
+            response = self.session.post(
+                self.endpoint,
+                headers=headers,
+                json={"query": query},
+                timeout=call.timeout(self.timeout) if call else self.timeout,
+                stream=stream,
+            )
+        except requests.RequestException:
+            if call is not None:
+                # Aborted because the tool call was cancelled.
+                call.check()
+            raise
+        if MONDAY_RECORD_CASSETTE:
+            from mcp_server_monday.cassette import get_recorder
+
+            get_recorder().capture(query, response, started_at, stream)
+        if response.status_code == 429:
+            self.budget.exhaust(response.text)
+        if not response.ok:
+            response.close()
+        response.raise_for_status()
+        return response
+
+
+def _is_complexity_error(response_data: dict[str, Any]) -> bool:
+    if response_data.get("error_code") == "ComplexityException":
+        return True
+    return any(
+        (error.get("extensions") or {}).get("code") == "ComplexityException"
+        for error in response_data.get("errors") or []
+    )
+
+
+def create_monday_client(api_key: str) -> MondayClient:
+    """Create a MondayClient whose resources share one pooled HTTP session."""
+    client = MondayClient(api_key)
+    session = requests.Session()
+    session.mount("https://", AbortableAdapter())
+    session.mount("http://", AbortableAdapter())
+    budget = ComplexityBudget()
+    for resource in vars(client).values():
+        graphql_client = getattr(resource, "client", None)
+        if isinstance(graphql_client, GraphQLClient):
+            resource.client = PooledGraphQLClient(graphql_client, session, budget)
+            resource.client.endpoint = graphql_client.endpoint.replace(
+                _DEFAULT_ENDPOINT, MONDAY_API_BASE_URL, 1
+            )
+    client.http_session = session
+    # Closes the pool once nothing (an in-flight call, a background refresh)
+    # uses the client any more.
+    weakref.finalize(client, session.close)
+    client.complexity_budget = budget
+    # Identifies the API key in shared state without revealing it.
+    client.key_id = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+    return client
+
+
+class ClientRegistry:
+    """LRU-bounded registry of per-API-key clients.
+
+    Clients unused for ``idle_ttl`` seconds, or beyond the ``max_clients`` most
+    recently used, are dropped together with their cache; their connection pool
+    is closed when the last call still using them is done and they are garbage
+    collected. The client for ``default_api_key`` is never evicted.
+    """
+
+    def __init__(
+        self,
+        default_api_key: Optional[str],
+        max_clients: int = 64,
+        idle_ttl: float = 900,
+    ):
+        self.default_api_key = default_api_key
+        self.max_clients = max_clients
+        self.idle_ttl = idle_ttl
+        self._default_client: Optional[MondayClient] = None
+        self._clients: OrderedDict[str, tuple[float, MondayClient]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, api_key: Optional[str] = None) -> MondayClient:
+        if not api_key or api_key == self.default_api_key:
+            return self._get_default()
+        key = hashlib.sha256(api_key.encode()).hexdigest()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._clients.pop(key, None)
+            client = entry[1] if entry else create_monday_client(api_key)
+            self._clients[key] = (now, client)
+            self._evict(now)
+        return client
+
+    def _get_default(self) -> MondayClient:
+        if self._default_client is None:
+            with self._lock:
+                if self._default_client is None:
+                    if not self.default_api_key:
+                        raise ValueError(
+                            "No Monday.com API key: set MONDAY_API_KEY or send "
+                            "one with the request"
+                        )
+                    self._default_client = create_monday_client(self.default_api_key)
+        return self._default_client
+
+    def _evict(self, now: float) -> None:
+        while self._clients:
+            last_used, _ = next(iter(self._clients.values()))
+            if len(self._clients) <= self.max_clients and (
+                now - last_used < self.idle_ttl
+            ):
+                break
+            self._clients.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._clients)
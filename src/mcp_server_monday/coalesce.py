@@ -0,0 +1,198 @@
+"""Write-behind coalescing of column updates to the same item.
+
+With ``MONDAY_WRITE_COALESCE_WINDOW`` set, the first update to an item waits
+that many seconds before it is sent. Updates to the same item arriving in the
+meantime are merged into it (the last write to a column wins) and all callers
+are answered with the result of the one combined mutation. Callers wait on the
+event loop, holding neither a worker thread nor a scheduler slot; only the
+combined mutation takes one.
+
+A read of an item, its board or its group first sends any pending write to it
+(see ``flush``), so a caller never reads a value older than one it has written.
+"""
+
+import asyncio
+import threading
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterable, Optional, TypeVar
+
+from mcp_server_monday.constants import MONDAY_WRITE_COALESCE_WINDOW
+
+T = TypeVar("T")
+
+
+@dataclass
+class _PendingWrite:
+    board_id: str
+    item_id: str
+    send: Callable[[str, str, dict], Any]
+    finished: asyncio.Future
+    column_values: dict = field(default_factory=dict)
+    writes: int = 0
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Any = None
+    error: Optional[BaseException] = None
+
+
+class WriteCoalescer:
+    """Merges column updates per ``(board, item)`` within ``window`` seconds."""
+
+    def __init__(self, window: float = MONDAY_WRITE_COALESCE_WINDOW):
+        self.window = window
+        self._pending: dict[tuple[str, str], _PendingWrite] = {}
+        self._lock = threading.Lock()
+        self._tasks: set[asyncio.Task] = set()
+        self.writes = 0
+        self.commits = 0
+
+    async def submit(
+        self,
+        board_id: str,
+        item_id: str,
+        column_values: dict,
+        send: Callable[[str, str, dict], Any],
+        run: Callable[[Callable[[], T]], Awaitable[T]],
+    ) -> Any:
+        """Queue ``column_values`` for the item and return once they are written.
+
+        ``send(board_id, item_id, column_values)`` performs the actual blocking
+        mutation, once per merged batch. The batch is sent through ``run``
+        (which calls the function it is given, e.g. in a worker thread under a
+        scheduler slot) once the window has passed, or directly by a ``flush``.
+        """
+        key = (str(board_id), str(item_id))
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self.writes += 1
+            if self.window <= 0:
+                self.commits += 1
+                pending = None
+            else:
+                pending = self._pending.get(key)
+                if pending is None:
+                    pending = self._pending[key] = _PendingWrite(
+                        *key, send, loop.create_future()
+                    )
+                    # Not tied to the caller, which may be cancelled meanwhile.
+                    loop.call_later(self.window, self._start_commit, pending, run)
+                pending.column_values.update(column_values)
+                pending.writes += 1
+        if pending is None:
+            return await run(lambda: send(board_id, item_id, column_values))
+
+        await asyncio.shield(pending.finished)
+        if pending.error is not None:
+            raise pending.error
+        return pending.result
+
+    def _start_commit(self, pending: _PendingWrite, run: Callable) -> None:
+        task = asyncio.get_running_loop().create_task(self._commit_later(pending, run))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _commit_later(self, pending: _PendingWrite, run: Callable) -> None:
+        if not self._is_pending(pending):
+            return
+        try:
+            await run(lambda: self._commit(pending))
+        except BaseException as e:
+            # ``run`` failed before the batch could be sent.
+            if self._claim(pending):
+                pending.error = e
+                self._finish(pending)
+            if not isinstance(e, Exception):
+                raise
+
+    def _is_pending(self, pending: _PendingWrite) -> bool:
+        with self._lock:
+            return self._pending.get((pending.board_id, pending.item_id)) is pending
+
+    def _claim(self, pending: _PendingWrite) -> bool:
+        """Take ``pending`` off the queue; false if someone else already did."""
+        key = (pending.board_id, pending.item_id)
+        with self._lock:
+            if self._pending.get(key) is not pending:
+                return False
+            del self._pending[key]
+            self.commits += 1
+            return True
+
+    def _commit(self, pending: _PendingWrite) -> None:
+        if not self._claim(pending):
+            return
+        try:
+            pending.result = pending.send(
+                pending.board_id, pending.item_id, pending.column_values
+            )
+        except BaseException as e:
+            pending.error = e
+        finally:
+            self._finish(pending)
+
+    def _finish(self, pending: _PendingWrite) -> None:
+        pending.done.set()
+        loop = pending.finished.get_loop()
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(_resolve, pending.finished)
+
+    def flush(
+        self,
+        board_id: Optional[str] = None,
+        item_ids: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Send pending writes to the given items (or board, or all) and wait for them."""
+        item_ids = {str(i) for i in item_ids} if item_ids is not None else None
+        with self._lock:
+            matching = [
+                pending
+                for pending in self._pending.values()
+                if (board_id is None or pending.board_id == str(board_id))
+                and (item_ids is None or pending.item_id in item_ids)
+            ]
+        # Sent from this thread, under the caller's scheduler slot.
+        for pending in matching:
+            self._commit(pending)
+        for pending in matching:
+            pending.done.wait()
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            pending_writes = sum(pending.writes for pending in self._pending.values())
+            return {
+                "writes": self.writes,
+                "commits": self.commits,
+                "merged": self.writes - self.commits - pending_writes,
+                "pending_items": len(self._pending),
+            }
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+_coalescers: "weakref.WeakKeyDictionary[Any, WriteCoalescer]" = (
+    weakref.WeakKeyDictionary()
+)
+_coalescers_lock = threading.Lock()
+
+
+def coalescer_for(owner: Any) -> WriteCoalescer:
+    """Return the write coalescer belonging to ``owner`` (usually a MondayClient)."""
+    with _coalescers_lock:
+        coalescer = _coalescers.get(owner)
+        if coalescer is None:
+            coalescer = _coalescers[owner] = WriteCoalescer()
+        return coalescer
+
+
+def coalescing_metrics() -> dict[str, Any]:
+    """Write and merge counts summed over all API keys."""
+    with _coalescers_lock:
+        coalescers = list(_coalescers.values())
+    totals = {"writes": 0, "commits": 0, "merged": 0, "pending_items": 0}
+    for coalescer in coalescers:
+        for name, value in coalescer.metrics().items():
+            totals[name] += value
+    return totals
@@ -0,0 +1,297 @@
+"""Typed column values, checked against a board's cached column schema.
+
+Writes are validated and normalized locally before they are sent, so a
+misspelled status label or a malformed date fails immediately instead of
+after a round trip that still costs complexity points. Reads are decoded from
+the ``text``/``value`` pair Monday.com returns for every column into a single
+compact value per column.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any, Optional
+
+from mcp_server_monday.board import get_board_columns
+
+if TYPE_CHECKING:
+    from monday import MondayClient
+
+READ_ONLY_TYPES = {
+    "auto_number",
+    "button",
+    "creation_log",
+    "formula",
+    "item_id",
+    "last_updated",
+    "mirror",
+    "progress",
+    "subtasks",
+    "time_tracking",
+    "vote",
+}
+
+
+class ColumnValueError(ValueError):
+    """One or more column values do not fit the board's columns."""
+
+
+def board_schema(
+    monday_client: MondayClient,
+    board_id: str,
+    subitems: bool = False,
+    fresh: bool = False,
+) -> list[dict[str, Any]]:
+    """Columns of a board, or of its sub-items board if ``subitems`` is set.
+
+    With ``fresh`` set, the columns are reloaded rather than read from the cache.
+    """
+    response = get_board_columns(monday_client, board_id, fresh=fresh)
+    columns = response["data"]["boards"][0]["columns"]
+    if not subitems:
+        return columns
+    for column in columns:
+        if column.get("subitem_board_ids"):
+            return board_schema(
+                monday_client, column["subitem_board_ids"][0], fresh=fresh
+            )
+    return []
+
+
+def _covers(columns: list[dict[str, Any]], keys: Any) -> bool:
+    known = {column["id"] for column in columns}
+    known.update(column["title"].lower() for column in columns)
+    return all(key in known or str(key).lower() in known for key in keys)
+
+
+def schema_for(
+    monday_client: MondayClient,
+    board_id: str,
+    keys: Any,
+    subitems: Optional[bool] = None,
+) -> list[dict[str, Any]]:
+    """Columns to check the column IDs or titles ``keys`` against.
+
+    With ``subitems`` unset, the item may be a sub-item: the sub-items board's
+    columns are added when some key is not a column of the board. A key that
+    is still unknown may name a column added since the schema was cached, so
+    the schema is then reloaded once before the key is reported as unknown.
+    """
+    for fresh in (False, True):
+        if subitems is None:
+            schema = board_schema(monday_client, board_id, fresh=fresh)
+            if not _covers(schema, keys):
+                schema = schema + board_schema(
+                    monday_client, board_id, subitems=True, fresh=fresh
+                )
+        else:
+            schema = board_schema(monday_client, board_id, subitems, fresh=fresh)
+        if _covers(schema, keys):
+            break
+    return schema
+
+
+def _labels(column: dict[str, Any]) -> dict[str, str]:
+    """Label ID -> label name, for both status and dropdown settings."""
+    labels = column.get("available_labels") or {}
+    if isinstance(labels, list):
+        return {str(label["id"]): label["name"] for label in labels}
+    return {str(index): name for index, name in labels.items() if name}
+
+
+def _match_label(column: dict[str, Any], label: Any) -> tuple[str, str]:
+    labels = _labels(column)
+    if str(label) in labels:
+        return str(label), labels[str(label)]
+    for label_id, name in labels.items():
+        if name.lower() == str(label).strip().lower():
+            return label_id, name
+    raise ColumnValueError(
+        f"Invalid label {label!r} for column {column['title']!r}. "
+        f"Valid labels: {', '.join(sorted(labels.values()))}"
+    )
+
+
+def _parse_date(value: str) -> datetime:
+    try:
+        return datetime.fromisoformat(str(value).strip().replace("Z", "+00:00"))
+    except ValueError:
+        raise ColumnValueError(f"Invalid date {value!r}, expected YYYY-MM-DD") from None
+
+
+def _encode_date(value: Any) -> dict[str, str]:
+    if isinstance(value, dict):
+        moment = _parse_date(value.get("date", ""))
+        time_part = value.get("time")
+    else:
+        text = value.isoformat() if isinstance(value, (date, datetime)) else str(value)
+        moment = _parse_date(text)
+        time_part = moment.strftime("%H:%M:%S") if len(text.strip()) > 10 else None
+    encoded = {"date": moment.strftime("%Y-%m-%d")}
+    if time_part:
+        encoded["time"] = time_part
+    return encoded
+
+
+def _encode_number(value: Any) -> str:
+    if isinstance(value, bool):
+        raise ColumnValueError(f"Invalid number {value!r}")
+    try:
+        float(value)
+    except (TypeError, ValueError):
+        raise ColumnValueError(f"Invalid number {value!r}") from None
+    return str(value).strip()
+
+
+def _encode_status(column: dict[str, Any], value: Any) -> dict[str, Any]:
+    if isinstance(value, dict):
+        value = value.get("label", value.get("index"))
+    label_id, name = _match_label(column, value)
+    return {"label": name} if name else {"index": int(label_id)}
+
+
+def _encode_dropdown(column: dict[str, Any], value: Any) -> dict[str, Any]:
+    if isinstance(value, dict):
+        value = value.get("labels") or value.get("ids") or []
+    if isinstance(value, str):
+        value = [part for part in value.split(",") if part.strip()]
+    elif not isinstance(value, list):
+        value = [value]
+    return {"ids": [int(_match_label(column, label)[0]) for label in value]}
+
+
+def _encode_people(value: Any) -> Any:
+    if isinstance(value, dict):
+        return value
+    if isinstance(value, str):
+        value = value.split(",")
+    elif not isinstance(value, list):
+        value = [value]
+    try:
+        ids = [int(str(person).strip()) for person in value]
+    except ValueError:
+        raise ColumnValueError(f"Invalid people {value!r}, expected user IDs") from None
+    return {"personsAndTeams": [{"id": id, "kind": "person"} for id in ids]}
+
+
+def encode_column_value(column: dict[str, Any], value: Any) -> Any:
+    """Normalize ``value`` to the JSON Monday.com expects for ``column``."""
+    kind = column.get("type")
+    if kind in READ_ONLY_TYPES:
+        raise ColumnValueError(f"Column {column['title']!r} ({kind}) is read-only")
+    if value is None:
+        return None
+    if kind == "status":
+        return _encode_status(column, value)
+    if kind == "dropdown":
+        return _encode_dropdown(column, value)
+    if kind == "date":
+        return _encode_date(value)
+    if kind == "timeline":
+        if isinstance(value, str) and " - " in value:
+            value = dict(zip(("from", "to"), value.split(" - ", 1)))
+        if not isinstance(value, dict) or not {"from", "to"} <= value.keys():
+            raise ColumnValueError(f"Invalid timeline {value!r}, expected from and to")
+        return {key: _encode_date(value[key])["date"] for key in ("from", "to")}
+    if kind == "numbers":
+        return _encode_number(value)
+    if kind == "checkbox":
+        if isinstance(value, dict):
+            value = value.get("checked")
+        checked = str(value).lower() in ("true", "1", "yes", "v")
+        return {"checked": "true"} if checked else None
+    if kind == "people":
+        return _encode_people(value)
+    if kind == "email" and isinstance(value, str):
+        if "@" not in value:
+            raise ColumnValueError(f"Invalid email {value!r}")
+        return {"email": value, "text": value}
+    if kind == "link" and isinstance(value, str):
+        if not value.startswith(("http://", "https://")):
+            raise ColumnValueError(f"Invalid link {value!r}, expected an http(s) URL")
+        return {"url": value, "text": value}
+    if kind == "long_text" and isinstance(value, str):
+        return {"text": value}
+    if kind == "text" and not isinstance(value, str):
+        return str(value)
+    return value
+
+
+def encode_column_values(
+    columns: list[dict[str, Any]], values: dict[str, Any]
+) -> dict[str, Any]:
+    """Validate and normalize ``{column ID or title: value}`` for a board.
+
+    All problems are reported together in one ``ColumnValueError``.
+    """
+    by_id = {column["id"]: column for column in columns}
+    by_title = {column["title"].lower(): column for column in columns}
+    encoded: dict[str, Any] = {}
+    errors: list[str] = []
+    for key, value in values.items():
+        column = by_id.get(key) or by_title.get(str(key).lower())
+        if column is None:
+            errors.append(
+                f"Unknown column {key!r}. Valid column IDs: {', '.join(by_id)}"
+            )
+            continue
+        try:
+            encoded[column["id"]] = encode_column_value(column, value)
+        except ColumnValueError as e:
+            errors.append(f"{column['id']}: {e}")
+    if errors:
+        raise ColumnValueError("; ".join(errors))
+    return encoded
+
+
+def decode_column_value(column_value: dict[str, Any]) -> Any:
+    """One compact value for a ``{id, type, text, value}`` column value."""
+    kind = column_value.get("type")
+    text = column_value.get("text") or None
+    value = column_value.get("value")
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError:
+            pass
+    if kind == "numbers" and text is not None:
+        try:
+            number = float(text)
+        except ValueError:
+            return text
+        return int(number) if number.is_integer() else number
+    if kind == "checkbox":
+        return bool(value and value.get("checked"))
+    if kind == "dropdown" and text is not None:
+        return text.split(", ")
+    if kind == "timeline" and isinstance(value, dict) and value.get("from"):
+        return {"from": value["from"], "to": value.get("to")}
+    if kind == "link" and isinstance(value, dict) and value.get("url"):
+        return value["url"]
+    return text
+
+
+def _is_empty(value: Any) -> bool:
+    # By identity and type: 0 and 0.0 are values, even though they equal False.
+    return value is None or value is False or (isinstance(value, list) and not value)
+
+
+def compact_items(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Replace each item's ``column_values`` list with ``{column ID: value}``.
+
+    Empty columns are left out. Sub-items are compacted as well.
+    """
+    for item in items:
+        if isinstance(item.get("column_values"), list):
+            decoded = {
+                cv["id"]: decode_column_value(cv) for cv in item["column_values"]
+            }
+            item["column_values"] = {
+                column_id: value
+                for column_id, value in decoded.items()
+                if not _is_empty(value)
+            }
+        if item.get("subitems"):
+            compact_items(item["subitems"])
+    return items
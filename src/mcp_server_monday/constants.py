@@ -1,8 +1,103 @@
 import os
+import tempfile
 
 MONDAY_API_KEY = os.getenv("MONDAY_API_KEY")
-MONDAY_API_BASE_URL = "https://api.monday.com/v2"
+MONDAY_API_BASE_URL = os.getenv("MONDAY_API_BASE_URL", "https://api.monday.com/v2")
 MONDAY_API_VERSION = os.getenv("MONDAY_API_VERSION", "2025-01")
 
 MONDAY_WORKSPACE_NAME = os.getenv("MONDAY_WORKSPACE_NAME")
 MONDAY_WORKSPACE_URL = f"https://{MONDAY_WORKSPACE_NAME}.monday.com"
+
+MONDAY_CACHE_TTL = float(os.getenv("MONDAY_CACHE_TTL", "30"))
+MONDAY_CACHE_MAX_ENTRIES = int(os.getenv("MONDAY_CACHE_MAX_ENTRIES", "1024"))
+MONDAY_CACHE_STALE_TTL = float(os.getenv("MONDAY_CACHE_STALE_TTL", "600"))
+MONDAY_WRITE_COALESCE_WINDOW = float(os.getenv("MONDAY_WRITE_COALESCE_WINDOW", "0"))
+MONDAY_RESOURCE_POLL_INTERVAL = float(os.getenv("MONDAY_RESOURCE_POLL_INTERVAL", "60"))
+
+MONDAY_STREAM_RESPONSES = (
+    os.getenv("MONDAY_STREAM_RESPONSES", "true").lower() != "false"
+)
+
+MONDAY_PAGE_LATENCY_TARGET = float(os.getenv("MONDAY_PAGE_LATENCY_TARGET", "3"))
+
+MONDAY_SNAPSHOT_TTL = float(os.getenv("MONDAY_SNAPSHOT_TTL", "300"))
+MONDAY_SNAPSHOT_MAX_BOARDS = int(os.getenv("MONDAY_SNAPSHOT_MAX_BOARDS", "8"))
+
+MONDAY_PREFETCH = os.getenv("MONDAY_PREFETCH", "false").lower() in ("1", "true", "yes")
+MONDAY_PREFETCH_TTL = float(os.getenv("MONDAY_PREFETCH_TTL", "30"))
+MONDAY_PREFETCH_MIN_BUDGET = int(os.getenv("MONDAY_PREFETCH_MIN_BUDGET", "1000000"))
+
+MONDAY_IDEMPOTENCY_STORE = os.getenv("MONDAY_IDEMPOTENCY_STORE", "memory://")
+MONDAY_IDEMPOTENCY_TTL = float(os.getenv("MONDAY_IDEMPOTENCY_TTL", "86400"))
+MONDAY_IDEMPOTENCY_MAX_ENTRIES = int(
+    os.getenv("MONDAY_IDEMPOTENCY_MAX_ENTRIES", "10000")
+)
+
+MONDAY_EXPORT_DIR = os.getenv("MONDAY_EXPORT_DIR", "exports")
+MONDAY_IMPORT_DIR = os.getenv("MONDAY_IMPORT_DIR", MONDAY_EXPORT_DIR)
+
+MONDAY_RECORD_CASSETTE = os.getenv("MONDAY_RECORD_CASSETTE")
+MONDAY_RECORD_CONTENT = os.getenv("MONDAY_RECORD_CONTENT", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+MONDAY_ADMIN_TOKEN = os.getenv("MONDAY_ADMIN_TOKEN")
+MONDAY_PROFILE_DIR = os.getenv(
+    "MONDAY_PROFILE_DIR",
+    os.path.join(tempfile.gettempdir(), "mcp-server-monday-profiles"),
+)
+MONDAY_PROFILE_MAX_FILES = int(os.getenv("MONDAY_PROFILE_MAX_FILES", "100"))
+
+MONDAY_API_KEY_HEADER = os.getenv("MONDAY_API_KEY_HEADER", "x-monday-api-key").lower()
+MONDAY_CLIENT_REGISTRY_SIZE = int(os.getenv("MONDAY_CLIENT_REGISTRY_SIZE", "64"))
+MONDAY_CLIENT_IDLE_TTL = float(os.getenv("MONDAY_CLIENT_IDLE_TTL", "900"))
+
+MONDAY_PRIORITY_HEADER = os.getenv(
+    "MONDAY_PRIORITY_HEADER", "x-monday-priority"
+).lower()
+
+
+def _positive_int(setting: str, value: str) -> int:
+    """``value`` of ``setting`` as an integer, which must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise ValueError(f"{setting} must be a positive integer, got {value!r}")
+    return number
+
+
+MONDAY_SCHEDULER_CONCURRENCY = _positive_int(
+    "MONDAY_SCHEDULER_CONCURRENCY", os.getenv("MONDAY_SCHEDULER_CONCURRENCY", "4")
+)
+MONDAY_SCHEDULER_QUANTUM = _positive_int(
+    "MONDAY_SCHEDULER_QUANTUM", os.getenv("MONDAY_SCHEDULER_QUANTUM", "1")
+)
+MONDAY_SCHEDULER_WEIGHTS = {
+    name.strip(): _positive_int(f"MONDAY_SCHEDULER_WEIGHTS[{name.strip()}]", weight)
+    for name, _, weight in (
+        pair.partition("=")
+        for pair in os.getenv(
+            "MONDAY_SCHEDULER_WEIGHTS", "interactive=4,batch=1"
+        ).split(",")
+        if pair.strip()
+    )
+}
+
+MONDAY_TOOL_DEADLINE = float(os.getenv("MONDAY_TOOL_DEADLINE", "120"))
+MONDAY_TOOL_DEADLINES = {
+    name.strip(): float(seconds)
+    for name, seconds in (
+        pair.split("=")
+        for pair in os.getenv(
+            "MONDAY_TOOL_DEADLINES",
+            "monday_export_board=1800,monday_import_items=1800,"
+            "monday_bulk_item_lifecycle=900,monday_aggregate_board=900,"
+            "monday_search_items=900,monday_query_boards=900",
+        ).split(",")
+        if pair.strip()
+    )
+}
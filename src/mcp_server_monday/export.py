@@ -0,0 +1,368 @@
+"""Streaming, resumable export of a Monday.com board to a local file.
+
+Items (and their sub-items) are fetched page by page with ``items_page`` /
+``next_items_page`` and written out as each page arrives, so memory use does
+not grow with the board. After every durable write the cursor of the next page
+is saved next to the output in ``<path>.checkpoint``; running the same export
+again continues from there. Monday.com cursors stay valid for 60 minutes.
+
+Supported formats are NDJSON, CSV and Parquet (the latter needs ``pyarrow``).
+A Parquet file can only be finished, not appended to, so Parquet exports are
+written as one file per page: ``<path>`` and then ``<stem>.part<N><suffix>``.
+
+Exports started through the MCP tool are written under ``MONDAY_EXPORT_DIR``,
+and an existing file is only written to when its checkpoint says it is an
+unfinished export of the same board.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import logging
+import os
+import time
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Iterator, Optional
+
+from mcp import types
+
+from mcp_server_monday.coalesce import coalescer_for
+from mcp_server_monday.constants import MONDAY_EXPORT_DIR
+from mcp_server_monday.paging import ITEM_FIELDS, iter_items_pages
+
+if TYPE_CHECKING:
+    from monday import MondayClient
+
+logger = logging.getLogger("fastmcp-server-monday.export")
+
+EXPORT_FORMATS = ("ndjson", "csv", "parquet")
+BASE_FIELDS = [
+    "id",
+    "parent_item_id",
+    "name",
+    "group_id",
+    "group_title",
+    "created_at",
+    "updated_at",
+]
+
+EXPORT_ITEM_FIELDS = (
+    ITEM_FIELDS
+    + """
+    subitems {
+        id
+        name
+        created_at
+        updated_at
+        column_values {
+            id
+            text
+            value
+        }
+    }
+"""
+)
+
+
+def item_rows(item: dict[str, Any]) -> list[dict[str, Any]]:
+    """Flatten an item and its sub-items into export rows."""
+    group = item.get("group") or {}
+    rows = [_row(item, None, group)]
+    for subitem in item.get("subitems") or []:
+        rows.append(_row(subitem, item["id"], group))
+    return rows
+
+
+def _row(
+    item: dict[str, Any], parent_item_id: Optional[str], group: dict[str, Any]
+) -> dict[str, Any]:
+    return {
+        "id": item["id"],
+        "parent_item_id": parent_item_id,
+        "name": item.get("name"),
+        "group_id": group.get("id"),
+        "group_title": group.get("title"),
+        "created_at": item.get("created_at"),
+        "updated_at": item.get("updated_at"),
+        "column_values": {
+            column["id"]: {
+                "text": column.get("text"),
+                "value": json.loads(column["value"]) if column.get("value") else None,
+            }
+            for column in item.get("column_values") or []
+        },
+    }
+
+
+def _flat_row(row: dict[str, Any]) -> dict[str, Any]:
+    flat = {field: row[field] for field in BASE_FIELDS}
+    for column_id, column in row["column_values"].items():
+        flat[column_id] = column["text"]
+    return flat
+
+
+def board_column_ids(monday_client: MondayClient, board_id: str) -> list[str]:
+    """Column IDs of a board followed by those of its sub-items board."""
+    query = f"""
+        query {{
+            boards (ids: {board_id}) {{
+                columns {{
+                    id
+                    type
+                    settings_str
+                }}
+            }}
+        }}
+    """
+    response = monday_client.custom._query(query)
+    column_ids: list[str] = []
+    subitem_board_ids: list[str] = []
+    for board in response["data"]["boards"]:
+        for column in board["columns"]:
+            column_ids.append(column["id"])
+            if column["type"] == "subtasks" and column.get("settings_str"):
+                settings = json.loads(column["settings_str"])
+                subitem_board_ids.extend(str(i) for i in settings.get("boardIds", []))
+    if subitem_board_ids:
+        for column_id in board_column_ids(monday_client, ", ".join(subitem_board_ids)):
+            if column_id not in column_ids:
+                column_ids.append(column_id)
+    return column_ids
+
+
+class _NdjsonWriter:
+    def __init__(self, path: Path, state: dict[str, Any]):
+        self.files = ExitStack()
+        self.file = self.files.enter_context(
+            _open_at(path, state.get("offset", 0), newline=None)
+        )
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        for row in rows:
+            self.file.write(json.dumps(row))
+            self.file.write("\n")
+
+    def commit(self) -> Optional[dict[str, Any]]:
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        return {"offset": self.file.tell()}
+
+    def close(self) -> None:
+        self.files.close()
+
+
+class _CsvWriter(_NdjsonWriter):
+    def __init__(self, path: Path, state: dict[str, Any]):
+        offset = state.get("offset", 0)
+        self.files = ExitStack()
+        self.file = self.files.enter_context(_open_at(path, offset, newline=""))
+        self.writer = csv.DictWriter(
+            self.file, BASE_FIELDS + state["columns"], extrasaction="ignore"
+        )
+        if offset == 0:
+            self.writer.writeheader()
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        self.writer.writerows(_flat_row(row) for row in rows)
+
+
+class _ParquetWriter:
+    """Writes a part per committed page; a part is durable once closed."""
+
+    def __init__(self, path: Path, state: dict[str, Any]):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(
+                "Parquet export needs the 'pyarrow' package: "
+                "pip install 'mcp-server-monday[parquet]'"
+            ) from e
+        self.pa, self.pq = pa, pq
+        self.path = path
+        self.part = state.get("part", 0)
+        self.schema = pa.schema(
+            [(name, pa.string()) for name in BASE_FIELDS + state["columns"]]
+        )
+        self.writer = None
+
+    def _part_path(self) -> Path:
+        if self.part == 0:
+            return self.path
+        return self.path.with_name(
+            f"{self.path.stem}.part{self.part}{self.path.suffix}"
+        )
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        if self.writer is None:
+            self.writer = self.pq.ParquetWriter(self._part_path(), self.schema)
+        table = self.pa.Table.from_pylist(
+            [_flat_row(row) for row in rows], schema=self.schema
+        )
+        self.writer.write_table(table)
+
+    def commit(self) -> Optional[dict[str, Any]]:
+        if self.writer is not None:
+            self.close()
+            self.part += 1
+        return {"part": self.part}
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+
+_WRITERS = {"ndjson": _NdjsonWriter, "csv": _CsvWriter, "parquet": _ParquetWriter}
+
+
+@contextmanager
+def _open_at(path: Path, offset: int, newline: Optional[str]) -> Iterator[IO[str]]:
+    """Open ``path`` for appending after dropping anything past ``offset``."""
+    with open(path, "a+", encoding="utf-8", newline=newline) as file:
+        file.truncate(offset)
+        file.seek(offset)
+        yield file
+
+
+def resolve_in(directory: str, path: str) -> Path:
+    """``path``, relative to ``directory``, which it must not lead out of."""
+    root = Path(directory).resolve()
+    resolved = (root / path).resolve()
+    if not resolved.is_relative_to(root):
+        raise ValueError(f"{path} is outside of {root}")
+    return resolved
+
+
+def _save_checkpoint(path: Path, state: dict[str, Any]) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(state))
+    os.replace(tmp, path)
+
+
+def export_board(
+    monday_client: MondayClient,
+    board_id: str,
+    path: str,
+    format: str = "ndjson",
+    page_size: int = 100,
+) -> dict[str, Any]:
+    """Export every item and sub-item of a board, resuming from a checkpoint if any."""
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format {format!r}")
+    output = Path(path)
+    checkpoint = output.with_name(output.name + ".checkpoint")
+
+    state: dict[str, Any] = {}
+    if checkpoint.exists():
+        state = json.loads(checkpoint.read_text())
+        if state.get("board_id") != str(board_id) or state.get("format") != format:
+            raise ValueError(
+                f"{checkpoint} belongs to another export; remove it to start over"
+            )
+    resumed = bool(state)
+    if not resumed and output.exists():
+        raise ValueError(
+            f"{output} already exists and is not an unfinished export; "
+            "choose another path or remove it"
+        )
+    if not resumed:
+        state = {
+            "board_id": str(board_id),
+            "format": format,
+            "rows": 0,
+            "cursor": None,
+            "offset": 0,
+            "part": 0,
+        }
+        if format != "ndjson":
+            state["columns"] = board_column_ids(monday_client, board_id)
+        # Before the output is created, so that an export failing on its first
+        # page can be resumed too.
+        _save_checkpoint(checkpoint, state)
+
+    coalescer_for(monday_client).flush(board_id=board_id)
+    writer = _WRITERS[format](output, state)
+    started_at = time.monotonic()
+    rows_before = state["rows"]
+    pending_rows = 0
+    try:
+        for items, cursor in iter_items_pages(
+            monday_client, board_id, page_size, state["cursor"], EXPORT_ITEM_FIELDS
+        ):
+            rows = [row for item in items for row in item_rows(item)]
+            writer.write(rows)
+            pending_rows += len(rows)
+            durable = writer.commit() if cursor else None
+            if durable is not None:
+                state.update(durable, cursor=cursor, rows=state["rows"] + pending_rows)
+                pending_rows = 0
+                _save_checkpoint(checkpoint, state)
+                elapsed = time.monotonic() - started_at
+                logger.info(
+                    f"Exported {state['rows']} rows of board {board_id} "
+                    f"({(state['rows'] - rows_before) / elapsed:.0f} rows/sec)"
+                )
+    finally:
+        writer.close()
+
+    checkpoint.unlink(missing_ok=True)
+    rows = state["rows"] + pending_rows - rows_before
+    elapsed = time.monotonic() - started_at
+    return {
+        "path": str(output),
+        "rows": state["rows"] + pending_rows,
+        "rows_this_run": rows,
+        "seconds": round(elapsed, 3),
+        "rows_per_second": round(rows / elapsed, 1) if elapsed else None,
+        "resumed": resumed,
+    }
+
+
+async def handle_monday_export_board(
+    boardId: str,
+    path: str,
+    monday_client: MondayClient,
+    format: str = "ndjson",
+    pageSize: int = 100,
+) -> list[types.TextContent]:
+    """Export all items and sub-items of a Monday.com board to a local file."""
+    output = resolve_in(MONDAY_EXPORT_DIR, path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    summary = export_board(monday_client, boardId, str(output), format, pageSize)
+    return [
+        types.TextContent(
+            type="text",
+            text=f"Exported Monday.com board {boardId}. {json.dumps(summary)}",
+        )
+    ]
+
+
+def cli(argv: Optional[list[str]] = None) -> None:
+    """``mcp-server-monday export`` subcommand."""
+    from mcp_server_monday.client import create_monday_client
+    from mcp_server_monday.constants import MONDAY_API_KEY
+
+    parser = argparse.ArgumentParser(
+        prog="mcp-server-monday export",
+        description="Export a Monday.com board to a local file. Re-run the same "
+        "command to resume an interrupted export.",
+    )
+    parser.add_argument("board_id")
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="ndjson")
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    summary = export_board(
+        create_monday_client(MONDAY_API_KEY),
+        args.board_id,
+        args.path,
+        args.format,
+        args.page_size,
+    )
+    print(json.dumps(summary))
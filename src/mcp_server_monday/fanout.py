@@ -0,0 +1,224 @@
+"""Concurrent queries across many boards.
+
+Items matching a filter are listed on every board at once, a few boards at a
+time, and merged as their pages arrive, each tagged with its board. Once the
+result cap is reached no further pages are requested, so the call takes about
+as long as the slowest board rather than the sum of all of them. At most
+``batch.MAX_CONCURRENCY`` boards are scanned at once, and fewer pages are in
+flight when the complexity budget left for the API key runs low.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Optional
+
+from mcp import types
+
+from mcp_server_monday.batch import clamp_concurrency
+from mcp_server_monday.cancellation import bind
+from mcp_server_monday.coalesce import coalescer_for
+from mcp_server_monday.columns import compact_items
+from mcp_server_monday.pagesize import BUDGET_SHARE, budget_remaining
+from mcp_server_monday.paging import iter_items_pages
+
+if TYPE_CHECKING:
+    from monday import MondayClient
+
+WORKSPACE_BOARDS_PAGE_SIZE = 100
+# Rough complexity of one item of a filtered items page with its column values.
+ITEM_COMPLEXITY = 1_000
+
+
+class _BudgetGate:
+    """Limits the pages in flight to what the complexity budget left can pay for."""
+
+    def __init__(self, monday_client: MondayClient, concurrency: int, page_size: int):
+        self.monday_client = monday_client
+        self.concurrency = concurrency
+        self.page_cost = page_size * ITEM_COMPLEXITY
+        self.in_flight = 0
+        self._condition = threading.Condition()
+
+    def _limit(self) -> int:
+        remaining = budget_remaining(self.monday_client)
+        if remaining is None:
+            return self.concurrency
+        affordable = int(BUDGET_SHARE * remaining // self.page_cost)
+        return max(1, min(self.concurrency, affordable))
+
+    def __enter__(self) -> None:
+        with self._condition:
+            # Woken when a page finishes, which is when the budget is updated.
+            self._condition.wait_for(lambda: self.in_flight < self._limit())
+            self.in_flight += 1
+
+    def __exit__(self, *exc_info: object) -> None:
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+
+def graphql_rules(rules: list[dict[str, Any]]) -> str:
+    """Render ``[{column_id, compare_value, operator}]`` as an items_page filter."""
+    rendered = []
+    for rule in rules:
+        compare_value = rule.get("compare_value", [])
+        if not isinstance(compare_value, list):
+            compare_value = [compare_value]
+        operator = str(rule.get("operator", "any_of"))
+        if not operator.isidentifier():
+            raise ValueError(f"Invalid operator {operator!r}")
+        rendered.append(
+            f"{{column_id: {json.dumps(rule['column_id'])}, "
+            f"compare_value: {json.dumps(compare_value)}, operator: {operator}}}"
+        )
+    return f"{{rules: [{', '.join(rendered)}]}}"
+
+
+def item_fields(column_ids: Optional[list[str]] = None) -> str:
+    column_filter = ""
+    if column_ids:
+        column_filter = f"(ids: [{', '.join(json.dumps(c) for c in column_ids)}])"
+    return f"""
+        id
+        name
+        group {{
+            id
+            title
+        }}
+        column_values {column_filter} {{
+            id
+            type
+            text
+            value
+        }}
+    """
+
+
+def workspace_boards(monday_client: MondayClient, workspace_id: str) -> list[dict]:
+    """Active boards of a workspace, without sub-item boards."""
+    boards: list[dict] = []
+    page = 1
+    while True:
+        response = monday_client.custom._query(
+            f"""
+            query {{
+                boards (
+                    workspace_ids: [{workspace_id}],
+                    state: active,
+                    limit: {WORKSPACE_BOARDS_PAGE_SIZE},
+                    page: {page}
+                ) {{
+                    id
+                    name
+                    type
+                }}
+            }}
+            """
+        )
+        batch = response.get("data", {}).get("boards") or []
+        boards.extend(
+            board for board in batch if board.get("type") != "sub_items_board"
+        )
+        if len(batch) < WORKSPACE_BOARDS_PAGE_SIZE:
+            return boards
+        page += 1
+
+
+def query_boards(
+    monday_client: MondayClient,
+    board_ids: Optional[list[str]] = None,
+    workspace_id: Optional[str] = None,
+    rules: Optional[list[dict[str, Any]]] = None,
+    column_ids: Optional[list[str]] = None,
+    max_results: int = 100,
+    concurrency: int = 4,
+) -> dict[str, Any]:
+    """List matching items across boards, stopping once ``max_results`` are found."""
+    boards = {str(board_id): {} for board_id in board_ids or []}
+    if workspace_id:
+        for board in workspace_boards(monday_client, workspace_id):
+            boards.setdefault(str(board["id"]), {})["name"] = board["name"]
+    if not boards:
+        raise ValueError("boardIds or workspaceId is required")
+
+    query_params = graphql_rules(rules) if rules else None
+    fields = item_fields(column_ids)
+    page_size = max(1, min(100, max_results))
+    concurrency = clamp_concurrency(concurrency)
+    gate = _BudgetGate(monday_client, concurrency, page_size)
+    results: list[dict[str, Any]] = []
+    lock = threading.Lock()
+    cap_reached = threading.Event()
+    started_at = time.monotonic()
+
+    def scan(board_id: str) -> None:
+        status = boards[board_id]
+        status.update(items=0, complete=False)
+        if cap_reached.is_set():
+            return
+        coalescer_for(monday_client).flush(board_id=board_id)
+        try:
+            pages = iter_items_pages(
+                monday_client, board_id, page_size, None, fields, query_params
+            )
+            while True:
+                with gate:
+                    page = next(pages, None)
+                if page is None:
+                    return
+                items, cursor = page
+                compact_items(items)
+                with lock:
+                    room = max_results - len(results)
+                    for item in items[:room]:
+                        results.append({"board_id": board_id, **item})
+                    status["items"] += min(len(items), room)
+                    if len(results) >= max_results:
+                        cap_reached.set()
+                    if not cursor and room >= len(items):
+                        status["complete"] = True
+                if cap_reached.is_set():
+                    return
+        except Exception as e:
+            status["error"] = str(e)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(bind(scan), boards))
+
+    # Reaching the cap with the last matching item is not a truncation.
+    truncated = cap_reached.is_set() and any(
+        not status["complete"] and "error" not in status for status in boards.values()
+    )
+    return {
+        "items": results,
+        "boards": boards,
+        "truncated": truncated,
+        "seconds": round(time.monotonic() - started_at, 3),
+    }
+
+
+async def handle_monday_query_boards(
+    monday_client: MondayClient,
+    boardIds: Optional[list[str]] = None,
+    workspaceId: Optional[str] = None,
+    rules: Optional[list[dict[str, Any]]] = None,
+    columnIds: Optional[list[str]] = None,
+    maxResults: int = 100,
+    concurrency: int = 4,
+) -> list[types.TextContent]:
+    """Find items matching a filter across many Monday.com boards."""
+    result = query_boards(
+        monday_client, boardIds, workspaceId, rules, columnIds, maxResults, concurrency
+    )
+    return [
+        types.TextContent(
+            type="text",
+            text=f"Found {len(result['items'])} items across "
+            f"{len(result['boards'])} Monday.com boards. {json.dumps(result)}",
+        )
+    ]
@@ -1,13 +1,36 @@
 """FastMCP-based Monday.com server implementation."""
 
+from __future__ import annotations
+
 import asyncio
+import inspect
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import threading
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    TypeVar,
+)
 
 from fastmcp import FastMCP
-from monday import MondayClient
-
+from fastmcp.server.dependencies import get_http_headers
+from mcp import types
+from pydantic import AnyUrl
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from mcp_server_monday import metrics
+from mcp_server_monday.activity import handle_monday_get_board_changes
+from mcp_server_monday.aggregate import handle_monday_aggregate_board
+from mcp_server_monday.batch import clamp_concurrency
 from mcp_server_monday.board import (
     handle_monday_create_board,
     handle_monday_create_new_board_group,
@@ -15,7 +38,32 @@ from mcp_server_monday.board import (
     handle_monday_get_board_groups,
     handle_monday_list_boards,
 )
-from mcp_server_monday.constants import MONDAY_API_KEY
+from mcp_server_monday.cache import (
+    add_invalidation_listener,
+    collect_stale_reads,
+    read_cache_metrics,
+    staleness_note,
+)
+from mcp_server_monday.cancellation import (
+    DeadlineMiddleware,
+    cancellation_metrics,
+    upstream_call,
+)
+from mcp_server_monday.cassette import RecordingMiddleware, get_recorder
+from mcp_server_monday.coalesce import coalescing_metrics
+from mcp_server_monday.constants import (
+    MONDAY_ADMIN_TOKEN,
+    MONDAY_API_KEY,
+    MONDAY_API_KEY_HEADER,
+    MONDAY_CLIENT_IDLE_TTL,
+    MONDAY_CLIENT_REGISTRY_SIZE,
+    MONDAY_PRIORITY_HEADER,
+    MONDAY_RECORD_CASSETTE,
+)
+from mcp_server_monday.export import handle_monday_export_board
+from mcp_server_monday.fanout import handle_monday_query_boards
+from mcp_server_monday.idempotency import get_idempotency_cache, idempotency_metrics
+from mcp_server_monday.importer import handle_monday_import_items
 from mcp_server_monday.item import (
     handle_monday_archive_item,
     handle_monday_create_item,
@@ -28,19 +76,182 @@ from mcp_server_monday.item import (
     handle_monday_move_item_to_group,
     handle_monday_update_item,
 )
+from mcp_server_monday.lifecycle import handle_monday_bulk_item_lifecycle
+from mcp_server_monday.pagesize import (
+    MAX_PAGE_SIZE,
+    budget_remaining,
+    page_sizer_for,
+    page_sizing_metrics,
+)
+from mcp_server_monday.prefetch import on_invalidate as on_prefetch_invalidate
+from mcp_server_monday.prefetch import prefetch_metrics
+from mcp_server_monday.profiling import (
+    ProfilingMiddleware,
+    active_run,
+    profile_download_endpoint,
+    profile_stacks_endpoint,
+    profiler,
+    profiling_endpoint,
+)
+from mcp_server_monday.resources import (
+    BOARD_COLUMNS_URI,
+    BOARD_GROUPS_URI,
+    BOARDS_URI,
+    handle_read_resource,
+    resource_subscriptions,
+)
+from mcp_server_monday.scheduler import scheduler_for, scheduler_metrics
+from mcp_server_monday.snapshot import (
+    SNAPSHOT_PAGE_SIZE,
+    handle_monday_search_items,
+    on_invalidate,
+    snapshot_metrics,
+)
+from mcp_server_monday.tree import handle_monday_get_item_tree
+
+if TYPE_CHECKING:
+    from monday import MondayClient
+
+    from mcp_server_monday.client import ClientRegistry
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("fastmcp-server-monday")
 
+T = TypeVar("T")
+
 mcp = FastMCP("monday")
-monday_client: MondayClient = None
+client_registry: ClientRegistry = None
+_client_registry_lock = threading.Lock()
 
 
 def get_monday_client() -> MondayClient:
-    global monday_client
-    if monday_client is None:
-        monday_client = MondayClient(MONDAY_API_KEY)
-    return monday_client
+    """Return the client for the API key of the current request.
+
+    Requests may carry their own key in the ``MONDAY_API_KEY_HEADER`` header;
+    otherwise ``MONDAY_API_KEY`` is used.
+    """
+    global client_registry
+    if client_registry is None:
+        with _client_registry_lock:
+            if client_registry is None:
+                from mcp_server_monday.client import ClientRegistry
+
+                client_registry = ClientRegistry(
+                    MONDAY_API_KEY,
+                    max_clients=MONDAY_CLIENT_REGISTRY_SIZE,
+                    idle_ttl=MONDAY_CLIENT_IDLE_TTL,
+                )
+    api_key = get_http_headers().get(MONDAY_API_KEY_HEADER)
+    return client_registry.get(api_key)
+
+
+def _session_id() -> str:
+    return get_http_headers(include_all=True).get("mcp-session-id", "local")
+
+
+def items_page_cost(limit: int) -> int:
+    """Scheduler cost of an items page: one unit per 25 items requested."""
+    return max(1, limit // 25)
+
+
+async def run_upstream(
+    client: MondayClient, handler: Coroutine[Any, Any, T], cost: int = 1
+) -> T:
+    """Run a handler's blocking upstream calls in a worker thread.
+
+    The call waits for a slot from the fair scheduler of the client's API key,
+    queued per MCP session. Sessions can declare themselves ``batch`` through
+    the ``MONDAY_PRIORITY_HEADER`` header to yield to interactive sessions.
+    Calls selected for profiling are profiled in that thread. Text answers
+    built from cached values served because Monday.com could not be reached
+    start with a note saying so. If the call is cancelled, its slot is given
+    back at once and the requests of the thread are aborted.
+    """
+    priority_class = get_http_headers().get(MONDAY_PRIORITY_HEADER, "interactive")
+    try:
+        async with scheduler_for(client).slot(_session_id(), priority_class, cost):
+            run = asyncio.run
+            profile_run = active_run.get()
+            if profile_run is not None:
+                run = profile_run.wrap(run)
+            with collect_stale_reads() as stale_reads, upstream_call():
+                result = await asyncio.to_thread(run, handler)
+            if stale_reads and isinstance(result, list) and result:
+                if isinstance(result[0], types.TextContent):
+                    result[0].text = f"{staleness_note(stale_reads)}\n{result[0].text}"
+            return result
+    finally:
+        # Not started if the wait for a slot was cancelled. A cancelled thread
+        # still runs the handler until its aborted request fails.
+        if inspect.getcoroutinestate(handler) == inspect.CORO_CREATED:
+            handler.close()
+
+
+async def run_idempotent(
+    client: MondayClient,
+    tool: str,
+    idempotency_key: Optional[str],
+    arguments: Any,
+    call: Callable[[], Awaitable[str]],
+) -> str:
+    """Run ``call`` once per idempotency key; retries get the first result.
+
+    Without a key the call simply runs. Keys are scoped to the API key and tool.
+    """
+    if not idempotency_key:
+        return await call()
+    key = f"{client.key_id}:{tool}:{idempotency_key}"
+    return await get_idempotency_cache().run(key, arguments, call)
+
+
+def warm_up() -> None:
+    """Create the client and pre-load the board list into the cache.
+
+    Runs in a background thread so that the MCP handshake is not delayed.
+    """
+    try:
+        asyncio.run(handle_monday_list_boards(get_monday_client(), 100, 1))
+        logger.info("Warm-up complete")
+    except Exception as e:
+        logger.warning(f"Warm-up failed: {e}")
+
+
+metrics.register("scheduler", scheduler_metrics)
+metrics.register("read_cache", read_cache_metrics)
+metrics.register("write_coalescing", coalescing_metrics)
+metrics.register("idempotency", idempotency_metrics)
+metrics.register("prefetch", prefetch_metrics)
+metrics.register("page_sizing", page_sizing_metrics)
+metrics.register("resource_subscriptions", resource_subscriptions.metrics)
+metrics.register("snapshots", snapshot_metrics)
+metrics.register("cancellation", cancellation_metrics)
+add_invalidation_listener(resource_subscriptions.on_invalidate)
+add_invalidation_listener(on_invalidate)
+add_invalidation_listener(on_prefetch_invalidate)
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics_endpoint(request: Request) -> JSONResponse:
+    return JSONResponse(metrics.collect())
+
+
+if MONDAY_RECORD_CASSETTE:
+    mcp.add_middleware(RecordingMiddleware(get_recorder()))
+
+if MONDAY_ADMIN_TOKEN:
+    mcp.add_middleware(ProfilingMiddleware(profiler))
+    mcp.custom_route("/admin/profiling", methods=["GET", "POST", "DELETE"])(
+        profiling_endpoint
+    )
+    mcp.custom_route("/admin/profiling/stacks", methods=["GET"])(
+        profile_stacks_endpoint
+    )
+    mcp.custom_route("/admin/profiling/profiles/{name}", methods=["GET"])(
+        profile_download_endpoint
+    )
+
+# Innermost, so that recorded and profiled calls see the deadline error.
+mcp.add_middleware(DeadlineMiddleware())
 
 
 @mcp.tool()
@@ -53,7 +264,9 @@ async def monday_list_boards(limit: int = 100, page: int = 1) -> str:
     """
     try:
         client = get_monday_client()
-        result = await handle_monday_list_boards(client, limit, page)
+        result = await run_upstream(
+            client, handle_monday_list_boards(client, limit, page)
+        )
         return result[0].text
     except Exception as e:
         return f"Error listing boards: {e}"
@@ -68,7 +281,9 @@ async def monday_get_board_groups(boardId: str) -> str:
     """
     try:
         client = get_monday_client()
-        result = await handle_monday_get_board_groups(boardId, client)
+        result = await run_upstream(
+            client, handle_monday_get_board_groups(boardId, client)
+        )
         return result[0].text
     except Exception as e:
         return f"Error getting board groups: {e}"
@@ -83,42 +298,71 @@ async def monday_get_board_columns(boardId: str) -> str:
     """
     try:
         client = get_monday_client()
-        result = await handle_monday_get_board_columns(boardId, client)
+        result = await run_upstream(
+            client, handle_monday_get_board_columns(boardId, client)
+        )
         return result[0].text
     except Exception as e:
         return f"Error getting board columns: {e}"
 
 
 @mcp.tool()
-async def monday_create_board(boardName: str, boardKind: Optional[str] = None) -> str:
+async def monday_create_board(
+    boardName: str,
+    boardKind: Optional[str] = None,
+    idempotencyKey: Optional[str] = None,
+) -> str:
     """Create a new Monday.com board.
 
     Args:
         boardName: Name of the Monday.com board to create.
         boardKind: Kind of the Monday.com board to create (public, private, shareable). Default is public.
+        idempotencyKey: Optional unique key for this request. Retrying with the same key returns the first result instead of creating another board.
     """
     try:
         client = get_monday_client()
-        result = await handle_monday_create_board(
-            boardName, boardKind or "public", client
+
+        async def create_board() -> str:
+            result = await run_upstream(
+                client,
+                handle_monday_create_board(client, boardName, boardKind or "public"),
+            )
+            return result[0].text
+
+        return await run_idempotent(
+            client, "create_board", idempotencyKey, [boardName, boardKind], create_board
         )
-        return result[0].text
     except Exception as e:
         return f"Error creating board: {e}"
 
 
 @mcp.tool()
-async def monday_create_board_group(boardId: str, groupName: str) -> str:
+async def monday_create_board_group(
+    boardId: str, groupName: str, idempotencyKey: Optional[str] = None
+) -> str:
     """Create a new group in a Monday.com board.
 
     Args:
         boardId: Monday.com Board ID that the group will be created in.
         groupName: Name of the group to create.
+        idempotencyKey: Optional unique key for this request. Retrying with the same key returns the first result instead of creating another group.
     """
     try:
         client = get_monday_client()
-        result = await handle_monday_create_new_board_group(boardId, groupName, client)
-        return result[0].text
+
+        async def create_group() -> str:
+            result = await run_upstream(
+                client, handle_monday_create_new_board_group(client, boardId, groupName)
+            )
+            return result[0].text
+
+        return await run_idempotent(
+            client,
+            "create_board_group",
+            idempotencyKey,
+            [boardId, groupName],
+            create_group,
+        )
     except Exception as e:
         return f"Error creating board group: {e}"
 
@@ -130,6 +374,7 @@ async def monday_create_item(
     groupId: Optional[str] = None,
     parentItemId: Optional[str] = None,
     columnValues: Optional[Dict[str, Any]] = None,
+    idempotencyKey: Optional[str] = None,
 ) -> str:
     """Create a new item in a Monday.com Board. Optionally, specify the parent Item ID to create a Sub-item.
 
@@ -138,14 +383,25 @@ async def monday_create_item(
         itemTitle: Name of the Monday.com Item or Sub-item that will be created.
         groupId: Monday.com Board's Group ID to create the Item in. If set, parentItemId should not be set.
         parentItemId: Monday.com Item ID to create the Sub-item under. If set, groupId should not be set.
-        columnValues: Dictionary of column values to set {column_id: value}.
+        columnValues: Dictionary of column values to set {column_id: value}. Values are checked against the board's columns before sending, e.g. status labels and YYYY-MM-DD dates.
+        idempotencyKey: Optional unique key for this request. Retrying with the same key returns the first result instead of creating another item.
     """
     try:
         client = get_monday_client()
-        result = await handle_monday_create_item(
-            boardId, itemTitle, groupId, parentItemId, columnValues, client
+
+        async def create_item() -> str:
+            result = await run_upstream(
+                client,
+                handle_monday_create_item(
+                    boardId, itemTitle, client, groupId, parentItemId, columnValues
+                ),
+            )
+            return result[0].text
+
+        arguments = [boardId, itemTitle, groupId, parentItemId, columnValues]
+        return await run_idempotent(
+            client, "create_item", idempotencyKey, arguments, create_item
         )
-        return result[0].text
     except Exception as e:
         return f"Error creating item: {e}"
 
@@ -159,12 +415,42 @@ async def monday_get_items_by_id(itemId: str) -> str:
     """
     try:
         client = get_monday_client()
-        result = await handle_monday_get_item_by_id(itemId, client)
+        result = await run_upstream(
+            client, handle_monday_get_item_by_id(itemId, client)
+        )
         return result[0].text
     except Exception as e:
         return f"Error fetching item: {e}"
 
 
+@mcp.tool()
+async def monday_get_item_tree(
+    itemId: str,
+    columnIds: Optional[List[str]] = None,
+    updatesLimit: int = 5,
+    maxUpdateLength: int = 500,
+) -> str:
+    """Fetch a Monday.com item with its sub-items, their column values and latest updates in one call.
+
+    Args:
+        itemId: ID of the Monday.com item to fetch.
+        columnIds: Column IDs to include. Default is all columns.
+        updatesLimit: Number of latest updates to include per item and sub-item. Default is 5.
+        maxUpdateLength: Maximum length of each update's plain text. Default is 500.
+    """
+    try:
+        client = get_monday_client()
+        result = await run_upstream(
+            client,
+            handle_monday_get_item_tree(
+                itemId, client, columnIds, updatesLimit, maxUpdateLength
+            ),
+        )
+        return result[0].text
+    except Exception as e:
+        return f"Error fetching item tree: {e}"
+
+
 @mcp.tool()
 async def monday_update_item(
     boardId: str, itemId: str, columnValues: Dict[str, Any]
@@ -174,54 +460,176 @@ async def monday_update_item(
     Args:
         boardId: Monday.com Board ID that the Item or Sub-item is on.
         itemId: Monday.com Item or Sub-item ID to update the columns of.
-        columnValues: Dictionary of column values to update the Monday.com Item or Sub-item with. ({column_id: value}).
+        columnValues: Dictionary of column values to update the Monday.com Item or Sub-item with. ({column_id: value}). Values are checked against the board's columns before sending, e.g. status labels and YYYY-MM-DD dates.
     """
     try:
         client = get_monday_client()
-        result = await handle_monday_update_item(boardId, itemId, columnValues, client)
+        result = await handle_monday_update_item(
+            boardId, itemId, columnValues, client, partial(run_upstream, client)
+        )
         return result[0].text
     except Exception as e:
         return f"Error updating item: {e}"
 
 
 @mcp.tool()
-async def monday_create_update(itemId: str, updateText: str) -> str:
+async def monday_create_update(
+    itemId: str, updateText: str, idempotencyKey: Optional[str] = None
+) -> str:
     """Create an update (comment) on a Monday.com Item or Sub-item.
 
     Args:
         itemId: Monday.com Item ID to create the update on.
         updateText: Content to update the Item or Sub-item with.
+        idempotencyKey: Optional unique key for this request. Retrying with the same key returns the first result instead of posting the update again.
     """
     try:
         client = get_monday_client()
-        result = await handle_monday_create_update_on_item(itemId, updateText, client)
-        return result[0].text
+
+        async def create_update() -> str:
+            result = await run_upstream(
+                client, handle_monday_create_update_on_item(itemId, updateText, client)
+            )
+            return result[0].text
+
+        return await run_idempotent(
+            client, "create_update", idempotencyKey, [itemId, updateText], create_update
+        )
     except Exception as e:
         return f"Error creating update: {e}"
 
 
 @mcp.tool()
 async def monday_list_items_in_groups(
-    boardId: str, groupIds: List[str], limit: int, cursor: Optional[str] = None
+    boardId: str,
+    groupIds: List[str],
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
 ) -> str:
     """List all items in the specified groups of a Monday.com board.
 
     Args:
         boardId: Monday.com Board ID that the Item or Sub-item is on.
         groupIds: List of group IDs to list items from.
-        limit: Maximum number of items to return.
+        limit: Maximum number of items to return. If omitted, the server picks the page size that returns items fastest for this board.
         cursor: Pagination cursor for continuing from previous results.
     """
     try:
         client = get_monday_client()
-        result = await handle_monday_list_items_in_groups(
-            boardId, groupIds, limit, cursor, client
+        adaptive = limit is None
+        if adaptive:
+            limit = page_sizer_for(client).suggest(boardId, budget_remaining(client))
+        result = await run_upstream(
+            client,
+            handle_monday_list_items_in_groups(
+                boardId, groupIds, limit, client, cursor, adaptive
+            ),
+            cost=items_page_cost(limit),
         )
         return result[0].text
     except Exception as e:
         return f"Error listing items in groups: {e}"
 
 
+@mcp.tool()
+async def monday_query_boards(
+    boardIds: Optional[List[str]] = None,
+    workspaceId: Optional[str] = None,
+    rules: Optional[List[Dict[str, Any]]] = None,
+    columnIds: Optional[List[str]] = None,
+    maxResults: int = 100,
+    concurrency: int = 4,
+) -> str:
+    """Find items matching a filter across many Monday.com boards at once, e.g. everything assigned to a person on all project boards.
+
+    Args:
+        boardIds: IDs of the Monday.com boards to search.
+        workspaceId: Search all active boards of this workspace (in addition to boardIds).
+        rules: Item filter rules, e.g. [{"column_id": "status", "compare_value": ["Done"], "operator": "not_any_of"}]. Default is all items.
+        columnIds: Column IDs to include for each item. Default is all columns.
+        maxResults: Stop once this many items have been found. Default is 100.
+        concurrency: Number of boards queried at the same time, at most 8. Default is 4.
+    """
+    try:
+        client = get_monday_client()
+        result = await run_upstream(
+            client,
+            handle_monday_query_boards(
+                client, boardIds, workspaceId, rules, columnIds, maxResults, concurrency
+            ),
+            cost=clamp_concurrency(concurrency) * items_page_cost(min(100, maxResults)),
+        )
+        return result[0].text
+    except Exception as e:
+        return f"Error querying boards: {e}"
+
+
+@mcp.tool()
+async def monday_aggregate_board(
+    boardId: str,
+    groupBy: Optional[List[str]] = None,
+    aggregates: Optional[List[str]] = None,
+    dateHistogram: Optional[str] = None,
+    rules: Optional[List[Dict[str, Any]]] = None,
+    maxRows: int = 100,
+) -> str:
+    """Summarize all items of a Monday.com board on the server and return only the summary table, e.g. items per status in each group or the sum of a budget column per owner.
+
+    Args:
+        boardId: Monday.com Board ID to summarize.
+        groupBy: Keys to group items by: "group" for the item's group and/or column IDs. Omit for a single row over the whole board.
+        aggregates: Metrics per row as "<op>:<column ID>", with op one of sum, avg, min, max or count (non-empty values), e.g. ["sum:budget", "max:date4"]. The number of items is always included.
+        dateHistogram: Also group by a date or timeline column truncated to day, week, month or year, as "<column ID>:<interval>", e.g. "date4:month".
+        rules: Optional filter, as for monday_query_boards: a list of {"column_id", "compare_value", "operator"}.
+        maxRows: Maximum number of rows returned, largest groups first.
+    """
+    try:
+        client = get_monday_client()
+        result = await run_upstream(
+            client,
+            handle_monday_aggregate_board(
+                boardId, client, groupBy, aggregates, dateHistogram, rules, maxRows
+            ),
+            cost=items_page_cost(MAX_PAGE_SIZE),
+        )
+        return result[0].text
+    except Exception as e:
+        return f"Error aggregating board: {e}"
+
+
+@mcp.tool()
+async def monday_search_items(
+    boardId: str,
+    filters: Optional[List[Dict[str, Any]]] = None,
+    sortBy: Optional[str] = None,
+    descending: bool = False,
+    limit: int = 50,
+    columnIds: Optional[List[str]] = None,
+) -> str:
+    """Filter, sort and take the top items of a Monday.com board, answered from an in-memory snapshot of the board. Faster than paging through monday_list_items_in_groups for repeated questions about the same board, e.g. the 10 largest deals that are still open.
+
+    Args:
+        boardId: Monday.com Board ID to search.
+        filters: Conditions that items must all meet, as {"column": <column ID, "name" or "group">, "op": <operator>, "value": <value>}. Operators: eq, ne, in (value is a list), contains (text), gt, gte, lt, lte (numbers and dates), empty and not_empty. Labels compare by their text, dates as YYYY-MM-DD.
+        sortBy: Column ID, "name" or "group" to sort by. Empty values sort last.
+        descending: Sort from largest to smallest.
+        limit: Maximum number of items returned.
+        columnIds: Column IDs to include in each item. Omit for all columns.
+    """
+    try:
+        client = get_monday_client()
+        result = await run_upstream(
+            client,
+            handle_monday_search_items(
+                boardId, client, filters, sortBy, descending, limit, columnIds
+            ),
+            cost=items_page_cost(SNAPSHOT_PAGE_SIZE),
+        )
+        return result[0].text
+    except Exception as e:
+        return f"Error searching items: {e}"
+
+
 @mcp.tool()
 async def monday_list_subitems_in_items(itemIds: List[str]) -> str:
     """List all Sub-items of a list of Monday.com Items.
@@ -231,7 +639,9 @@ async def monday_list_subitems_in_items(itemIds: List[str]) -> str:
     """
     try:
         client = get_monday_client()
-        result = await handle_monday_list_subitems_in_items(itemIds, client)
+        result = await run_upstream(
+            client, handle_monday_list_subitems_in_items(itemIds, client)
+        )
         return result[0].text
     except Exception as e:
         return f"Error listing sub-items: {e}"
@@ -247,7 +657,9 @@ async def monday_move_item_to_group(itemId: str, groupId: str) -> str:
     """
     try:
         client = get_monday_client()
-        result = await handle_monday_move_item_to_group(client, itemId, groupId)
+        result = await run_upstream(
+            client, handle_monday_move_item_to_group(client, itemId, groupId)
+        )
         return result[0].text
     except Exception as e:
         return f"Error moving item: {e}"
@@ -262,7 +674,7 @@ async def monday_delete_item(itemId: str) -> str:
     """
     try:
         client = get_monday_client()
-        result = await handle_monday_delete_item(client, itemId)
+        result = await run_upstream(client, handle_monday_delete_item(client, itemId))
         return result[0].text
     except Exception as e:
         return f"Error deleting item: {e}"
@@ -277,46 +689,284 @@ async def monday_archive_item(itemId: str) -> str:
     """
     try:
         client = get_monday_client()
-        result = await handle_monday_archive_item(client, itemId)
+        result = await run_upstream(client, handle_monday_archive_item(client, itemId))
         return result[0].text
     except Exception as e:
         return f"Error archiving item: {e}"
 
 
 @mcp.tool()
-async def monday_get_item_updates(itemId: str, limit: int = 25) -> str:
-    """Get updates for a specific item in Monday.com.
+async def monday_bulk_item_lifecycle(
+    itemIds: List[str],
+    action: str,
+    groupId: Optional[str] = None,
+    boardId: Optional[str] = None,
+    concurrency: int = 4,
+    idempotencyKey: Optional[str] = None,
+) -> str:
+    """Move, archive, delete or duplicate many Monday.com items in one call, e.g. to clean up a board. Returns an outcome per item.
+
+    Args:
+        itemIds: Monday.com Item IDs to act on.
+        action: One of move, archive, delete or duplicate.
+        groupId: Group ID to move the items to. Required for move.
+        boardId: Monday.com Board ID the items are on. Required for duplicate.
+        concurrency: Number of requests in flight at once, at most 8. Default is 4.
+        idempotencyKey: Optional unique key for this request. Retrying with the same key returns the first result instead of acting on the items again.
+    """
+    try:
+        client = get_monday_client()
+
+        async def bulk_item_lifecycle() -> str:
+            result = await run_upstream(
+                client,
+                handle_monday_bulk_item_lifecycle(
+                    itemIds, action, client, groupId, boardId, concurrency
+                ),
+                cost=clamp_concurrency(concurrency),
+            )
+            return result[0].text
+
+        arguments = [itemIds, action, groupId, boardId]
+        return await run_idempotent(
+            client,
+            "bulk_item_lifecycle",
+            idempotencyKey,
+            arguments,
+            bulk_item_lifecycle,
+        )
+    except Exception as e:
+        return f"Error applying {action} to items: {e}"
+
+
+@mcp.tool()
+async def monday_get_item_updates(
+    itemId: Optional[str] = None,
+    limit: int = 25,
+    itemIds: Optional[List[str]] = None,
+    page: int = 1,
+    since: Optional[str] = None,
+    plainText: bool = False,
+    maxLength: int = 2000,
+) -> str:
+    """Get updates for one or more Monday.com items, newest first.
 
     Args:
         itemId: ID of the Monday.com item to get updates for.
-        limit: Maximum number of updates to retrieve. Default is 25.
+        limit: Maximum number of updates to retrieve per item. Default is 25.
+        itemIds: IDs of several items to get updates for in one call.
+        page: Page of updates to retrieve, starting at 1. Default is 1.
+        since: Only return updates created after this ISO 8601 timestamp.
+        plainText: Return update bodies as plain text instead of HTML. Default is False.
+        maxLength: Maximum length of each plain text body. Default is 2000.
     """
     try:
         client = get_monday_client()
-        result = await handle_monday_get_item_updates(itemId, limit, client)
+        result = await run_upstream(
+            client,
+            handle_monday_get_item_updates(
+                itemId, client, limit, itemIds, page, since, plainText, maxLength
+            ),
+        )
         return result[0].text
     except Exception as e:
         return f"Error getting item updates: {e}"
 
 
+@mcp.tool()
+async def monday_export_board(
+    boardId: str, path: str, format: str = "ndjson", pageSize: int = 100
+) -> str:
+    """Export every item, sub-item and column value of a Monday.com board to a local file on the server.
+
+    Interrupted exports resume from where they stopped when called again with the same arguments.
+
+    Args:
+        boardId: Monday.com Board ID to export.
+        path: Path of the file to write, relative to the server's export directory. An existing file is only continued if it is an unfinished export of the same board.
+        format: Output format: ndjson, csv or parquet. Default is ndjson.
+        pageSize: Number of items fetched per request. Default is 100.
+    """
+    try:
+        client = get_monday_client()
+        result = await run_upstream(
+            client,
+            handle_monday_export_board(boardId, path, client, format, pageSize),
+            cost=items_page_cost(pageSize),
+        )
+        return result[0].text
+    except Exception as e:
+        return f"Error exporting board: {e}"
+
+
+@mcp.tool()
+async def monday_import_items(
+    boardId: str,
+    path: str,
+    groupId: Optional[str] = None,
+    mapping: Optional[Dict[str, str]] = None,
+    batchSize: int = 25,
+    concurrency: int = 4,
+) -> str:
+    """Create Monday.com items from the rows of a CSV or NDJSON file on the server.
+
+    Rows are matched to columns by column ID or title. Rows with a parent_item_id become sub-items.
+    Calling again with the same file skips rows that were already created and retries failed ones.
+
+    Args:
+        boardId: Monday.com Board ID to import into.
+        path: Path of the CSV or NDJSON file, relative to the server's import directory.
+        groupId: Group ID for rows without a group_id field. Default is the board's top group.
+        mapping: Optional source field to column ID mapping; targets may also be name, group_id or parent_item_id.
+        batchSize: Number of items created per request. Default is 25.
+        concurrency: Number of requests in flight at once, at most 8. Default is 4.
+    """
+    try:
+        client = get_monday_client()
+        result = await run_upstream(
+            client,
+            handle_monday_import_items(
+                boardId, path, client, groupId, mapping, batchSize, concurrency
+            ),
+            cost=clamp_concurrency(concurrency),
+        )
+        return result[0].text
+    except Exception as e:
+        return f"Error importing items: {e}"
+
+
+@mcp.tool()
+async def monday_get_board_changes(boardId: str, since: Optional[str] = None) -> str:
+    """Get the items of a Monday.com board that were created, changed, moved, archived or deleted since a watermark.
+
+    Each changed item is reported once with its latest values. Pass the returned watermark as `since` on the next call.
+
+    Args:
+        boardId: Monday.com Board ID.
+        since: Watermark returned by the previous call, or an ISO 8601 timestamp. If omitted, only the current watermark is returned.
+    """
+    try:
+        client = get_monday_client()
+        result = await run_upstream(
+            client, handle_monday_get_board_changes(boardId, client, since)
+        )
+        return result[0].text
+    except Exception as e:
+        return f"Error getting board changes: {e}"
+
+
+@mcp.resource(BOARDS_URI, mime_type="application/json")
+async def boards_resource() -> str:
+    """All Monday.com Boards, by ID and name."""
+    client = get_monday_client()
+    return await run_upstream(client, handle_read_resource(BOARDS_URI, client))
+
+
+@mcp.resource(BOARD_COLUMNS_URI, mime_type="application/json")
+async def board_columns_resource(board_id: str) -> str:
+    """The Columns of a Monday.com Board, with their labels."""
+    client = get_monday_client()
+    uri = BOARD_COLUMNS_URI.format(board_id=board_id)
+    return await run_upstream(client, handle_read_resource(uri, client))
+
+
+@mcp.resource(BOARD_GROUPS_URI, mime_type="application/json")
+async def board_groups_resource(board_id: str) -> str:
+    """The Groups of a Monday.com Board."""
+    client = get_monday_client()
+    uri = BOARD_GROUPS_URI.format(board_id=board_id)
+    return await run_upstream(client, handle_read_resource(uri, client))
+
+
+@mcp._mcp_server.subscribe_resource()
+async def subscribe_resource(uri: AnyUrl) -> None:
+    resource_subscriptions.subscribe(
+        str(uri), mcp._mcp_server.request_context.session, get_monday_client()
+    )
+
+
+@mcp._mcp_server.unsubscribe_resource()
+async def unsubscribe_resource(uri: AnyUrl) -> None:
+    resource_subscriptions.unsubscribe(
+        str(uri), mcp._mcp_server.request_context.session
+    )
+
+
+_get_capabilities = mcp._mcp_server.get_capabilities
+
+
+def _get_capabilities_with_subscribe(*args: Any, **kwargs: Any):
+    # The MCP server always advertises ``subscribe: false``, even with handlers.
+    capabilities = _get_capabilities(*args, **kwargs)
+    if capabilities.resources is not None:
+        capabilities.resources.subscribe = True
+    return capabilities
+
+
+mcp._mcp_server.get_capabilities = _get_capabilities_with_subscribe
+
+
+def http_transport_kwargs() -> Dict[str, Any]:
+    """Extra ``run_async`` arguments for the HTTP transport, from the environment.
+
+    With ``FASTMCP_STATELESS_HTTP`` enabled, MCP sessions are kept in the store
+    configured by ``MCP_SESSION_STORE`` instead of process memory.
+    """
+    if os.getenv("FASTMCP_STATELESS_HTTP", "false").lower() not in ("1", "true", "yes"):
+        return {}
+
+    from starlette.middleware import Middleware
+
+    from mcp_server_monday.sessions import SessionMiddleware, create_session_store
+
+    store_url = os.getenv("MCP_SESSION_STORE", "memory://")
+    ttl = float(os.getenv("MCP_SESSION_TTL", "3600"))
+    logger.info(f"Stateless HTTP mode, sessions stored in {store_url.split('@')[-1]}")
+    return {
+        "stateless_http": True,
+        "middleware": [
+            Middleware(
+                SessionMiddleware, store=create_session_store(store_url), ttl=ttl
+            )
+        ],
+    }
+
+
 def main():
     """Entry point for the FastMCP server."""
     asyncio.run(run_server())
 
 
 async def run_server():
-    """Run the FastMCP server with HTTP streaming transport."""
+    """Run the FastMCP server with HTTP streaming (default) or stdio transport."""
     # Configuration from environment variables
+    transport = os.getenv("FASTMCP_TRANSPORT", "http")
+    if os.getenv("MONDAY_WARMUP", "false").lower() in ("1", "true", "yes"):
+        threading.Thread(target=warm_up, name="warm-up", daemon=True).start()
+
+    if transport == "stdio":
+        await mcp.run_async(transport="stdio", show_banner=False)
+        return
+
     host = os.getenv("FASTMCP_HOST", "0.0.0.0")
     port = int(os.getenv("FASTMCP_PORT", "8000"))
     path = os.getenv("FASTMCP_PATH", "/api/mcp/")
+    workers = int(os.getenv("FASTMCP_WORKERS", "1"))
 
     logger.info("Starting Monday.com FastMCP server with HTTP streaming transport")
     logger.info(f"Server will be available at http://{host}:{port}{path}")
 
-    global monday_client
-    monday_client = MondayClient(MONDAY_API_KEY)
-    await mcp.run_async(transport="http", host=host, port=port, path=path)
+    if workers > 1:
+        from mcp_server_monday.workers import run_workers
+
+        await run_workers(workers, host, port, path)
+        return
+
+    if MONDAY_API_KEY:
+        get_monday_client()
+    await mcp.run_async(
+        transport="http", host=host, port=port, path=path, **http_transport_kwargs()
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,220 @@
+"""Idempotency keys for the tools that create things on Monday.com.
+
+A creating tool called with an ``idempotencyKey`` stores its result under that
+key (scoped to the API key and tool). A retry with the same key returns the
+stored result without calling Monday.com; a retry arriving while the first call
+is still running waits for it instead of creating a duplicate, and runs the
+call itself if the first call is cancelled. Failed calls, including those whose
+handlers return an error text instead of raising, are not stored, so they can
+be retried.
+
+Results are kept in a bounded store configured by ``MONDAY_IDEMPOTENCY_STORE``:
+
+- ``memory://`` keeps them in process memory.
+- ``sqlite:///path/to/idempotency.db`` shares them between the processes on a
+  host and keeps them across restarts.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+
+from mcp_server_monday.constants import (
+    MONDAY_IDEMPOTENCY_MAX_ENTRIES,
+    MONDAY_IDEMPOTENCY_STORE,
+    MONDAY_IDEMPOTENCY_TTL,
+)
+
+
+# Results starting with these are errors reported by the handlers as text.
+ERROR_PREFIXES = ("Error ", "Invalid column values:", "You can set either")
+
+
+class IdempotencyConflict(ValueError):
+    """An idempotency key was reused with different arguments."""
+
+
+class IdempotencyStore:
+    """Interface of a result store. Entries are ``(arguments digest, result)``."""
+
+    def get(self, key: str) -> Optional[tuple[str, str]]:
+        raise NotImplementedError
+
+    def set(self, key: str, digest: str, result: str) -> None:
+        raise NotImplementedError
+
+
+class InMemoryIdempotencyStore(IdempotencyStore):
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, str, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[tuple[str, str]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.time():
+                return None
+            return entry[1], entry[2]
+
+    def set(self, key: str, digest: str, result: str) -> None:
+        with self._lock:
+            self._entries[key] = (time.time() + self.ttl, digest, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class SqliteIdempotencyStore(IdempotencyStore):
+    def __init__(self, path: str, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS idempotency_keys ("
+                "key TEXT PRIMARY KEY, digest TEXT NOT NULL, result TEXT NOT NULL, "
+                "expires_at REAL NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[tuple[str, str]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT digest, result FROM idempotency_keys "
+                "WHERE key = ? AND expires_at >= ?",
+                (key, time.time()),
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def set(self, key: str, digest: str, result: str) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO idempotency_keys "
+                "(key, digest, result, expires_at) VALUES (?, ?, ?, ?)",
+                (key, digest, result, now + self.ttl),
+            )
+            self._conn.execute(
+                "DELETE FROM idempotency_keys WHERE expires_at < ? OR key IN ("
+                "SELECT key FROM idempotency_keys ORDER BY expires_at DESC "
+                "LIMIT -1 OFFSET ?)",
+                (now, self.max_entries),
+            )
+
+
+def create_idempotency_store(
+    url: str,
+    max_entries: int = MONDAY_IDEMPOTENCY_MAX_ENTRIES,
+    ttl: float = MONDAY_IDEMPOTENCY_TTL,
+) -> IdempotencyStore:
+    """Build a store from a ``memory://`` or ``sqlite://`` URL."""
+    if url.startswith("memory://"):
+        return InMemoryIdempotencyStore(max_entries, ttl)
+    if url.startswith("sqlite://"):
+        path = url[len("sqlite:///") :] or ":memory:"
+        return SqliteIdempotencyStore(path, max_entries, ttl)
+    raise ValueError(f"Unsupported idempotency store URL: {url}")
+
+
+class IdempotencyCache:
+    """Runs calls at most once per key, sharing the result with retries."""
+
+    def __init__(self, store: IdempotencyStore):
+        self.store = store
+        self._in_flight: dict[str, tuple[str, asyncio.Future]] = {}
+        self.calls = 0
+        self.replays = 0
+        self.waits = 0
+
+    async def run(
+        self, key: str, arguments: Any, call: Callable[[], Awaitable[str]]
+    ) -> str:
+        digest = hashlib.sha256(
+            json.dumps(arguments, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        while (in_flight := self._in_flight.get(key)) is not None:
+            if in_flight[0] != digest:
+                raise IdempotencyConflict(_conflict_message(key))
+            self.waits += 1
+            try:
+                return await asyncio.shield(in_flight[1])
+            except asyncio.CancelledError:
+                # Only the first call was cancelled: run the call in its place.
+                if not in_flight[1].cancelled() or _cancelling():
+                    raise
+
+        stored = self.store.get(key)
+        if stored is not None:
+            if stored[0] != digest:
+                raise IdempotencyConflict(_conflict_message(key))
+            self.replays += 1
+            return stored[1]
+
+        self.calls += 1
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = (digest, future)
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Only waiting retries care about the error.
+            future.exception()
+            raise
+        else:
+            if not result.startswith(ERROR_PREFIXES):
+                self.store.set(key, digest, result)
+            future.set_result(result)
+            return result
+        finally:
+            del self._in_flight[key]
+
+    def metrics(self) -> dict[str, int]:
+        return {
+            "calls": self.calls,
+            "replays": self.replays,
+            "waits": self.waits,
+            "in_flight": len(self._in_flight),
+        }
+
+
+def _cancelling() -> bool:
+    """Whether the current task itself is being cancelled."""
+    task = asyncio.current_task()
+    return bool(task is not None and getattr(task, "cancelling", lambda: 0)())
+
+
+def _conflict_message(key: str) -> str:
+    return (
+        f"Idempotency key {key.split(':', 2)[-1]!r} was already used "
+        "with different arguments"
+    )
+
+
+_cache: Optional[IdempotencyCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_idempotency_cache() -> IdempotencyCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = IdempotencyCache(
+                    create_idempotency_store(MONDAY_IDEMPOTENCY_STORE)
+                )
+    return _cache
+
+
+def idempotency_metrics() -> dict[str, int]:
+    return _cache.metrics() if _cache is not None else {}
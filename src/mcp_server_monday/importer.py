@@ -0,0 +1,368 @@
+"""Resumable bulk import of CSV/NDJSON rows into a Monday.com board.
+
+Rows are read from the source file as a stream and mapped onto the board's
+columns by column ID or title, using the cached column schema, and their values
+are encoded like those of ``monday-create-item``; a row that does not fit the
+columns is journaled as failed without being sent. Values of read-only columns
+(such as formulas in a board export) are left out. Items are created in aliased
+multi-mutation batches, several batches at a time.
+
+Every outcome is appended to ``<source>.journal`` (row key -> created item ID),
+so running the same import again skips rows that were already created and
+only retries the ones that failed. Rows are keyed by their ``id`` field when
+present (as in files written by the board export), else by their line number.
+
+A row with a ``parent_item_id`` becomes a sub-item. If that ID names another
+row of the same file, the sub-item is created under the item made from it.
+
+Imports started through the MCP tool read only files under
+``MONDAY_IMPORT_DIR``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+from mcp import types
+
+from mcp_server_monday.batch import (
+    DEFAULT_BATCH_SIZE,
+    clamp_concurrency,
+    execute_aliased,
+    graphql_string,
+)
+from mcp_server_monday.cancellation import bind
+from mcp_server_monday.columns import (
+    READ_ONLY_TYPES,
+    ColumnValueError,
+    board_schema,
+    encode_column_values,
+)
+from mcp_server_monday.constants import MONDAY_IMPORT_DIR
+from mcp_server_monday.export import resolve_in
+from mcp_server_monday.snapshot import mark_items_dirty
+
+if TYPE_CHECKING:
+    from monday import MondayClient
+
+logger = logging.getLogger("fastmcp-server-monday.import")
+
+# Fields with a meaning of their own rather than a column value.
+NAME_FIELD = "name"
+GROUP_FIELD = "group_id"
+PARENT_FIELD = "parent_item_id"
+RESERVED_FIELDS = {"id", NAME_FIELD, GROUP_FIELD, PARENT_FIELD, "group_title"}
+RESERVED_FIELDS |= {"created_at", "updated_at"}
+MAX_REPORTED_ERRORS = 100
+
+
+def read_rows(path: Path) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Yield ``(row_key, row)`` from a CSV or NDJSON file, one row at a time."""
+    with open(path, encoding="utf-8", newline="") as file:
+        if path.suffix.lower() == ".csv":
+            rows = csv.DictReader(file)
+        else:
+            rows = (json.loads(line) for line in file if line.strip())
+        for line_number, row in enumerate(rows, start=1):
+            yield str(row.get("id") or f"line:{line_number}"), row
+
+
+def build_mapping(
+    columns: list[dict[str, Any]], mapping: Optional[dict[str, str]] = None
+) -> dict[str, str]:
+    """Map source fields to column IDs: explicit mapping, then column ID, then title."""
+    resolved = {column["id"]: column["id"] for column in columns}
+    for column in columns:
+        resolved.setdefault(column["title"].lower(), column["id"])
+    for field, target in (mapping or {}).items():
+        resolved[field.lower()] = target
+    return resolved
+
+
+def row_column_values(row: dict[str, Any], mapping: dict[str, str]) -> dict[str, Any]:
+    """The raw ``{column ID: value}`` of a row."""
+    values = {}
+    for field, value in row.items():
+        if field in RESERVED_FIELDS or field == "column_values":
+            continue
+        column_id = mapping.get(field) or mapping.get(field.lower())
+        if column_id and value not in (None, ""):
+            values[column_id] = value
+    # Rows written by the NDJSON export nest their values.
+    for column_id, column in (row.get("column_values") or {}).items():
+        value = column.get("value") if isinstance(column, dict) else column
+        if value not in (None, "", {}):
+            values[column_id] = value
+    return values
+
+
+class _Journal:
+    def __init__(self, path: Path):
+        self.path = path
+        self.created: dict[str, str] = {}
+        if path.exists():
+            with open(path, encoding="utf-8") as file:
+                for line in file:
+                    entry = json.loads(line)
+                    if entry.get("item_id"):
+                        self.created[entry["row"]] = entry["item_id"]
+        self.file = open(path, "a", encoding="utf-8")
+
+    def record(self, row_key: str, item_id: Optional[str], error: Optional[str]):
+        if item_id:
+            self.created[row_key] = item_id
+        self.file.write(
+            json.dumps({"row": row_key, "item_id": item_id, "error": error}) + "\n"
+        )
+        # A created item missing from the journal would be created again.
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def encode_row(
+    row: dict[str, Any], columns: list[dict[str, Any]], mapping: dict[str, str]
+) -> dict[str, Any]:
+    """The encoded column values of a row; raises ``ColumnValueError``."""
+    read_only = {c["id"] for c in columns if c.get("type") in READ_ONLY_TYPES}
+    values = {
+        column_id: value
+        for column_id, value in row_column_values(row, mapping).items()
+        if column_id not in read_only
+    }
+    return encode_column_values(columns, values)
+
+
+def _mutation(
+    board_id: str,
+    row: dict[str, Any],
+    column_values: dict[str, Any],
+    default_group_id: Optional[str],
+    parent_item_id: Optional[str],
+) -> str:
+    name = graphql_string(str(row.get(NAME_FIELD) or ""))
+    column_values = graphql_string(column_values)
+    if parent_item_id:
+        return (
+            f"create_subitem (parent_item_id: {parent_item_id}, item_name: {name}, "
+            f"column_values: {column_values}) {{ id }}"
+        )
+    group_id = row.get(GROUP_FIELD) or default_group_id
+    group = f"group_id: {graphql_string(group_id)}, " if group_id else ""
+    return (
+        f"create_item (board_id: {board_id}, {group}item_name: {name}, "
+        f"column_values: {column_values}) {{ id }}"
+    )
+
+
+def import_items(
+    monday_client: MondayClient,
+    board_id: str,
+    path: str,
+    group_id: Optional[str] = None,
+    mapping: Optional[dict[str, str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    concurrency: int = 4,
+) -> dict[str, Any]:
+    """Create an item or sub-item per row of ``path``, skipping rows already journaled."""
+    source = Path(path)
+    concurrency = clamp_concurrency(concurrency)
+    columns = board_schema(monday_client, board_id)
+    resolved_mapping = build_mapping(columns, mapping)
+    # Loaded at the first sub-item row.
+    subitem_schema: list[tuple[list[dict[str, Any]], dict[str, str]]] = []
+    renames = {
+        field: target
+        for field, target in (mapping or {}).items()
+        if target in (NAME_FIELD, GROUP_FIELD, PARENT_FIELD)
+    }
+    journal = _Journal(source.with_name(source.name + ".journal"))
+
+    started_at = time.monotonic()
+    stats = {"created": 0, "skipped": 0, "failed": 0}
+    errors: list[dict[str, str]] = []
+    seen_rows: set[str] = set()
+    created_ids: list[str] = []
+    # Sub-item rows waiting for their parent row to be created.
+    waiting: list[tuple[str, dict[str, Any]]] = []
+    batch: list[tuple[str, str]] = []
+    in_flight: dict[Future, list[tuple[str, str]]] = {}
+
+    def collect(futures) -> None:
+        for future in futures:
+            rows = in_flight.pop(future)
+            try:
+                results = future.result()
+            except Exception as e:
+                results = [(None, str(e))] * len(rows)
+            for (row_key, _), (data, error) in zip(rows, results):
+                item_id = data.get("id") if data else None
+                if item_id:
+                    journal.record(row_key, item_id, None)
+                    created_ids.append(item_id)
+                    stats["created"] += 1
+                else:
+                    fail(row_key, error)
+
+    def fail(row_key: str, error: Optional[str]) -> None:
+        journal.record(row_key, None, error)
+        stats["failed"] += 1
+        if len(errors) < MAX_REPORTED_ERRORS:
+            errors.append({"row": row_key, "error": error})
+
+    def submit(executor: ThreadPoolExecutor) -> None:
+        nonlocal batch
+        if not batch:
+            return
+        while len(in_flight) >= concurrency:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            collect(done)
+        fields = [mutation for _, mutation in batch]
+        in_flight[executor.submit(bind(execute_aliased), monday_client, fields)] = batch
+        batch = []
+
+    def enqueue(executor: ThreadPoolExecutor, row_key: str, row: dict[str, Any]):
+        parent = row.get(PARENT_FIELD)
+        parent_item_id = None
+        if parent:
+            parent = str(parent)
+            if parent in journal.created:
+                parent_item_id = journal.created[parent]
+            elif parent in seen_rows:
+                waiting.append((row_key, row))
+                return
+            else:
+                # Not a row of this file: an existing Monday.com item ID.
+                parent_item_id = parent
+        row_columns, row_mapping = columns, resolved_mapping
+        if parent_item_id:
+            if not subitem_schema:
+                schema = board_schema(monday_client, board_id, subitems=True)
+                subitem_schema.append((schema, build_mapping(schema, mapping)))
+            row_columns, row_mapping = subitem_schema[0]
+        try:
+            column_values = encode_row(row, row_columns, row_mapping)
+        except ColumnValueError as e:
+            fail(row_key, f"Invalid column values: {e}")
+            return
+        mutation = _mutation(board_id, row, column_values, group_id, parent_item_id)
+        batch.append((row_key, mutation))
+        if len(batch) >= batch_size:
+            submit(executor)
+
+    def release_waiting(executor: ThreadPoolExecutor, final: bool = False) -> None:
+        ready = [e for e in waiting if str(e[1][PARENT_FIELD]) in journal.created]
+        for entry in ready:
+            waiting.remove(entry)
+            enqueue(executor, *entry)
+        if final:
+            for row_key, row in waiting:
+                fail(row_key, f"Parent row {row[PARENT_FIELD]} was not created")
+            waiting.clear()
+
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for row_key, row in read_rows(source):
+                row = {renames.get(field, field): value for field, value in row.items()}
+                seen_rows.add(row_key)
+                if row_key in journal.created:
+                    stats["skipped"] += 1
+                    continue
+                created_before = len(journal.created)
+                enqueue(executor, row_key, row)
+                if waiting and len(journal.created) != created_before:
+                    release_waiting(executor)
+            # Drain: finish in-flight batches, then the sub-items they unblock.
+            while batch or in_flight or waiting:
+                submit(executor)
+                if in_flight:
+                    collect(wait(in_flight, return_when=FIRST_COMPLETED)[0])
+                    release_waiting(executor)
+                elif waiting:
+                    before = len(waiting)
+                    release_waiting(executor)
+                    if len(waiting) == before and not batch:
+                        release_waiting(executor, final=True)
+    finally:
+        journal.close()
+        if created_ids:
+            mark_items_dirty(created_ids, board_id=board_id)
+
+    elapsed = time.monotonic() - started_at
+    processed = stats["created"] + stats["failed"]
+    return {
+        **stats,
+        "seconds": round(elapsed, 3),
+        "rows_per_second": round(processed / elapsed, 1) if elapsed else None,
+        "journal": str(journal.path),
+        "errors": errors,
+    }
+
+
+async def handle_monday_import_items(
+    boardId: str,
+    path: str,
+    monday_client: MondayClient,
+    groupId: Optional[str] = None,
+    mapping: Optional[dict[str, str]] = None,
+    batchSize: int = DEFAULT_BATCH_SIZE,
+    concurrency: int = 4,
+) -> list[types.TextContent]:
+    """Create Monday.com items from the rows of a local CSV or NDJSON file."""
+    source = resolve_in(MONDAY_IMPORT_DIR, path)
+    summary = import_items(
+        monday_client, boardId, str(source), groupId, mapping, batchSize, concurrency
+    )
+    return [
+        types.TextContent(
+            type="text",
+            text=f"Imported {path} into Monday.com board {boardId}. {json.dumps(summary)}",
+        )
+    ]
+
+
+def cli(argv: Optional[list[str]] = None) -> None:
+    """``mcp-server-monday import`` subcommand."""
+    from mcp_server_monday.client import create_monday_client
+    from mcp_server_monday.constants import MONDAY_API_KEY
+
+    parser = argparse.ArgumentParser(
+        prog="mcp-server-monday import",
+        description="Create Monday.com items from a CSV or NDJSON file. Re-run the "
+        "same command to retry failed rows; created rows are skipped.",
+    )
+    parser.add_argument("board_id")
+    parser.add_argument("path")
+    parser.add_argument("--group-id")
+    parser.add_argument(
+        "--map",
+        action="append",
+        default=[],
+        metavar="FIELD=COLUMN_ID",
+        help="Map a source field to a column ID (or to name/group_id/parent_item_id)",
+    )
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    summary = import_items(
+        create_monday_client(MONDAY_API_KEY),
+        args.board_id,
+        args.path,
+        args.group_id,
+        dict(pair.split("=", 1) for pair in args.map),
+        args.batch_size,
+        args.concurrency,
+    )
+    print(json.dumps(summary))
@@ -1,23 +1,75 @@
 from __future__ import annotations
 
 import json
-from typing import Optional
+import threading
+import time
+import weakref
+from datetime import datetime, timezone
+from html.parser import HTMLParser
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Optional,
+    TypeVar,
+    Union,
+)
 
 from mcp import types
-from monday import MondayClient
-
-from mcp_server_monday.constants import MONDAY_WORKSPACE_URL
-
-
-async def handle_monday_list_items_in_groups(
-    boardId: str,
-    groupIds: list[str],
-    limit: int,
-    monday_client: MondayClient,
-    cursor: Optional[str] = None,
-) -> list[types.TextContent]:
-    """List all items in the specified groups of a Monday.com board"""
 
+from mcp_server_monday.cache import TTLCache, cache_for
+from mcp_server_monday.coalesce import coalescer_for
+from mcp_server_monday.columns import (
+    ColumnValueError,
+    compact_items,
+    encode_column_values,
+    schema_for,
+)
+from mcp_server_monday.constants import MONDAY_CACHE_MAX_ENTRIES, MONDAY_WORKSPACE_URL
+from mcp_server_monday.pagesize import (
+    MIN_PAGE_SIZE,
+    budget_remaining,
+    is_page_failure,
+    page_sizer_for,
+)
+from mcp_server_monday.paging import StreamedItemsPage, parse_items_page
+from mcp_server_monday.prefetch import (
+    discard_pages,
+    has_spare_capacity,
+    prefetcher_for,
+)
+from mcp_server_monday.snapshot import mark_items_dirty
+
+if TYPE_CHECKING:
+    from monday import MondayClient
+
+T = TypeVar("T")
+
+_update_caches: "weakref.WeakKeyDictionary[Any, TTLCache]" = weakref.WeakKeyDictionary()
+_update_caches_lock = threading.Lock()
+
+_UPDATE_FIELDS = """
+    id
+    body
+    created_at
+    updated_at
+    creator {
+        id
+        name
+    }
+    assets {
+        id
+        name
+        url
+    }
+"""
+
+
+def _items_in_groups_query(
+    boardId: str, groupIds: list[str], limit: int, cursor: Optional[str] = None
+) -> str:
     if groupIds and not cursor:
         formatted_group_ids = ", ".join([f'"{group_id}"' for group_id in groupIds])
         items_page_params = f"""
@@ -31,8 +83,12 @@ async def handle_monday_list_items_in_groups(
         items_page_params = f'cursor: "{cursor}"'
 
     items_page_params += f" limit: {limit}"
-    query = f"""
+    return f"""
     query {{
+        complexity {{
+            query
+            after
+        }}
         boards (ids: {boardId}) {{
             items_page ({items_page_params}) {{
                 cursor
@@ -45,6 +101,7 @@ async def handle_monday_list_items_in_groups(
                     }}
                     column_values {{
                         id
+                        type
                         text
                         value
                     }}
@@ -54,13 +111,71 @@ async def handle_monday_list_items_in_groups(
     }}
     """
 
-    response = monday_client.custom._query(query)
-    return [
-        types.TextContent(
-            type="text",
-            text=f"Items in groups {groupIds} of Monday.com board {boardId}: {json.dumps(response)}",
+
+async def handle_monday_list_items_in_groups(
+    boardId: str,
+    groupIds: list[str],
+    limit: int,
+    monday_client: MondayClient,
+    cursor: Optional[str] = None,
+    adaptive: bool = False,
+) -> list[types.TextContent]:
+    """List all items in the specified groups of a Monday.com board
+
+    With ``adaptive`` set, ``limit`` is the page size suggested by the board's
+    page sizer, and a page that fails for being too large is retried smaller.
+    """
+
+    coalescer_for(monday_client).flush(board_id=boardId)
+    prefetcher = prefetcher_for(monday_client)
+    sizer = page_sizer_for(monday_client)
+    page_key = "auto" if adaptive else limit
+    prefetched = prefetcher.take(f"{boardId}:{page_key}:{cursor}") if cursor else None
+    while True:
+        # Items are rendered one at a time as they are parsed, so the page is
+        # never held both as objects and as one JSON document.
+        parts = [
+            f"Items in groups {groupIds} of Monday.com board {boardId}: "
+            '{"data": {"boards": [{"items_page": {"items": ['
+        ]
+        started_at = time.monotonic()
+        try:
+            if prefetched is not None:
+                items, next_cursor = parse_items_page(prefetched)
+            else:
+                query = _items_in_groups_query(boardId, groupIds, limit, cursor)
+                items = page = StreamedItemsPage(monday_client, query)
+            for i, item in enumerate(items):
+                if i:
+                    parts.append(", ")
+                parts.append(json.dumps(compact_items([item])[0]))
+        except Exception as e:
+            if not adaptive or limit <= MIN_PAGE_SIZE or not is_page_failure(e):
+                raise
+            limit = sizer.failed(boardId, limit)
+            continue
+        break
+    if prefetched is None:
+        next_cursor = page.cursor
+        sizer.observe(
+            boardId,
+            limit,
+            time.monotonic() - started_at,
+            (page.complexity or {}).get("query"),
         )
-    ]
+    parts.append(f'], "cursor": {json.dumps(next_cursor)}}}}}]}}}}')
+
+    if next_cursor:
+        if adaptive:
+            limit = sizer.suggest(boardId, budget_remaining(monday_client))
+        next_query = _items_in_groups_query(boardId, groupIds, limit, next_cursor)
+        prefetcher.prefetch(
+            f"{boardId}:{page_key}:{next_cursor}",
+            lambda: monday_client.custom._query(next_query),
+            spare=has_spare_capacity(monday_client),
+        )
+
+    return [types.TextContent(type="text", text="".join(parts))]
 
 
 async def handle_monday_list_subitems_in_items(
@@ -83,13 +198,18 @@ async def handle_monday_list_subitems_in_items(
                     }}
                     column_values {{
                         id
+                        type
                         text
                         value
                     }}
                 }}
             }}
         }}"""
+    # Sub-item IDs are not known up front, so send every pending write.
+    coalescer_for(monday_client).flush()
     response = monday_client.custom._query(get_subitems_in_item_query)
+    for item in response.get("data", {}).get("items") or []:
+        compact_items(item.get("subitems") or [])
 
     return [
         types.TextContent(
@@ -108,6 +228,18 @@ async def handle_monday_create_item(
     columnValues: Optional[dict] = None,
 ) -> list[types.TextContent]:
     """Create a new item in a Monday.com Board. Optionally, specify the parent Item ID to create a Sub-item."""
+    if columnValues:
+        schema = schema_for(
+            monday_client, boardId, columnValues, subitems=parentItemId is not None
+        )
+        if schema:
+            try:
+                columnValues = encode_column_values(schema, columnValues)
+            except ColumnValueError as e:
+                return [
+                    types.TextContent(type="text", text=f"Invalid column values: {e}")
+                ]
+
     if parentItemId is None and groupId is not None:
         response = monday_client.items.create_item(
             board_id=boardId,
@@ -132,6 +264,8 @@ async def handle_monday_create_item(
     try:
         data = response["data"]
         id_key = "create_item" if parentItemId is None else "create_subitem"
+        if parentItemId is None:
+            mark_items_dirty([data[id_key]["id"]], board_id=boardId)
         item_url = f"{MONDAY_WORKSPACE_URL}/boards/{boardId}/pulses/{data.get(id_key).get('id')}"
         return [
             types.TextContent(
@@ -153,10 +287,32 @@ async def handle_monday_update_item(
     itemId: str,
     columnValues: dict[str],
     monday_client: MondayClient,
+    run_upstream: Callable[[Coroutine[Any, Any, T]], Awaitable[T]],
 ):
-    response = monday_client.items.change_multiple_column_values(
-        board_id=boardId, item_id=itemId, column_values=columnValues
+    """Update an item's column values, merged with other updates to it.
+
+    Unlike other handlers this one runs on the event loop: ``run_upstream``
+    runs its blocking parts, so that waiting for other updates to merge with
+    holds neither a worker thread nor a scheduler slot.
+    """
+    # The item may be a sub-item, whose columns live on the sub-items board.
+    encoded = await run_upstream(_encode_update(monday_client, boardId, columnValues))
+    if isinstance(encoded, str):
+        return [types.TextContent(type="text", text=encoded)]
+
+    def send(board_id: str, item_id: str, column_values: dict) -> dict:
+        response = monday_client.items.change_multiple_column_values(
+            board_id=board_id, item_id=item_id, column_values=column_values
+        )
+        # Before the write counts as done, so that a listing that flushed it
+        # does not take a page prefetched before it.
+        discard_pages(board_id)
+        return response
+
+    response = await coalescer_for(monday_client).submit(
+        boardId, itemId, encoded, send, lambda send: run_upstream(_call(send))
     )
+    mark_items_dirty([itemId], board_id=boardId)
     return [
         types.TextContent(
             type="text", text=f"Updated Monday.com item. {json.dumps(response)}"
@@ -164,6 +320,21 @@ async def handle_monday_update_item(
     ]
 
 
+async def _encode_update(
+    monday_client: MondayClient, boardId: str, columnValues: dict
+) -> Union[dict, str]:
+    """The encoded column values, or the text explaining why they are invalid."""
+    schema = schema_for(monday_client, boardId, columnValues)
+    try:
+        return encode_column_values(schema, columnValues)
+    except ColumnValueError as e:
+        return f"Invalid column values: {e}"
+
+
+async def _call(fn: Callable[[], T]) -> T:
+    return fn()
+
+
 async def handle_monday_create_update_on_item(
     itemId: str,
     updateText: str,
@@ -183,7 +354,36 @@ async def handle_monday_get_item_by_id(
 ) -> list[types.TextContent]:
     """Fetch specific Monday.com items by their IDs"""
     try:
-        response = monday_client.items.fetch_items_by_id(ids=itemId)
+        coalescer_for(monday_client).flush(
+            item_ids=[i.strip() for i in itemId.split(",")]
+        )
+        query = f"""
+            query {{
+                items (ids: [{itemId}]) {{
+                    id
+                    name
+                    group {{
+                        id
+                        title
+                    }}
+                    column_values {{
+                        id
+                        type
+                        text
+                        value
+                    }}
+                }}
+            }}
+            """
+        # Always read fresh; the last result is only kept to answer with
+        # when Monday.com cannot be reached.
+        response = cache_for(monday_client).get_or_load(
+            f"items:{itemId}",
+            lambda: monday_client.custom._query(query),
+            max_age=0,
+            background=False,
+        )
+        compact_items(response.get("data", {}).get("items") or [])
 
         return [
             types.TextContent(
@@ -200,29 +400,177 @@ async def handle_monday_get_item_by_id(
         ]
 
 
+class _TextExtractor(HTMLParser):
+    BLOCK_TAGS = {"p", "div", "br", "li", "tr", "h1", "h2", "h3", "h4", "blockquote"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: list[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        self.parts.append(data)
+
+
+def update_cache_for(owner: Any) -> TTLCache:
+    """Return the update cache belonging to ``owner`` (usually a MondayClient).
+
+    Holds updates and their rendered text, keyed by update ID and
+    ``updated_at``. They only change when the update is edited, so they are
+    kept much longer than API responses.
+    """
+    with _update_caches_lock:
+        cache = _update_caches.get(owner)
+        if cache is None:
+            cache = _update_caches[owner] = TTLCache(
+                24 * 60 * 60, MONDAY_CACHE_MAX_ENTRIES * 4
+            )
+        return cache
+
+
+def update_plain_text(
+    monday_client: MondayClient,
+    update: dict[str, Any],
+    max_length: Optional[int] = None,
+) -> str:
+    """HTML-stripped body of an update, cached by update ID.
+
+    The cache key includes ``updated_at`` so that an edited update is rendered
+    again instead of serving its old text.
+    """
+    cache = update_cache_for(monday_client)
+    key = f"text:{update['id']}:{update.get('updated_at')}"
+    text = cache.get(key)
+    if text is None:
+        extractor = _TextExtractor()
+        extractor.feed(update.get("body") or "")
+        extractor.close()
+        lines = (
+            " ".join(line.split()) for line in "".join(extractor.parts).split("\n")
+        )
+        text = "\n".join(line for line in lines if line)
+        cache.set(key, text)
+    if max_length and len(text) > max_length:
+        return text[: max_length - 1] + "…"
+    return text
+
+
+def _is_after(timestamp: Optional[str], since: datetime) -> bool:
+    if not timestamp:
+        return True
+    moment = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment > since
+
+
+def _format_update(
+    monday_client: MondayClient,
+    update: dict[str, Any],
+    plain_text: bool,
+    max_length: Optional[int],
+) -> str:
+    creator = update.get("creator") or {}
+    if plain_text:
+        body = update_plain_text(monday_client, update, max_length)
+    else:
+        body = update["body"]
+    lines = [
+        f"Update ID: {update['id']}",
+        f"Created: {update['created_at']}",
+        f"Creator: {creator.get('name')} (ID: {creator.get('id')})",
+        f"Body: {body}",
+    ]
+    # Add information about attached files if present
+    if update.get("assets"):
+        lines.append("\nAttached Files:")
+        lines.extend(f"- {asset['name']}: {asset['url']}" for asset in update["assets"])
+    return "\n".join(lines)
+
+
 async def handle_monday_get_item_updates(
-    itemId: str,
+    itemId: Optional[str],
     monday_client: MondayClient,
     limit: int = 25,
+    itemIds: Optional[list[str]] = None,
+    page: int = 1,
+    since: Optional[str] = None,
+    plainText: bool = False,
+    maxLength: Optional[int] = None,
 ) -> list[types.TextContent]:
-    """Get updates for a specific item in Monday.com"""
+    """Get updates for one or more items in Monday.com, a page at a time.
 
+    With ``since`` (an ISO 8601 timestamp) only updates posted after it are
+    returned; updates come newest first, so paging stops at the first page
+    that reaches back past it. Updates are cached by ID and ``updated_at``:
+    once an item's updates were fetched, or with ``since``, only their IDs and
+    dates are listed, and the bodies of new or edited ones fetched after.
+    """
+    item_ids = list(itemIds or [])
+    if itemId and itemId not in item_ids:
+        item_ids.insert(0, itemId)
+    if not item_ids:
+        raise ValueError("itemId or itemIds is required")
+    since_moment = None
+    if since:
+        since_moment = datetime.fromisoformat(since.replace("Z", "+00:00"))
+        if since_moment.tzinfo is None:
+            since_moment = since_moment.replace(tzinfo=timezone.utc)
+
+    cache = update_cache_for(monday_client)
+    if since_moment is None and not any(
+        cache.get(f"updates-of:{item_id}") for item_id in item_ids
+    ):
+        # Nothing cached to save: fetch the updates whole in one go.
+        items = _query_updates(monday_client, item_ids, limit, page, _UPDATE_FIELDS)
+        for item in items.values():
+            _cache_updates(cache, item)
+    else:
+        items = _query_updates(
+            monday_client, item_ids, limit, page, "id created_at updated_at"
+        )
+        _fill_updates(monday_client, items, since_moment)
+
+    sections = []
+    for item_id in item_ids:
+        updates = (items.get(item_id) or {}).get("updates") or []
+        more = len(updates) == limit
+        if since_moment is not None:
+            newer = [u for u in updates if "body" in u]
+            more = more and len(newer) == len(updates)
+            updates = newer
+        if not updates:
+            sections.append(f"No updates found for item {item_id}.")
+            continue
+        formatted = "\n\n\n".join(
+            _format_update(monday_client, update, plainText, maxLength)
+            for update in updates
+        )
+        section = f"Updates for item {item_id}:\n\n{formatted}"
+        if more:
+            section += f"\n\nMore updates available: request page {page + 1}."
+        sections.append(section)
+
+    return [types.TextContent(type="text", text="\n\n".join(sections))]
+
+
+def _query_updates(
+    monday_client: MondayClient,
+    item_ids: list[str],
+    limit: int,
+    page: int,
+    fields: str,
+) -> dict[str, dict]:
+    """One page of updates of each item, with ``fields``, by item ID."""
     query = f"""
     query {{
-        items (ids: {itemId}) {{
-            updates (limit: {limit}) {{
-                id
-                body
-                created_at
-                creator {{
-                    id
-                    name
-                }}
-                assets {{
-                    id
-                    name
-                    url
-                }}
+        items (ids: [{", ".join(item_ids)}]) {{
+            id
+            updates (limit: {limit}, page: {page}) {{
+                {fields}
             }}
         }}
     }}
@@ -236,42 +584,67 @@ async def handle_monday_get_item_updates(
         # If no_log param doesn't exist, try with default params
         response = monday_client.custom._query(query)
 
-    if (
-        not response
-        or "data" not in response
-        or not response["data"]["items"]
-        or not response["data"]["items"][0]["updates"]
-    ):
-        return [
-            types.TextContent(type="text", text=f"No updates found for item {itemId}.")
-        ]
+    return {
+        str(item["id"]): item
+        for item in ((response or {}).get("data") or {}).get("items") or []
+    }
 
-    updates = response["data"]["items"][0]["updates"]
 
-    formatted_updates = []
-    for update in updates:
-        update_text = f"Update ID: {update['id']}\n"
-        update_text += f"Created: {update['created_at']}\n"
-        update_text += (
-            f"Creator: {update['creator']['name']} (ID: {update['creator']['id']})\n"
-        )
-        update_text += f"Body: {update['body']}\n"
+def _update_key(update: dict[str, Any]) -> str:
+    return f"update:{update['id']}:{update.get('updated_at')}"
 
-        # Add information about attached files if present
-        if update.get("assets"):
-            update_text += "\nAttached Files:\n"
-            for asset in update["assets"]:
-                update_text += f"- {asset['name']}: {asset['url']}\n"
 
-        update_text += "\n\n"
-        formatted_updates.append(update_text)
+def _cache_updates(cache: TTLCache, item: dict[str, Any]) -> None:
+    for update in item.get("updates") or []:
+        cache.set(_update_key(update), update)
+    cache.set(f"updates-of:{item['id']}", True)
 
-    return [
-        types.TextContent(
-            type="text",
-            text=f"Updates for item {itemId}:\n\n{''.join(formatted_updates)}",
+
+def _fill_updates(
+    monday_client: MondayClient,
+    items: dict[str, dict],
+    since: Optional[datetime],
+) -> None:
+    """Replace listed updates by whole ones, fetching only those not cached.
+
+    Updates created before ``since`` are left as listed (without a body).
+    """
+    cache = update_cache_for(monday_client)
+    missing: dict[str, dict] = {}
+    for item in items.values():
+        updates = item.get("updates") or []
+        for index, update in enumerate(updates):
+            if since is not None and not _is_after(update.get("created_at"), since):
+                continue
+            cached = cache.get(_update_key(update))
+            if cached is not None:
+                updates[index] = cached
+            else:
+                missing[str(update["id"])] = update
+    if missing:
+        response = monday_client.custom._query(
+            f"""
+            query {{
+                updates (ids: [{", ".join(missing)}], limit: {len(missing)}) {{
+                    {_UPDATE_FIELDS}
+                }}
+            }}
+            """
+        )
+        fetched = {
+            str(update["id"]): update
+            for update in ((response or {}).get("data") or {}).get("updates") or []
+        }
+        for item in items.values():
+            updates = item.get("updates") or []
+            for index, update in enumerate(updates):
+                if str(update["id"]) in fetched and "body" not in update:
+                    updates[index] = fetched[str(update["id"])]
+    for item in items.values():
+        _cache_updates(
+            cache,
+            {**item, "updates": [u for u in item.get("updates") or [] if "body" in u]},
         )
-    ]
 
 
 async def handle_monday_move_item_to_group(
@@ -285,7 +658,9 @@ async def handle_monday_move_item_to_group(
         item_id (str): The ID of the item to move.
         group_id (str): The ID of the group to move the item to.
     """
+    coalescer_for(monday_client).flush(item_ids=[item_id])
     item = monday_client.items.move_item_to_group(item_id=item_id, group_id=group_id)
+    mark_items_dirty([item_id])
     return [
         types.TextContent(
             type="text",
@@ -304,7 +679,9 @@ async def handle_monday_delete_item(
         monday_client (MondayClient): The Monday.com client.
         item_id (str): The ID of the item to delete.
     """
+    coalescer_for(monday_client).flush(item_ids=[item_id])
     monday_client.items.delete_item_by_id(item_id=item_id)
+    mark_items_dirty([item_id])
     return [types.TextContent(type="text", text=f"Deleted item {item_id}.")]
 
 
@@ -318,5 +695,7 @@ async def handle_monday_archive_item(
         monday_client (MondayClient): The Monday.com client.
         item_id (str): The ID of the item to archive.
     """
+    coalescer_for(monday_client).flush(item_ids=[item_id])
     monday_client.items.archive_item_by_id(item_id=item_id)
+    mark_items_dirty([item_id])
     return [types.TextContent(type="text", text=f"Archived item {item_id}.")]
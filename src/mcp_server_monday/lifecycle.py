@@ -0,0 +1,174 @@
+"""Moving, archiving, deleting or duplicating many items at once.
+
+The per-item mutations are packed into aliased documents (see ``batch.py``),
+each holding as many as fit the per-query complexity ceiling and a share of
+the budget left for the API key, and several documents (at most
+``batch.MAX_CONCURRENCY``) are sent at a time. Every item gets its own
+outcome, so one failing item does not fail the rest.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Optional
+
+from mcp import types
+
+from mcp_server_monday.batch import clamp_concurrency, execute_aliased, graphql_string
+from mcp_server_monday.cancellation import bind
+from mcp_server_monday.coalesce import coalescer_for
+from mcp_server_monday.pagesize import (
+    BUDGET_SHARE,
+    MAX_QUERY_COMPLEXITY,
+    budget_remaining,
+)
+from mcp_server_monday.snapshot import mark_items_dirty
+
+if TYPE_CHECKING:
+    from monday import MondayClient
+
+ACTIONS = ("move", "archive", "delete", "duplicate")
+# Rough complexity of one mutation of each kind; duplicating copies the
+# item's column values and is the most expensive.
+MUTATION_COMPLEXITY = {
+    "move": 30_000,
+    "archive": 30_000,
+    "delete": 30_000,
+    "duplicate": 100_000,
+}
+MAX_BATCH_SIZE = 50
+DEFAULT_CONCURRENCY = 4
+
+
+def lifecycle_mutation(
+    action: str,
+    item_id: str,
+    group_id: Optional[str] = None,
+    board_id: Optional[str] = None,
+) -> str:
+    if action == "move":
+        return (
+            f"move_item_to_group (item_id: {int(item_id)}, "
+            f"group_id: {graphql_string(group_id)}) {{ id }}"
+        )
+    if action == "archive":
+        return f"archive_item (item_id: {int(item_id)}) {{ id }}"
+    if action == "delete":
+        return f"delete_item (item_id: {int(item_id)}) {{ id }}"
+    return (
+        f"duplicate_item (board_id: {int(board_id)}, item_id: {int(item_id)}, "
+        f"with_updates: false) {{ id }}"
+    )
+
+
+def batch_size(monday_client: MondayClient, action: str) -> int:
+    """How many ``action`` mutations to send in one document."""
+    cost = MUTATION_COMPLEXITY[action]
+    size = min(MAX_BATCH_SIZE, 0.9 * MAX_QUERY_COMPLEXITY / cost)
+    remaining = budget_remaining(monday_client)
+    if remaining is not None:
+        size = min(size, BUDGET_SHARE * remaining / cost)
+    return max(1, int(size))
+
+
+def bulk_item_lifecycle(
+    monday_client: MondayClient,
+    item_ids: list[str],
+    action: str,
+    group_id: Optional[str] = None,
+    board_id: Optional[str] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> dict[str, Any]:
+    """Apply ``action`` to every item and return a per-item outcome."""
+    if action not in ACTIONS:
+        raise ValueError(f"Unknown action {action!r}; use one of {', '.join(ACTIONS)}")
+    if action == "move" and not group_id:
+        raise ValueError("groupId is required to move items")
+    if action == "duplicate" and not board_id:
+        raise ValueError("boardId is required to duplicate items")
+    item_ids = list(dict.fromkeys(str(item_id).strip() for item_id in item_ids))
+    invalid = [item_id for item_id in item_ids if not item_id.isdigit()]
+    if invalid:
+        raise ValueError(f"Invalid item IDs: {', '.join(invalid)}")
+
+    concurrency = clamp_concurrency(concurrency)
+    # Pending column updates must not land on items after they are gone.
+    coalescer_for(monday_client).flush(item_ids=item_ids)
+
+    started_at = time.monotonic()
+    outcomes: dict[str, Any] = {}
+    in_flight: dict[Future, list[str]] = {}
+
+    def collect(futures) -> None:
+        for future in futures:
+            batch = in_flight.pop(future)
+            try:
+                results = future.result()
+            except Exception as e:
+                results = [(None, str(e))] * len(batch)
+            for item_id, (data, error) in zip(batch, results):
+                if error is not None:
+                    outcomes[item_id] = {"id": item_id, "error": error}
+                elif action == "duplicate":
+                    outcomes[item_id] = {"id": item_id, "new_id": str(data["id"])}
+                else:
+                    outcomes[item_id] = {"id": item_id}
+
+    batches = 0
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        position = 0
+        while position < len(item_ids):
+            while len(in_flight) >= concurrency:
+                collect(wait(in_flight, return_when=FIRST_COMPLETED)[0])
+            batch = item_ids[position : position + batch_size(monday_client, action)]
+            position += len(batch)
+            fields = [
+                lifecycle_mutation(action, item_id, group_id, board_id)
+                for item_id in batch
+            ]
+            in_flight[executor.submit(bind(execute_aliased), monday_client, fields)] = (
+                batch
+            )
+            batches += 1
+        while in_flight:
+            collect(wait(in_flight, return_when=FIRST_COMPLETED)[0])
+
+    results = [outcomes[item_id] for item_id in item_ids]
+    succeeded = [result["id"] for result in results if "error" not in result]
+    mark_items_dirty(succeeded)
+    if action == "duplicate":
+        mark_items_dirty(
+            [result["new_id"] for result in results if "new_id" in result],
+            board_id=board_id,
+        )
+    return {
+        "action": action,
+        "succeeded": len(succeeded),
+        "failed": len(results) - len(succeeded),
+        "requests": batches,
+        "seconds": round(time.monotonic() - started_at, 3),
+        "results": results,
+    }
+
+
+async def handle_monday_bulk_item_lifecycle(
+    itemIds: list[str],
+    action: str,
+    monday_client: MondayClient,
+    groupId: Optional[str] = None,
+    boardId: Optional[str] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> list[types.TextContent]:
+    """Move, archive, delete or duplicate many Monday.com items in batches."""
+    summary = bulk_item_lifecycle(
+        monday_client, itemIds, action, groupId, boardId, concurrency
+    )
+    return [
+        types.TextContent(
+            type="text",
+            text=f"Applied {action} to {len(summary['results'])} Monday.com items. "
+            f"{json.dumps(summary)}",
+        )
+    ]
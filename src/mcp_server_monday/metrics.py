@@ -0,0 +1,14 @@
+"""Registry of runtime metrics served by the HTTP app under ``/metrics``."""
+
+from typing import Any, Callable
+
+_providers: dict[str, Callable[[], Any]] = {}
+
+
+def register(name: str, provider: Callable[[], Any]) -> None:
+    """Publish the result of ``provider()`` under ``name`` in the metrics output."""
+    _providers[name] = provider
+
+
+def collect() -> dict[str, Any]:
+    return {name: provider() for name, provider in _providers.items()}
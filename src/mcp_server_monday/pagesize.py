@@ -0,0 +1,195 @@
+"""Adaptive page sizes for listing the items of a board.
+
+How expensive an items page is depends on the board: its complexity grows with
+the number of columns, and so does its latency. For each board, the sizer
+learns the complexity points per item (from the ``complexity`` field returned
+with every page) and a latency model ``seconds = overhead + per_item * n``
+(fitted over recent pages, older pages weighing less). It then picks the
+largest page, and so the most items per second, that is expected to:
+
+- return within ``MONDAY_PAGE_LATENCY_TARGET`` seconds,
+- stay under the per-query complexity ceiling of Monday.com, and
+- use at most half of the complexity budget left for the API key.
+
+Sizes grow at most twofold from one page to the next. A page that fails with a
+timeout, a server error or a complexity rejection halves the size and caps the
+board at that size; the cap then rises by a quarter with every page that
+succeeds.
+"""
+
+import threading
+import weakref
+from typing import Any, Optional
+
+from mcp_server_monday.constants import MONDAY_PAGE_LATENCY_TARGET
+
+DEFAULT_PAGE_SIZE = 50
+MIN_PAGE_SIZE = 5
+MAX_PAGE_SIZE = 500
+# Monday.com rejects single queries above this many complexity points.
+MAX_QUERY_COMPLEXITY = 5_000_000
+BUDGET_SHARE = 0.5
+# Weight of the previous observations when a new page is observed.
+DECAY = 0.7
+DEFAULT_OVERHEAD = 0.3
+
+
+def exceeds_max_complexity(error: Exception) -> bool:
+    """Whether a query was rejected for exceeding the per-query complexity ceiling."""
+    # Running out of the per-minute budget is a ComplexityException; a single
+    # query over the ceiling is reported with its own code and message.
+    for detail in getattr(error, "original_errors", None) or []:
+        code = (detail.get("extensions") or {}).get("code")
+        if code == "ComplexityException":
+            continue
+        message = detail.get("message", "").lower()
+        if "maxcomplexity" in str(code).lower() or "max complexity" in message:
+            return True
+    return False
+
+
+def is_page_failure(error: Exception) -> bool:
+    """Whether a smaller page might succeed where this one failed."""
+    import requests
+
+    # Also a connection broken in the middle of a (streamed) response.
+    if isinstance(error, (requests.Timeout, requests.exceptions.ChunkedEncodingError)):
+        return True
+    if isinstance(error, requests.HTTPError):
+        response = error.response
+        return response is not None and response.status_code >= 500
+    return exceeds_max_complexity(error)
+
+
+class _BoardModel:
+    def __init__(self):
+        self.cost_per_item: Optional[float] = None
+        # Decayed sums for the least-squares fit of latency against size.
+        self.w = self.x = self.y = self.xx = self.xy = 0.0
+        self.last_size = DEFAULT_PAGE_SIZE
+        self.ceiling = float(MAX_PAGE_SIZE)
+
+    def latency_model(self) -> Optional[tuple[float, float]]:
+        """``(overhead, seconds per item)``, or None before the first page."""
+        if not self.w:
+            return None
+        variance = self.w * self.xx - self.x * self.x
+        if variance > 1e-6 * self.w * self.xx:
+            per_item = (self.w * self.xy - self.x * self.y) / variance
+            overhead = (self.y - per_item * self.x) / self.w
+        else:
+            # All pages had the same size: assume a typical fixed overhead.
+            mean_size, mean_seconds = self.x / self.w, self.y / self.w
+            overhead = min(DEFAULT_OVERHEAD, mean_seconds / 2)
+            per_item = (mean_seconds - overhead) / mean_size
+        return max(0.0, overhead), max(1e-6, per_item)
+
+
+class PageSizer:
+    """Per-board page size models of one client."""
+
+    def __init__(self, latency_target: float = MONDAY_PAGE_LATENCY_TARGET):
+        self.latency_target = latency_target
+        self._boards: dict[str, _BoardModel] = {}
+        self._lock = threading.Lock()
+        self.pages = 0
+        self.items_requested = 0
+        self.failures = 0
+
+    def suggest(self, board_id: str, budget_remaining: Optional[int] = None) -> int:
+        """The page size to request next from ``board_id``."""
+        with self._lock:
+            model = self._boards.get(board_id)
+            if model is None:
+                return DEFAULT_PAGE_SIZE
+            size = min(float(MAX_PAGE_SIZE), model.ceiling, 2.0 * model.last_size)
+            latency = model.latency_model()
+            if latency is not None:
+                overhead, per_item = latency
+                size = min(size, (self.latency_target - overhead) / per_item)
+            if model.cost_per_item:
+                size = min(size, 0.9 * MAX_QUERY_COMPLEXITY / model.cost_per_item)
+                if budget_remaining is not None:
+                    size = min(
+                        size, BUDGET_SHARE * budget_remaining / model.cost_per_item
+                    )
+            return max(MIN_PAGE_SIZE, min(MAX_PAGE_SIZE, int(size)))
+
+    def observe(
+        self,
+        board_id: str,
+        size: int,
+        seconds: float,
+        complexity: Optional[int] = None,
+    ) -> None:
+        """Record a page of ``size`` items that took ``seconds`` and cost ``complexity``."""
+        with self._lock:
+            model = self._boards.setdefault(board_id, _BoardModel())
+            model.w = model.w * DECAY + 1
+            model.x = model.x * DECAY + size
+            model.y = model.y * DECAY + seconds
+            model.xx = model.xx * DECAY + size * size
+            model.xy = model.xy * DECAY + size * seconds
+            if complexity:
+                cost = complexity / size
+                model.cost_per_item = (
+                    cost
+                    if model.cost_per_item is None
+                    else DECAY * model.cost_per_item + (1 - DECAY) * cost
+                )
+            model.last_size = size
+            model.ceiling = min(MAX_PAGE_SIZE, model.ceiling * 1.25)
+            self.pages += 1
+            self.items_requested += size
+
+    def failed(self, board_id: str, size: int) -> int:
+        """Record a failed page of ``size`` items and return the size to retry with."""
+        with self._lock:
+            model = self._boards.setdefault(board_id, _BoardModel())
+            model.ceiling = max(MIN_PAGE_SIZE, size // 2)
+            model.last_size = int(model.ceiling)
+            self.failures += 1
+            return int(model.ceiling)
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "boards": len(self._boards),
+                "pages": self.pages,
+                "items_requested": self.items_requested,
+                "failures": self.failures,
+            }
+
+
+def budget_remaining(monday_client: Any) -> Optional[int]:
+    """The complexity budget last reported for the client's API key, if known."""
+    budget = getattr(monday_client, "complexity_budget", None)
+    return budget.remaining if budget is not None else None
+
+
+_sizers: "weakref.WeakKeyDictionary[Any, PageSizer]" = weakref.WeakKeyDictionary()
+_sizers_lock = threading.Lock()
+
+
+def page_sizer_for(owner: Any) -> PageSizer:
+    """Return the page sizer belonging to ``owner`` (usually a MondayClient)."""
+    with _sizers_lock:
+        sizer = _sizers.get(owner)
+        if sizer is None:
+            sizer = _sizers[owner] = PageSizer()
+        return sizer
+
+
+def page_sizing_metrics() -> dict[str, Any]:
+    """Page counts summed over all API keys, with the mean page size."""
+    with _sizers_lock:
+        sizers = list(_sizers.values())
+    totals = {"boards": 0, "pages": 0, "items_requested": 0, "failures": 0}
+    for sizer in sizers:
+        for name, value in sizer.metrics().items():
+            totals[name] += value
+    pages = totals["pages"]
+    totals["mean_page_size"] = (
+        round(totals["items_requested"] / pages, 1) if pages else 0.0
+    )
+    return totals
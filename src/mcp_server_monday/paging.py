@@ -0,0 +1,147 @@
+"""Cursor-based iteration over the items of a Monday.com board.
+
+The first page comes from ``boards { items_page }`` and every following page
+from ``next_items_page`` with the returned cursor, so a caller can stop after
+any page and later resume from the cursor it was given.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Iterator, Optional
+
+from mcp_server_monday.constants import MONDAY_STREAM_RESPONSES
+
+if TYPE_CHECKING:
+    from monday import MondayClient
+
+ITEM_FIELDS = """
+    id
+    name
+    created_at
+    updated_at
+    group {
+        id
+        title
+    }
+    column_values {
+        id
+        text
+        value
+    }
+"""
+
+
+def items_page_query(
+    board_id: str,
+    limit: int,
+    cursor: Optional[str] = None,
+    fields: str = ITEM_FIELDS,
+    query_params: Optional[str] = None,
+) -> str:
+    """Build the query for one items page, starting a new scan if no cursor is given."""
+    if cursor:
+        return f"""
+        query {{
+            next_items_page (limit: {limit}, cursor: {json.dumps(cursor)}) {{
+                cursor
+                items {{ {fields} }}
+            }}
+        }}
+        """
+    params = f"limit: {limit}"
+    if query_params:
+        params += f", query_params: {query_params}"
+    return f"""
+    query {{
+        boards (ids: {board_id}) {{
+            items_page ({params}) {{
+                cursor
+                items {{ {fields} }}
+            }}
+        }}
+    }}
+    """
+
+
+_PAGE_PREFIXES = ("data.boards.item.items_page.", "data.next_items_page.")
+
+
+def parse_items_page(response: dict) -> tuple[list[dict], Optional[str]]:
+    """Extract the items and the next cursor from an items page response."""
+    data = response.get("data") or {}
+    if "next_items_page" in data:
+        page = data["next_items_page"]
+    else:
+        boards = data.get("boards") or [{}]
+        page = boards[0].get("items_page") or {}
+    return page.get("items") or [], page.get("cursor")
+
+
+class StreamedItemsPage:
+    """The items of one page, parsed one by one as the response arrives.
+
+    Iterate over the page to get its items; ``cursor`` is set once it has been
+    read, and ``complexity`` (the ``complexity`` field of the response, if the
+    query asked for it) once the page has been iterated. Needs the optional ``ijson`` package and a pooled client (see
+    ``client.py``); otherwise, or with ``MONDAY_STREAM_RESPONSES`` disabled, the
+    response is parsed in one go as before.
+    """
+
+    def __init__(self, monday_client: MondayClient, query: str):
+        self.monday_client = monday_client
+        self.query = query
+        self.cursor: Optional[str] = None
+        self.complexity: Optional[dict] = None
+
+    def __iter__(self) -> Iterator[dict]:
+        graphql_client = self.monday_client.custom.client
+        if not (MONDAY_STREAM_RESPONSES and hasattr(graphql_client, "iter_events")):
+            yield from self._parse_whole()
+            return
+        try:
+            import ijson
+        except ImportError:
+            yield from self._parse_whole()
+            return
+
+        builder = item_prefix = None
+        for prefix, event, value in graphql_client.iter_events(self.query):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == item_prefix and event == "end_map":
+                    yield builder.value
+                    builder = None
+            elif prefix.startswith("data.complexity.") and event == "number":
+                self.complexity = self.complexity or {}
+                self.complexity[prefix.rsplit(".", 1)[1]] = value
+            elif not prefix.startswith(_PAGE_PREFIXES):
+                continue
+            elif prefix.endswith(".items.item") and event == "start_map":
+                builder, item_prefix = ijson.ObjectBuilder(), prefix
+                builder.event(event, value)
+            elif prefix.endswith(".cursor") and event in ("string", "null"):
+                self.cursor = value
+
+    def _parse_whole(self) -> Iterator[dict]:
+        response = self.monday_client.custom._query(self.query) or {}
+        items, self.cursor = parse_items_page(response)
+        self.complexity = (response.get("data") or {}).get("complexity")
+        yield from items
+
+
+def iter_items_pages(
+    monday_client: MondayClient,
+    board_id: str,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    fields: str = ITEM_FIELDS,
+    query_params: Optional[str] = None,
+) -> Iterator[tuple[list[dict], Optional[str]]]:
+    """Yield ``(items, next_cursor)`` for each page until the board is exhausted."""
+    while True:
+        query = items_page_query(board_id, limit, cursor, fields, query_params)
+        items, cursor = parse_items_page(monday_client.custom._query(query) or {})
+        yield items, cursor
+        if not cursor:
+            return
@@ -0,0 +1,209 @@
+"""Speculative prefetch of the next page of a paginated listing.
+
+An agent that receives a cursor usually asks for the next page a few seconds
+later. With ``MONDAY_PREFETCH`` enabled, the next page is fetched in the
+background right after a page is returned and held for ``MONDAY_PREFETCH_TTL``
+seconds under its cursor, so the follow-up call is answered locally.
+
+Prefetching only uses spare capacity: it is skipped while calls are queued for
+an upstream slot, when all but one slot are busy, or when the complexity budget
+of the API key is low, and the prefetch itself queues for a slot as a batch
+session. A prefetched page is up to ``MONDAY_PREFETCH_TTL`` seconds old when it
+is served, unless a write to its board (or an invalidation of the board cache)
+dropped it before. Writes to items of an unknown board drop every page. A follow-up call whose prefetch has not started yet, or
+takes longer than ``TAKE_TIMEOUT`` seconds, fetches the page itself.
+"""
+
+import threading
+import time
+import weakref
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
+
+from mcp_server_monday.constants import (
+    MONDAY_PREFETCH,
+    MONDAY_PREFETCH_MIN_BUDGET,
+    MONDAY_PREFETCH_TTL,
+)
+from mcp_server_monday.scheduler import UpstreamScheduler, scheduler_for
+
+MAX_PREFETCHES_IN_FLIGHT = 2
+TAKE_TIMEOUT = 10.0
+
+
+class _Prefetch:
+    def __init__(self, expires_at: float):
+        self.expires_at = expires_at
+        self.started = threading.Event()
+        self.future: Future
+
+
+class Prefetcher:
+    """Prefetched pages of one client, keyed by cursor."""
+
+    def __init__(
+        self,
+        enabled: bool = MONDAY_PREFETCH,
+        ttl: float = MONDAY_PREFETCH_TTL,
+        scheduler: Optional[UpstreamScheduler] = None,
+    ):
+        self.enabled = enabled
+        self.ttl = ttl
+        self.scheduler = scheduler or UpstreamScheduler()
+        self._entries: dict[str, _Prefetch] = {}
+        self._lock = threading.Lock()
+        self.prefetched = 0
+        self.hits = 0
+        self.misses = 0
+        self.wasted = 0
+        self.skipped = 0
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        for key in [k for k, e in self._entries.items() if e.expires_at < now]:
+            self._drop(key)
+
+    def _drop(self, key: str) -> None:
+        # Leaves the scheduler queue if it has not got a slot yet.
+        self._entries.pop(key).future.cancel()
+        self.wasted += 1
+
+    def discard(self, board_id: Optional[str] = None) -> None:
+        """Drop the pages prefetched (or being prefetched) from ``board_id``, or all."""
+        prefix = f"{board_id}:" if board_id is not None else ""
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                self._drop(key)
+
+    def prefetch(self, key: str, loader: Callable[[], Any], spare: bool) -> None:
+        """Queue ``loader()`` for a scheduler slot unless ``key`` is already held.
+
+        ``key`` starts with the board ID. ``spare`` says whether the client
+        has capacity to spare right now.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._expire()
+            if key in self._entries:
+                return
+            in_flight = sum(not e.future.done() for e in self._entries.values())
+            if not spare or in_flight >= MAX_PREFETCHES_IN_FLIGHT:
+                self.skipped += 1
+                return
+            entry = _Prefetch(time.monotonic() + self.ttl)
+
+            def load() -> Any:
+                entry.started.set()
+                return loader()
+
+            entry.future = self.scheduler.submit("prefetch", load)
+            self._entries[key] = entry
+            self.prefetched += 1
+
+    def take(self, key: str, timeout: float = TAKE_TIMEOUT) -> Optional[Any]:
+        """Return (and forget) the page prefetched under ``key``, if any.
+
+        A prefetch in flight is waited for, up to ``timeout`` seconds, rather
+        than duplicated; one still queued for a slot is cancelled instead.
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            self._expire()
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                self.misses += 1
+                return None
+            if not entry.started.is_set():
+                # Queued behind other calls: fetching it now is quicker.
+                entry.future.cancel()
+                self.wasted += 1
+                return None
+        try:
+            result = entry.future.result(timeout)
+        except Exception:
+            entry.future.cancel()
+            with self._lock:
+                self.wasted += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return result
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            self._expire()
+            return {
+                "prefetched": self.prefetched,
+                "hits": self.hits,
+                "misses": self.misses,
+                "wasted": self.wasted,
+                "skipped": self.skipped,
+                "held": len(self._entries),
+            }
+
+
+_prefetchers: "weakref.WeakKeyDictionary[Any, Prefetcher]" = weakref.WeakKeyDictionary()
+_prefetchers_lock = threading.Lock()
+
+
+def prefetcher_for(owner: Any) -> Prefetcher:
+    """Return the prefetcher belonging to ``owner`` (usually a MondayClient)."""
+    with _prefetchers_lock:
+        prefetcher = _prefetchers.get(owner)
+        if prefetcher is None:
+            prefetcher = _prefetchers[owner] = Prefetcher(
+                scheduler=scheduler_for(owner)
+            )
+        return prefetcher
+
+
+def has_spare_capacity(monday_client: Any) -> bool:
+    """Whether the client's scheduler and complexity budget leave room to prefetch."""
+    budget = getattr(monday_client, "complexity_budget", None)
+    if budget is not None:
+        if budget.exhausted_until > time.monotonic():
+            return False
+        if (
+            budget.remaining is not None
+            and budget.remaining < MONDAY_PREFETCH_MIN_BUDGET
+        ):
+            return False
+    return scheduler_for(monday_client).has_spare_capacity()
+
+
+def discard_pages(board_id: Optional[str] = None) -> None:
+    """Drop pages prefetched from ``board_id`` (from any board if None) for every key."""
+    with _prefetchers_lock:
+        prefetchers = list(_prefetchers.values())
+    for prefetcher in prefetchers:
+        prefetcher.discard(None if board_id is None else str(board_id))
+
+
+def on_invalidate(prefix: str) -> None:
+    """Drop pages prefetched from boards invalidated in the board cache."""
+    if prefix.startswith("board:"):
+        discard_pages(prefix.split(":")[1])
+
+
+def prefetch_metrics() -> dict[str, Any]:
+    """Prefetch counts summed over all API keys, with hit and waste rates."""
+    with _prefetchers_lock:
+        prefetchers = list(_prefetchers.values())
+    totals = {
+        "prefetched": 0,
+        "hits": 0,
+        "misses": 0,
+        "wasted": 0,
+        "skipped": 0,
+        "held": 0,
+    }
+    for prefetcher in prefetchers:
+        for name, value in prefetcher.metrics().items():
+            totals[name] += value
+    lookups = totals["hits"] + totals["misses"]
+    settled = totals["hits"] + totals["wasted"]
+    totals["hit_rate"] = round(totals["hits"] / lookups, 3) if lookups else 0.0
+    totals["waste_rate"] = round(totals["wasted"] / settled, 3) if settled else 0.0
+    return totals
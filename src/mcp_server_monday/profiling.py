@@ -0,0 +1,325 @@
+"""On-demand profiling of live tool calls, for operators.
+
+Available only when ``MONDAY_ADMIN_TOKEN`` is set; the admin endpoints then
+require ``Authorization: Bearer <token>``. Nothing is profiled until profiling
+is armed with ``POST /admin/profiling``, either for the next N calls of a tool
+or for a sampled fraction of calls. Two profilers are available:
+
+- ``sampling`` (default): samples the stack of the thread running the call
+  every few milliseconds. Each call is stored as a ``.folded`` file, and the
+  samples of all calls are aggregated per tool into flame-graph-ready folded
+  stacks served by ``GET /admin/profiling/stacks``.
+- ``deterministic``: traces every Python function call with ``cProfile`` and
+  stores a ``.prof`` file per call, for ``pstats`` or snakeviz. Only one such
+  profile can run at a time; concurrent calls then run unprofiled.
+
+Stored profiles are listed by ``GET /admin/profiling`` and downloaded from
+``GET /admin/profiling/profiles/{name}``.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import cProfile
+import hmac
+import itertools
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+from starlette.requests import Request
+from starlette.responses import FileResponse, JSONResponse, PlainTextResponse
+
+from mcp_server_monday.constants import (
+    MONDAY_ADMIN_TOKEN,
+    MONDAY_PROFILE_DIR,
+    MONDAY_PROFILE_MAX_FILES,
+)
+
+PROFILERS = ("sampling", "deterministic")
+DEFAULT_SAMPLE_INTERVAL = 0.005
+MAX_STACK_DEPTH = 128
+
+# The profile run of the tool call in progress, if it was selected.
+active_run: contextvars.ContextVar[Optional[ProfileRun]] = contextvars.ContextVar(
+    "active_profile_run", default=None
+)
+
+
+def _frame_name(frame: Any) -> str:
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", os.path.basename(code.co_filename))
+    return f"{module}:{code.co_name}"
+
+
+class _Sampler(threading.Thread):
+    """Samples the stack of one thread until stopped."""
+
+    def __init__(self, thread_id: int, interval: float):
+        super().__init__(name="monday-profile-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None and len(stack) < MAX_STACK_DEPTH:
+                stack.append(_frame_name(frame))
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def stop(self) -> Counter[str]:
+        self._stopped.set()
+        self.join()
+        return self.stacks
+
+
+class ProfileRun:
+    """One profiled tool call."""
+
+    def __init__(self, profiler: Profiler, tool: str, mode: str, interval: float):
+        self.profiler = profiler
+        self.tool = tool
+        self.mode = mode
+        self.interval = interval
+
+    def wrap(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap ``fn`` so that it is profiled in the thread that calls it."""
+
+        def run(*args: Any) -> Any:
+            if self.mode == "deterministic":
+                if not self.profiler.deterministic_lock.acquire(blocking=False):
+                    self.profiler.count_skipped()
+                    return fn(*args)
+                profile = cProfile.Profile()
+                try:
+                    profile.enable()
+                    try:
+                        return fn(*args)
+                    finally:
+                        profile.disable()
+                        self.profiler.save(self, ".prof", profile.dump_stats)
+                finally:
+                    self.profiler.deterministic_lock.release()
+
+            sampler = _Sampler(threading.get_ident(), self.interval)
+            sampler.start()
+            try:
+                return fn(*args)
+            finally:
+                stacks = sampler.stop()
+                self.profiler.add_stacks(self.tool, stacks)
+                self.profiler.save(
+                    self, ".folded", lambda path: _write_folded(path, stacks)
+                )
+
+        return run
+
+
+def _write_folded(path: str, stacks: Counter[str]) -> None:
+    with open(path, "w") as f:
+        for stack, count in stacks.most_common():
+            f.write(f"{stack} {count}\n")
+
+
+class Profiler:
+    """Decides which tool calls are profiled and keeps their results."""
+
+    def __init__(
+        self,
+        directory: str = MONDAY_PROFILE_DIR,
+        max_files: int = MONDAY_PROFILE_MAX_FILES,
+    ):
+        self.directory = Path(directory)
+        self.max_files = max_files
+        self.armed = False
+        self.tool: Optional[str] = None
+        self.calls_left: Optional[int] = None
+        self.sample_rate: Optional[float] = None
+        self.mode = "sampling"
+        self.interval = DEFAULT_SAMPLE_INTERVAL
+        self.stacks: dict[str, Counter[str]] = {}
+        self.deterministic_lock = threading.Lock()
+        self.profiled = 0
+        self.skipped = 0
+        self._counter = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def arm(
+        self,
+        tool: Optional[str] = None,
+        calls: Optional[int] = None,
+        sample_rate: Optional[float] = None,
+        mode: str = "sampling",
+        interval: float = DEFAULT_SAMPLE_INTERVAL,
+    ) -> None:
+        """Profile the next ``calls`` calls, or a ``sample_rate`` fraction of calls.
+
+        ``tool`` restricts profiling to one tool.
+        """
+        if (calls is None) == (sample_rate is None):
+            raise ValueError("Exactly one of calls and sample_rate is required")
+        if calls is not None and calls < 1:
+            raise ValueError("calls must be at least 1")
+        if sample_rate is not None and not 0 < sample_rate <= 1:
+            raise ValueError("sample_rate must be in (0, 1]")
+        if mode not in PROFILERS:
+            raise ValueError(f"profiler must be one of {', '.join(PROFILERS)}")
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        with self._lock:
+            self.tool = tool
+            self.calls_left = calls
+            self.sample_rate = sample_rate
+            self.mode = mode
+            self.interval = interval
+            self.armed = True
+
+    def disarm(self) -> None:
+        with self._lock:
+            self.armed = False
+
+    def select(self, tool: str) -> Optional[ProfileRun]:
+        """Return a profile run if this call of ``tool`` is to be profiled."""
+        with self._lock:
+            if not self.armed or (self.tool and self.tool != tool):
+                return None
+            if self.calls_left is not None:
+                self.calls_left -= 1
+                if self.calls_left <= 0:
+                    self.armed = False
+            elif random.random() >= self.sample_rate:
+                return None
+            self.profiled += 1
+            return ProfileRun(self, tool, self.mode, self.interval)
+
+    def count_skipped(self) -> None:
+        with self._lock:
+            self.skipped += 1
+
+    def add_stacks(self, tool: str, stacks: Counter[str]) -> None:
+        with self._lock:
+            self.stacks.setdefault(tool, Counter()).update(stacks)
+
+    def folded_stacks(self, tool: Optional[str] = None) -> Counter[str]:
+        """Sampled stacks aggregated over all calls, or those of one tool."""
+        stacks: Counter[str] = Counter()
+        with self._lock:
+            for name, counts in self.stacks.items():
+                if tool is None or name == tool:
+                    stacks.update(counts)
+        return stacks
+
+    def save(self, run: ProfileRun, suffix: str, write: Callable[[str], None]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        name = (
+            f"{run.tool}-{time.strftime('%Y%m%dT%H%M%S')}-{next(self._counter)}{suffix}"
+        )
+        write(str(self.directory / name))
+        for old in self.profiles()[self.max_files :]:
+            (self.directory / old["name"]).unlink(missing_ok=True)
+
+    def profiles(self) -> list[dict[str, Any]]:
+        """Stored profile files, newest first."""
+        if not self.directory.is_dir():
+            return []
+        files = [
+            path
+            for path in self.directory.iterdir()
+            if path.suffix in (".prof", ".folded")
+        ]
+        files.sort(key=lambda path: path.stat().st_mtime, reverse=True)
+        return [{"name": path.name, "bytes": path.stat().st_size} for path in files]
+
+    def status(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "armed": self.armed,
+                "tool": self.tool,
+                "calls_left": self.calls_left if self.armed else None,
+                "sample_rate": self.sample_rate,
+                "profiler": self.mode,
+                "profiled": self.profiled,
+                "skipped": self.skipped,
+            }
+
+
+profiler = Profiler()
+
+
+class ProfilingMiddleware(Middleware):
+    """Marks the tool calls selected for profiling."""
+
+    def __init__(self, profiler: Profiler):
+        self.profiler = profiler
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        if not self.profiler.armed:
+            return await call_next(context)
+        run = self.profiler.select(context.message.name)
+        if run is None:
+            return await call_next(context)
+        token = active_run.set(run)
+        try:
+            return await call_next(context)
+        finally:
+            active_run.reset(token)
+
+
+def _authorized(request: Request) -> bool:
+    expected = f"Bearer {MONDAY_ADMIN_TOKEN}"
+    return hmac.compare_digest(request.headers.get("authorization", ""), expected)
+
+
+def _unauthorized() -> JSONResponse:
+    return JSONResponse({"error": "unauthorized"}, status_code=401)
+
+
+async def profiling_endpoint(request: Request) -> JSONResponse:
+    """``GET`` the status, ``POST`` to arm, ``DELETE`` to disarm."""
+    if not _authorized(request):
+        return _unauthorized()
+    if request.method == "POST":
+        body = await request.json()
+        try:
+            profiler.arm(
+                tool=body.get("tool"),
+                calls=body.get("calls"),
+                sample_rate=body.get("sample_rate"),
+                mode=body.get("profiler", "sampling"),
+                interval=body.get("interval", DEFAULT_SAMPLE_INTERVAL),
+            )
+        except (TypeError, ValueError) as e:
+            return JSONResponse({"error": str(e)}, status_code=400)
+    elif request.method == "DELETE":
+        profiler.disarm()
+    return JSONResponse({**profiler.status(), "profiles": profiler.profiles()})
+
+
+async def profile_download_endpoint(request: Request):
+    if not _authorized(request):
+        return _unauthorized()
+    name = request.path_params["name"]
+    if name not in {profile["name"] for profile in profiler.profiles()}:
+        return JSONResponse({"error": "not found"}, status_code=404)
+    return FileResponse(profiler.directory / name, filename=name)
+
+
+async def profile_stacks_endpoint(request: Request):
+    """Folded stacks aggregated over all sampled calls, optionally of one tool."""
+    if not _authorized(request):
+        return _unauthorized()
+    stacks = profiler.folded_stacks(request.query_params.get("tool"))
+    return PlainTextResponse(
+        "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+    )
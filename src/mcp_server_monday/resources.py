@@ -0,0 +1,206 @@
+"""Board lists, columns and groups as subscribable MCP resources.
+
+Resources have stable URIs, so clients can cache them and re-read one only
+after a ``notifications/resources/updated`` for its URI (or, for the board list,
+``notifications/resources/list_changed``):
+
+- ``monday://boards``: every board, by ID and name
+- ``monday://boards/{board_id}/columns``: the columns of a board
+- ``monday://boards/{board_id}/groups``: the groups of a board
+
+Notifications follow the board cache: anything that invalidates a board's
+cached structure (a write through this server, a structure change seen by
+``monday-get-board-changes`` or an invalidation from a sibling worker) notifies
+the subscribers of the matching resources. Changes made outside the server are
+picked up by re-reading subscribed resources every
+``MONDAY_RESOURCE_POLL_INTERVAL`` seconds and comparing them with the last read.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Optional
+
+from pydantic import AnyUrl
+
+from mcp_server_monday.board import get_board_columns, get_board_groups, list_all_boards
+from mcp_server_monday.cache import board_key, cache_for, invalidate
+from mcp_server_monday.constants import MONDAY_RESOURCE_POLL_INTERVAL
+from mcp_server_monday.scheduler import scheduler_for
+
+if TYPE_CHECKING:
+    from monday import MondayClient
+
+logger = logging.getLogger(__name__)
+
+BOARDS_URI = "monday://boards"
+BOARD_COLUMNS_URI = "monday://boards/{board_id}/columns"
+BOARD_GROUPS_URI = "monday://boards/{board_id}/groups"
+
+_BOARD_RESOURCE_RE = re.compile(r"^monday://boards/(\d+)/(columns|groups)$")
+
+
+def cache_key(uri: str) -> str:
+    """The board cache key (prefix) behind a resource URI."""
+    if uri == BOARDS_URI:
+        return "boards:"
+    match = _BOARD_RESOURCE_RE.match(uri)
+    if match is None:
+        raise ValueError(f"Unknown resource: {uri}")
+    return board_key(match.group(1), match.group(2))
+
+
+def read_resource(monday_client: MondayClient, uri: str, fresh: bool = False) -> str:
+    """The JSON content of a resource, bypassing the cache if ``fresh`` is set."""
+    key = cache_key(uri)
+    if fresh:
+        cache_for(monday_client).invalidate(key)
+    if uri == BOARDS_URI:
+        return json.dumps(list_all_boards(monday_client))
+    board_id, kind = _BOARD_RESOURCE_RE.match(uri).groups()
+    if kind == "columns":
+        response = get_board_columns(monday_client, board_id)
+        boards = response.get("data", {}).get("boards") or []
+        return json.dumps(boards[0]["columns"] if boards else [])
+    response = get_board_groups(monday_client, board_id)
+    boards = response.get("data", {}).get("boards") or []
+    return json.dumps(boards[0]["groups"] if boards else [])
+
+
+async def handle_read_resource(uri: str, monday_client: MondayClient) -> str:
+    """Read a board resource."""
+    return read_resource(monday_client, uri)
+
+
+class ResourceSubscriptions:
+    """MCP sessions subscribed to each resource URI, and their notifications."""
+
+    def __init__(self, poll_interval: float = MONDAY_RESOURCE_POLL_INTERVAL):
+        self.poll_interval = poll_interval
+        # Sessions are held weakly so that closed sessions drop out by themselves.
+        self._subscribers: dict[str, weakref.WeakKeyDictionary] = {}
+        self._digests: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._poller: Optional[asyncio.Task] = None
+        self.notifications = 0
+        self.polls = 0
+        self.changes = 0
+
+    def subscribe(self, uri: str, session: Any, monday_client: MondayClient) -> None:
+        """Subscribe ``session`` to ``uri``; must be called on the session's loop."""
+        cache_key(uri)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            subscribers = self._subscribers.setdefault(uri, weakref.WeakKeyDictionary())
+            subscribers[session] = (loop, monday_client)
+        if self.poll_interval > 0 and (self._poller is None or self._poller.done()):
+            self._poller = loop.create_task(self._poll())
+
+    def unsubscribe(self, uri: str, session: Any) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(uri)
+            if subscribers is not None:
+                subscribers.pop(session, None)
+                if not subscribers:
+                    del self._subscribers[uri]
+                    self._digests.pop(uri, None)
+
+    def on_invalidate(self, prefix: str) -> None:
+        """Notify the subscribers of every resource whose cache key matches ``prefix``.
+
+        Called from whatever thread invalidated the cache.
+        """
+        list_changed = cache_key(BOARDS_URI).startswith(prefix)
+        with self._lock:
+            updated = [
+                (uri, session, loop)
+                for uri, subscribers in self._subscribers.items()
+                if cache_key(uri).startswith(prefix)
+                for session, (loop, _) in subscribers.items()
+            ]
+            every_session = {
+                session: loop
+                for subscribers in self._subscribers.values()
+                for session, (loop, _) in subscribers.items()
+            }
+        for uri, session, loop in updated:
+            self._send(
+                session,
+                loop,
+                lambda s=session, u=uri: s.send_resource_updated(AnyUrl(u)),
+            )
+        if list_changed:
+            for session, loop in every_session.items():
+                self._send(
+                    session, loop, lambda s=session: s.send_resource_list_changed()
+                )
+
+    def _send(self, session: Any, loop: asyncio.AbstractEventLoop, notify) -> None:
+        if loop.is_closed():
+            return
+
+        async def send() -> None:
+            try:
+                await notify()
+            except Exception as e:
+                # The session is gone; stop notifying it.
+                logger.debug(f"Dropping resource subscriber: {e}")
+                with self._lock:
+                    for subscribers in self._subscribers.values():
+                        subscribers.pop(session, None)
+
+        with self._lock:
+            self.notifications += 1
+        asyncio.run_coroutine_threadsafe(send(), loop)
+
+    async def _poll(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            with self._lock:
+                watched = {
+                    uri: next(iter(subscribers.values()))[1]
+                    for uri, subscribers in self._subscribers.items()
+                    if len(subscribers)
+                }
+            if not watched:
+                return
+            for uri, monday_client in watched.items():
+                try:
+                    async with scheduler_for(monday_client).slot(
+                        "resource-poll", "batch"
+                    ):
+                        content = await asyncio.to_thread(
+                            read_resource, monday_client, uri, True
+                        )
+                except Exception as e:
+                    logger.warning(f"Polling {uri} failed: {e}")
+                    continue
+                digest = hashlib.sha256(content.encode()).hexdigest()
+                with self._lock:
+                    self.polls += 1
+                    previous = self._digests.get(uri)
+                    if uri in self._subscribers:
+                        self._digests[uri] = digest
+                if previous is not None and previous != digest:
+                    with self._lock:
+                        self.changes += 1
+                    invalidate(cache_key(uri))
+
+    def metrics(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "resources": len(self._subscribers),
+                "subscriptions": sum(len(s) for s in self._subscribers.values()),
+                "notifications": self.notifications,
+                "polls": self.polls,
+                "changes": self.changes,
+            }
+
+
+resource_subscriptions = ResourceSubscriptions()
@@ -0,0 +1,224 @@
+"""Weighted fair scheduling of upstream Monday.com calls across MCP sessions.
+
+Every API key has a fixed number of upstream slots. Sessions waiting for a slot
+are queued separately and served with deficit round robin: on each turn a
+session earns a quantum proportional to the weight of the priority class of
+the call at the head of its queue, and may start calls as long as their cost
+fits in its deficit. A batch session crawling a board therefore cannot starve
+interactive sessions on the same key.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Optional, TypeVar
+
+from mcp_server_monday.constants import (
+    MONDAY_SCHEDULER_CONCURRENCY,
+    MONDAY_SCHEDULER_QUANTUM,
+    MONDAY_SCHEDULER_WEIGHTS,
+)
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Waiter:
+    cost: int
+    priority_class: str
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _Flow:
+    waiters: deque = field(default_factory=deque)
+    deficit: int = 0
+
+
+@dataclass
+class ClassMetrics:
+    queued: int = 0
+    running: int = 0
+    dispatched: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "queue_depth": self.queued,
+            "running": self.running,
+            "dispatched": self.dispatched,
+            "avg_wait_ms": (
+                round(1000 * self.total_wait / self.dispatched, 3)
+                if self.dispatched
+                else 0.0
+            ),
+            "max_wait_ms": round(1000 * self.max_wait, 3),
+        }
+
+
+class UpstreamScheduler:
+    """Deficit-round-robin scheduler limiting concurrent upstream calls."""
+
+    def __init__(
+        self,
+        concurrency: int = MONDAY_SCHEDULER_CONCURRENCY,
+        weights: dict[str, int] = MONDAY_SCHEDULER_WEIGHTS,
+        quantum: int = MONDAY_SCHEDULER_QUANTUM,
+    ):
+        self.concurrency = concurrency
+        # A flow whose deficit never grows would be visited forever.
+        self.weights = {name: max(1, weight) for name, weight in weights.items()}
+        self.quantum = max(1, quantum)
+        self.available = concurrency
+        self.metrics: dict[str, ClassMetrics] = {}
+        self._flows: OrderedDict[str, _Flow] = OrderedDict()
+        # The event loop the slots are handed out on, once one was asked for.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @asynccontextmanager
+    async def slot(
+        self, session_id: str, priority_class: str = "interactive", cost: int = 1
+    ) -> AsyncIterator[None]:
+        """Wait for an upstream slot on behalf of ``session_id``."""
+        self._loop = asyncio.get_running_loop()
+        if priority_class not in self.weights:
+            priority_class = "interactive"
+        metrics = self.metrics.setdefault(priority_class, ClassMetrics())
+        waiter = _Waiter(
+            cost, priority_class, asyncio.get_running_loop().create_future()
+        )
+        flow = self._flows.get(session_id)
+        if flow is None:
+            flow = self._flows[session_id] = _Flow()
+        flow.waiters.append(waiter)
+        metrics.queued += 1
+        self._dispatch()
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Granted just before the cancellation arrived: give it back.
+                metrics.running -= 1
+                self._release()
+            else:
+                flow.waiters.remove(waiter)
+                metrics.queued -= 1
+                if not flow.waiters:
+                    self._flows.pop(session_id, None)
+            raise
+
+        try:
+            yield
+        finally:
+            metrics.running -= 1
+            self._release()
+
+    def submit(
+        self, session_id: str, fn: Callable[[], T], priority_class: str = "batch"
+    ) -> "Future[T]":
+        """Run blocking ``fn`` in a worker thread once it got a slot.
+
+        For background work started from any thread, queued as ``session_id``.
+        Before any slot was asked for there is nothing to share them with, and
+        ``fn`` simply runs in a thread of its own.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            future: Future[T] = Future()
+
+            def run_now() -> None:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(fn())
+                    except BaseException as e:
+                        future.set_exception(e)
+
+            threading.Thread(target=run_now, daemon=True).start()
+            return future
+
+        async def run() -> T:
+            async with self.slot(session_id, priority_class):
+                return await asyncio.to_thread(fn)
+
+        # In an empty context, so that the work is not tied to the tool call
+        # of the thread submitting it.
+        return contextvars.Context().run(asyncio.run_coroutine_threadsafe, run(), loop)
+
+    def has_spare_capacity(self, reserve: int = 1) -> bool:
+        """Whether nothing is queued and more than ``reserve`` slots are free."""
+        return not self._flows and self.available > reserve
+
+    def _release(self) -> None:
+        self.available += 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while self.available > 0 and self._flows:
+            session_id, flow = next(iter(self._flows.items()))
+            waiter = flow.waiters[0]
+            if waiter.cost > flow.deficit:
+                # Not enough credit for the head of this queue: earn a quantum
+                # and go to the back of the round. The class is looked up per
+                # call, as a session may change it between calls.
+                flow.deficit += self.quantum * self.weights.get(
+                    waiter.priority_class, 1
+                )
+                self._flows.move_to_end(session_id)
+                continue
+
+            flow.waiters.popleft()
+            flow.deficit -= waiter.cost
+            self.available -= 1
+            self._grant(waiter)
+            if not flow.waiters:
+                del self._flows[session_id]
+
+    def _grant(self, waiter: _Waiter) -> None:
+        metrics = self.metrics[waiter.priority_class]
+        wait = time.monotonic() - waiter.enqueued_at
+        metrics.queued -= 1
+        metrics.running += 1
+        metrics.dispatched += 1
+        metrics.total_wait += wait
+        metrics.max_wait = max(metrics.max_wait, wait)
+        waiter.future.set_result(None)
+
+
+_schedulers: "weakref.WeakKeyDictionary[Any, UpstreamScheduler]" = (
+    weakref.WeakKeyDictionary()
+)
+_schedulers_lock = threading.Lock()
+
+
+def scheduler_for(owner: Any) -> UpstreamScheduler:
+    """Return the scheduler belonging to ``owner`` (usually a MondayClient)."""
+    with _schedulers_lock:
+        scheduler = _schedulers.get(owner)
+        if scheduler is None:
+            scheduler = _schedulers[owner] = UpstreamScheduler()
+        return scheduler
+
+
+def scheduler_metrics() -> dict[str, Any]:
+    """Per-class queue depth and wait-time metrics summed over all API keys."""
+    totals: dict[str, ClassMetrics] = {}
+    with _schedulers_lock:
+        schedulers = list(_schedulers.values())
+    for scheduler in schedulers:
+        for name, metrics in scheduler.metrics.items():
+            total = totals.setdefault(name, ClassMetrics())
+            total.queued += metrics.queued
+            total.running += metrics.running
+            total.dispatched += metrics.dispatched
+            total.total_wait += metrics.total_wait
+            total.max_wait = max(total.max_wait, metrics.max_wait)
+    return {name: metrics.as_dict() for name, metrics in totals.items()}
@@ -0,0 +1,244 @@
+"""Externally stored MCP session state for the stateless HTTP mode.
+
+In the default streamable-HTTP mode every MCP session lives in the memory of the
+process that initialized it, so replicas behind a load balancer need sticky
+routing. In stateless mode the MCP SDK handles each request on its own and this
+module keeps the little session state the server needs in a pluggable store:
+
+- ``memory://`` keeps sessions in process memory (single replica only).
+- ``sqlite:///path/to/sessions.db`` shares sessions between processes on a host.
+- ``redis://host:port/db`` shares sessions between nodes. Needs the ``redis``
+  package; any Redis-compatible server works.
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+SESSION_HEADER = "mcp-session-id"
+SESSION_STATE_KEY = "mcp_session"
+
+
+class SessionStore:
+    """Interface of a session-state backend. Values are JSON-serializable dicts."""
+
+    def get(self, session_id: str) -> Optional[dict[str, Any]]:
+        raise NotImplementedError
+
+    def set(self, session_id: str, data: dict[str, Any], ttl: float) -> None:
+        raise NotImplementedError
+
+    def delete(self, session_id: str) -> None:
+        raise NotImplementedError
+
+
+class InMemorySessionStore(SessionStore):
+    def __init__(self):
+        self._sessions: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str) -> Optional[dict[str, Any]]:
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return None
+            if entry[0] < time.time():
+                del self._sessions[session_id]
+                return None
+            return entry[1]
+
+    def set(self, session_id: str, data: dict[str, Any], ttl: float) -> None:
+        with self._lock:
+            self._sessions[session_id] = (time.time() + ttl, data)
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+
+class SqliteSessionStore(SessionStore):
+    def __init__(self, path: str):
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS mcp_sessions ("
+                "id TEXT PRIMARY KEY, data TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def get(self, session_id: str) -> Optional[dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM mcp_sessions WHERE id = ? AND expires_at >= ?",
+                (session_id, time.time()),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, session_id: str, data: dict[str, Any], ttl: float) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO mcp_sessions (id, data, expires_at) "
+                "VALUES (?, ?, ?)",
+                (session_id, json.dumps(data), now + ttl),
+            )
+            self._conn.execute("DELETE FROM mcp_sessions WHERE expires_at < ?", (now,))
+
+    def delete(self, session_id: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM mcp_sessions WHERE id = ?", (session_id,))
+
+
+class RedisSessionStore(SessionStore):
+    def __init__(self, url: str, prefix: str = "mcp-server-monday:session:"):
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError(
+                "The redis session store needs the 'redis' package: "
+                "pip install 'mcp-server-monday[redis]'"
+            ) from e
+        self._redis = redis.Redis.from_url(url)
+        self._prefix = prefix
+
+    def get(self, session_id: str) -> Optional[dict[str, Any]]:
+        raw = self._redis.get(self._prefix + session_id)
+        return json.loads(raw) if raw else None
+
+    def set(self, session_id: str, data: dict[str, Any], ttl: float) -> None:
+        self._redis.set(self._prefix + session_id, json.dumps(data), ex=int(ttl))
+
+    def delete(self, session_id: str) -> None:
+        self._redis.delete(self._prefix + session_id)
+
+
+def create_session_store(url: str) -> SessionStore:
+    """Build a session store from a ``memory://``, ``sqlite://`` or ``redis://`` URL."""
+    if url.startswith("memory://"):
+        return InMemorySessionStore()
+    if url.startswith("sqlite://"):
+        return SqliteSessionStore(url[len("sqlite:///") :] or ":memory:")
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisSessionStore(url)
+    raise ValueError(f"Unsupported session store URL: {url}")
+
+
+class SessionMiddleware:
+    """ASGI middleware issuing and validating session IDs against a SessionStore.
+
+    The MCP app runs in stateless mode behind it, so any replica sharing the
+    store can serve any request of a session.
+    """
+
+    def __init__(self, app: ASGIApp, store: SessionStore, ttl: float = 3600):
+        self.app = app
+        self.store = store
+        self.ttl = ttl
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        session_id = Headers(scope=scope).get(SESSION_HEADER)
+        if scope["method"] == "DELETE" and session_id:
+            await asyncio.to_thread(self.store.delete, session_id)
+            await Response(status_code=200)(scope, receive, send)
+            return
+
+        if session_id is None:
+            body = await _read_body(receive)
+            if scope["method"] == "POST" and _is_initialize(body):
+                session_id = uuid.uuid4().hex
+                session = {"created_at": time.time(), **_initialize_params(body)}
+                await asyncio.to_thread(self.store.set, session_id, session, self.ttl)
+                await self._call_app(
+                    scope, _replay(body, receive), send, session_id, session
+                )
+                return
+            await self.app(scope, _replay(body, receive), send)
+            return
+
+        session = await asyncio.to_thread(self.store.get, session_id)
+        if session is None:
+            response = JSONResponse(
+                {
+                    "jsonrpc": "2.0",
+                    "id": "server-error",
+                    "error": {"code": -32600, "message": "Session not found"},
+                },
+                status_code=404,
+            )
+            await response(scope, receive, send)
+            return
+        await asyncio.to_thread(self.store.set, session_id, session, self.ttl)
+        await self._call_app(scope, receive, send, session_id, session)
+
+    async def _call_app(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        session_id: str,
+        session: dict[str, Any],
+    ) -> None:
+        async def send_with_session_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[SESSION_HEADER] = session_id
+            await send(message)
+
+        # Exposed to tools through the Starlette request's state.
+        scope.setdefault("state", {})[SESSION_STATE_KEY] = {"id": session_id, **session}
+        await self.app(scope, receive, send_with_session_id)
+
+
+async def _read_body(receive: Receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body"):
+            return b"".join(chunks)
+
+
+def _replay(body: bytes, receive: Receive) -> Receive:
+    """Hand the already-read body to the app, then pass through to ``receive``."""
+    sent = False
+
+    async def replay() -> Message:
+        nonlocal sent
+        if sent:
+            return await receive()
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return replay
+
+
+def _parse(body: bytes) -> Any:
+    try:
+        return json.loads(body)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+
+
+def _is_initialize(body: bytes) -> bool:
+    message = _parse(body)
+    return isinstance(message, dict) and message.get("method") == "initialize"
+
+
+def _initialize_params(body: bytes) -> dict[str, Any]:
+    params = _parse(body).get("params") or {}
+    return {
+        "protocol_version": params.get("protocolVersion"),
+        "client_info": params.get("clientInfo"),
+    }
@@ -0,0 +1,708 @@
+"""Columnar in-memory snapshots of boards, for filtering and sorting locally.
+
+A snapshot keeps one typed array per column instead of one dict per item:
+numbers and dates (as UTC epoch seconds) in ``array('d')`` with NaN for empty
+cells, free text as a list of strings, and every other column as ``array('i')``
+codes into a list of interned labels, so a status column costs four bytes per
+item. Item IDs are indexed to their row through a sorted ``array('q')``.
+
+Snapshots are built page by page and kept for ``MONDAY_SNAPSHOT_TTL`` seconds,
+for at most ``MONDAY_SNAPSHOT_MAX_BOARDS`` boards per API key. Items written
+through this server are marked dirty and re-fetched before the next query.
+
+Queries (filter, sort, top-k) are vectorized with NumPy when it is installed,
+working directly on the arrays' buffers; without it they run as plain loops
+over the same arrays.
+"""
+
+from __future__ import annotations
+
+import array
+import bisect
+import heapq
+import json
+import math
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+from mcp import types
+
+from mcp_server_monday.coalesce import coalescer_for
+from mcp_server_monday.columns import decode_column_value
+from mcp_server_monday.constants import MONDAY_SNAPSHOT_MAX_BOARDS, MONDAY_SNAPSHOT_TTL
+from mcp_server_monday.paging import iter_items_pages
+from mcp_server_monday.prefetch import discard_pages
+
+if TYPE_CHECKING:
+    from monday import MondayClient
+
+NUMBER_TYPES = {"numbers", "rating", "checkbox"}
+DATE_TYPES = {"date", "timeline"}
+# Free text, mostly distinct per item, is stored as is rather than interned.
+TEXT_TYPES = {"text", "long_text", "link", "email", "phone", "location"}
+FILTER_OPS = (
+    "eq",
+    "ne",
+    "in",
+    "contains",
+    "gt",
+    "gte",
+    "lt",
+    "lte",
+    "empty",
+    "not_empty",
+)
+SNAPSHOT_PAGE_SIZE = 500
+REFRESH_CHUNK = 100
+INDEX_MIN_BACKLOG = 1024
+
+SNAPSHOT_ITEM_FIELDS = """
+    id
+    name
+    state
+    group {
+        id
+        title
+    }
+    column_values {
+        id
+        type
+        text
+        value
+    }
+"""
+
+_numpy_module: Any = None
+
+
+def _numpy() -> Any:
+    """NumPy if it is installed, else None (imported on first use)."""
+    global _numpy_module
+    if _numpy_module is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _numpy_module = numpy
+    return _numpy_module or None
+
+
+def _epoch(value: Any) -> float:
+    if isinstance(value, dict):
+        value = value.get("from")
+    if not value:
+        return math.nan
+    try:
+        moment = datetime.fromisoformat(str(value).replace(" UTC", ""))
+    except ValueError:
+        return math.nan
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+def _iso(seconds: float) -> str:
+    moment = datetime.fromtimestamp(seconds, timezone.utc)
+    if moment.hour == moment.minute == moment.second == 0:
+        return moment.date().isoformat()
+    return moment.isoformat()
+
+
+class _Column:
+    """The cells of one column: floats (numbers, dates), label codes or text."""
+
+    def __init__(self, kind: str, rows: int):
+        self.kind = kind
+        if kind == "label":
+            self.values = array.array("i", [-1]) * rows
+            self.labels: list[str] = []
+            self._codes: dict[str, int] = {}
+        elif kind == "text":
+            self.values = [None] * rows
+        else:
+            self.values = array.array("d", [math.nan]) * rows
+
+    def encode(self, value: Any) -> Any:
+        if self.kind == "number":
+            if isinstance(value, bool):
+                return 1.0 if value else math.nan
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                return math.nan
+        if self.kind == "date":
+            return _epoch(value)
+        if value in (None, "", [], False):
+            return None if self.kind == "text" else -1
+        if isinstance(value, list):
+            value = ", ".join(str(v) for v in value)
+        elif not isinstance(value, str):
+            value = json.dumps(value)
+        if self.kind == "text":
+            return value
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.labels)
+            self.labels.append(sys.intern(value))
+        return code
+
+    def decode(self, row: int) -> Any:
+        value = self.values[row]
+        if self.kind == "text":
+            return value
+        if self.kind == "label":
+            return self.labels[value] if value >= 0 else None
+        if math.isnan(value):
+            return None
+        if self.kind == "date":
+            return _iso(value)
+        return int(value) if value.is_integer() else value
+
+    def _operand(self, value: Any) -> Any:
+        return _epoch(value) if self.kind == "date" else float(value)
+
+    def _text_test(self, op: str, value: Any):
+        if op in ("eq", "ne"):
+            return lambda text: text == str(value)
+        if op == "in":
+            wanted = {str(v) for v in value}
+            return lambda text: text in wanted
+        if op == "contains":
+            needle = str(value).lower()
+            return lambda text: needle in text.lower()
+        raise ValueError(f"Operator {op!r} does not apply to text columns")
+
+    def _matching_codes(self, op: str, value: Any) -> set[int]:
+        test = self._text_test(op, value)
+        return {code for code, label in enumerate(self.labels) if test(label)}
+
+    def predicate(self, op: str, value: Any):
+        """A ``row -> bool`` test, for when NumPy is not available."""
+        values = self.values
+        if self.kind == "text":
+            if op == "empty":
+                return lambda row: values[row] is None
+            if op == "not_empty":
+                return lambda row: values[row] is not None
+            test = self._text_test(op, value)
+            if op == "ne":
+                return lambda row: values[row] is None or not test(values[row])
+            return lambda row: values[row] is not None and test(values[row])
+        if self.kind == "label":
+            if op == "empty":
+                return lambda row: values[row] < 0
+            if op == "not_empty":
+                return lambda row: values[row] >= 0
+            codes = self._matching_codes(op, value)
+            if op == "ne":
+                return lambda row: values[row] not in codes
+            return lambda row: values[row] in codes
+        if op == "empty":
+            return lambda row: math.isnan(values[row])
+        if op == "not_empty":
+            return lambda row: not math.isnan(values[row])
+        operand = self._operand(value)
+        compare = {
+            "eq": lambda v: v == operand,
+            "ne": lambda v: v != operand,
+            "gt": lambda v: v > operand,
+            "gte": lambda v: v >= operand,
+            "lt": lambda v: v < operand,
+            "lte": lambda v: v <= operand,
+        }.get(op)
+        if compare is None:
+            raise ValueError(f"Operator {op!r} does not apply to {self.kind} columns")
+        return lambda row: compare(values[row])
+
+    def mask(self, np: Any, op: str, value: Any) -> Any:
+        """A boolean NumPy array over all rows."""
+        if self.kind == "text":
+            test = self.predicate(op, value)
+            rows = len(self.values)
+            return np.fromiter(map(test, range(rows)), dtype=bool, count=rows)
+        dtype = np.int32 if self.kind == "label" else np.float64
+        values = np.frombuffer(self.values, dtype=dtype)
+        if self.kind == "label":
+            if op == "empty":
+                return values < 0
+            if op == "not_empty":
+                return values >= 0
+            codes = np.fromiter(self._matching_codes(op, value), dtype=np.int32)
+            matches = np.isin(values, codes)
+            return ~matches if op == "ne" else matches
+        if op == "empty":
+            return np.isnan(values)
+        if op == "not_empty":
+            return ~np.isnan(values)
+        operand = self._operand(value)
+        with np.errstate(invalid="ignore"):
+            if op == "eq":
+                return values == operand
+            if op == "ne":
+                return values != operand
+            if op == "gt":
+                return values > operand
+            if op == "gte":
+                return values >= operand
+            if op == "lt":
+                return values < operand
+            if op == "lte":
+                return values <= operand
+        raise ValueError(f"Operator {op!r} does not apply to {self.kind} columns")
+
+    def sort_keys(self) -> array.array:
+        """Floats ordering the rows by this column, with NaN for empty cells."""
+        if self.kind in ("number", "date"):
+            return self.values
+        if self.kind == "text":
+            keys = array.array("d", [math.nan]) * len(self.values)
+            rows = [row for row, text in enumerate(self.values) if text is not None]
+            for rank, row in enumerate(sorted(rows, key=self.values.__getitem__)):
+                keys[row] = rank
+            return keys
+        ranks = [0.0] * len(self.labels)
+        for rank, code in enumerate(
+            sorted(range(len(self.labels)), key=self.labels.__getitem__)
+        ):
+            ranks[code] = float(rank)
+        return array.array(
+            "d", (ranks[code] if code >= 0 else math.nan for code in self.values)
+        )
+
+    def nbytes(self) -> int:
+        if self.kind == "text":
+            return 8 * len(self.values) + sum(
+                len(text) for text in self.values if text is not None
+            )
+        size = self.values.itemsize * len(self.values)
+        if self.kind == "label":
+            size += sum(len(label) for label in self.labels)
+        return size
+
+
+class BoardSnapshot:
+    """The items of one board, one typed array per column."""
+
+    def __init__(self, board_id: str):
+        self.board_id = board_id
+        self.built_at = time.monotonic()
+        self.rows = 0
+        self.ids = array.array("q")
+        self.alive = array.array("b")
+        # The item ID index: IDs in ascending order with their rows, plus the
+        # rows added since it was last sorted.
+        self._sorted_ids = array.array("q")
+        self._sorted_rows = array.array("i")
+        self._recent: dict[int, int] = {}
+        self.columns: dict[str, _Column] = {
+            "name": _Column("text", 0),
+            "group": _Column("label", 0),
+        }
+        self.dirty: set[str] = set()
+        self._lock = threading.RLock()
+
+    def _column(self, column_id: str, column_type: Optional[str]) -> _Column:
+        column = self.columns.get(column_id)
+        if column is None:
+            if column_type in NUMBER_TYPES:
+                kind = "number"
+            elif column_type in DATE_TYPES:
+                kind = "date"
+            elif column_type in TEXT_TYPES:
+                kind = "text"
+            else:
+                kind = "label"
+            column = self.columns[column_id] = _Column(kind, self.rows)
+        return column
+
+    def row_of(self, item_id: Any) -> Optional[int]:
+        """The row of an item, or None if it is not in the snapshot."""
+        item_id = int(item_id)
+        row = self._recent.get(item_id)
+        if row is not None:
+            return row
+        i = bisect.bisect_left(self._sorted_ids, item_id)
+        if i < len(self._sorted_ids) and self._sorted_ids[i] == item_id:
+            return self._sorted_rows[i]
+        return None
+
+    def compact_index(self) -> None:
+        """Fold the recently added rows into the sorted item ID index."""
+        if not self._recent:
+            return
+        order = sorted(range(self.rows), key=self.ids.__getitem__)
+        self._sorted_rows = array.array("i", order)
+        self._sorted_ids = array.array("q", map(self.ids.__getitem__, order))
+        self._recent.clear()
+
+    def add_items(self, items: Iterable[dict[str, Any]]) -> None:
+        """Add items (raw ``items_page`` items) or replace those already present."""
+        with self._lock:
+            for item in items:
+                item_id = int(item["id"])
+                row = self.row_of(item_id)
+                if item.get("state") not in (None, "active"):
+                    if row is not None:
+                        self.alive[row] = 0
+                    continue
+                if row is None:
+                    row = self.rows
+                    self.rows += 1
+                    self.ids.append(item_id)
+                    self.alive.append(1)
+                    for column in self.columns.values():
+                        column.values.append(column.encode(None))
+                    self._recent[item_id] = row
+                    # Sorting whenever the backlog outgrows the index keeps
+                    # incremental builds at O(n log n) overall.
+                    if len(self._recent) > max(
+                        INDEX_MIN_BACKLOG, len(self._sorted_ids)
+                    ):
+                        self.compact_index()
+                else:
+                    self.alive[row] = 1
+                cells = {
+                    "name": item.get("name"),
+                    "group": (item.get("group") or {}).get("title"),
+                }
+                seen = {"name", "group"}
+                for column_value in item.get("column_values") or []:
+                    column = self._column(column_value["id"], column_value.get("type"))
+                    column.values[row] = column.encode(
+                        decode_column_value(column_value)
+                    )
+                    seen.add(column_value["id"])
+                for column_id, value in cells.items():
+                    column = self.columns[column_id]
+                    column.values[row] = column.encode(value)
+                for column_id, column in self.columns.items():
+                    if column_id not in seen:
+                        column.values[row] = column.encode(None)
+
+    def remove(self, item_ids: Iterable[str]) -> None:
+        with self._lock:
+            for item_id in item_ids:
+                row = self.row_of(item_id)
+                if row is not None:
+                    self.alive[row] = 0
+
+    def __len__(self) -> int:
+        return sum(self.alive)
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the arrays and labels."""
+        return (
+            self.ids.itemsize * len(self.ids)
+            + len(self.alive)
+            + self._sorted_ids.itemsize * len(self._sorted_ids)
+            + self._sorted_rows.itemsize * len(self._sorted_rows)
+            + sum(column.nbytes() for column in self.columns.values())
+        )
+
+    def _get_column(self, column_id: str) -> _Column:
+        column = self.columns.get(column_id)
+        if column is None:
+            raise ValueError(f"Unknown column {column_id!r} on board {self.board_id}")
+        return column
+
+    def query(
+        self,
+        filters: Optional[list[dict[str, Any]]] = None,
+        sort_by: Optional[str] = None,
+        descending: bool = False,
+        limit: int = 50,
+        column_ids: Optional[list[str]] = None,
+    ) -> dict[str, Any]:
+        """Items matching all ``filters``, sorted and cut to the top ``limit``.
+
+        Filters are ``{"column", "op", "value"}`` with ``op`` one of
+        ``FILTER_OPS``; ``name`` and ``group`` are columns too.
+        """
+        with self._lock:
+            tests = []
+            for rule in filters or []:
+                op = rule.get("op", "eq")
+                if op not in FILTER_OPS:
+                    raise ValueError(f"Unknown operator {op!r}")
+                tests.append((self._get_column(rule["column"]), op, rule.get("value")))
+            sort_column = self._get_column(sort_by) if sort_by else None
+
+            np = _numpy()
+            if np is not None:
+                rows, matched = self._select_vectorized(
+                    np, tests, sort_column, descending, limit
+                )
+            else:
+                rows, matched = self._select(tests, sort_column, descending, limit)
+            return {
+                "matched": matched,
+                "items": [self._item(row, column_ids) for row in rows],
+            }
+
+    def _select_vectorized(self, np, tests, sort_column, descending, limit):
+        mask = np.frombuffer(self.alive, dtype=np.int8).astype(bool)
+        for column, op, value in tests:
+            mask &= column.mask(np, op, value)
+        rows = np.flatnonzero(mask)
+        matched = len(rows)
+        if sort_column is not None and matched:
+            keys = np.asarray(sort_column.sort_keys(), dtype=np.float64)[rows]
+            # Empty cells sort last either way.
+            keys = np.where(np.isnan(keys), np.inf, -keys if descending else keys)
+            if 0 < limit < matched:
+                # Take the top ``limit`` without sorting everything, breaking
+                # ties at the cut by row as a full stable sort would.
+                kth = np.partition(keys, limit - 1)[limit - 1]
+                top = np.flatnonzero(keys < kth)
+                ties = np.flatnonzero(keys == kth)[: limit - len(top)]
+                top = np.concatenate([top, ties])
+                rows = rows[top[np.argsort(keys[top], kind="stable")]]
+            else:
+                rows = rows[np.argsort(keys, kind="stable")]
+        return rows[:limit].tolist(), matched
+
+    def _select(self, tests, sort_column, descending, limit):
+        predicates = [column.predicate(op, value) for column, op, value in tests]
+        alive = self.alive
+        rows = [
+            row
+            for row in range(self.rows)
+            if alive[row] and all(test(row) for test in predicates)
+        ]
+        matched = len(rows)
+        if sort_column is not None:
+            keys = sort_column.sort_keys()
+
+            def key(row: int) -> float:
+                value = keys[row]
+                if math.isnan(value):
+                    return math.inf
+                return -value if descending else value
+
+            rows = heapq.nsmallest(limit, rows, key=key)
+        return rows[:limit], matched
+
+    def _item(self, row: int, column_ids: Optional[list[str]]) -> dict[str, Any]:
+        item = {
+            "id": str(self.ids[row]),
+            "name": self.columns["name"].decode(row),
+            "group": self.columns["group"].decode(row),
+        }
+        values = {}
+        for column_id, column in self.columns.items():
+            if column_id in ("name", "group"):
+                continue
+            if column_ids and column_id not in column_ids:
+                continue
+            value = column.decode(row)
+            if value is not None:
+                values[column_id] = value
+        item["column_values"] = values
+        return item
+
+
+def build_snapshot(monday_client: MondayClient, board_id: str) -> BoardSnapshot:
+    """Fetch every item of a board into a new snapshot."""
+    coalescer_for(monday_client).flush(board_id=board_id)
+    snapshot = BoardSnapshot(str(board_id))
+    for items, _ in iter_items_pages(
+        monday_client, board_id, SNAPSHOT_PAGE_SIZE, None, SNAPSHOT_ITEM_FIELDS
+    ):
+        snapshot.add_items(items)
+    snapshot.compact_index()
+    snapshot.built_at = time.monotonic()
+    return snapshot
+
+
+def refresh_items(monday_client: MondayClient, snapshot: BoardSnapshot) -> None:
+    """Re-fetch the snapshot's dirty items."""
+    with snapshot._lock:
+        dirty, snapshot.dirty = list(snapshot.dirty), set()
+    coalescer_for(monday_client).flush(item_ids=dirty)
+    for start in range(0, len(dirty), REFRESH_CHUNK):
+        chunk = dirty[start : start + REFRESH_CHUNK]
+        response = monday_client.custom._query(
+            f"""
+            query {{
+                items (ids: [{", ".join(chunk)}]) {{
+                    {SNAPSHOT_ITEM_FIELDS}
+                    board {{
+                        id
+                    }}
+                }}
+            }}
+            """
+        )
+        items = response.get("data", {}).get("items") or []
+        # Items gone from the board (deleted or moved away) are not returned.
+        returned = {
+            item["id"]
+            for item in items
+            if str((item.get("board") or {}).get("id")) == snapshot.board_id
+        }
+        snapshot.add_items(item for item in items if item["id"] in returned)
+        snapshot.remove(item_id for item_id in chunk if item_id not in returned)
+
+
+class SnapshotRegistry:
+    """The board snapshots of one client, least recently used first out."""
+
+    def __init__(
+        self,
+        ttl: float = MONDAY_SNAPSHOT_TTL,
+        max_boards: int = MONDAY_SNAPSHOT_MAX_BOARDS,
+    ):
+        self.ttl = ttl
+        self.max_boards = max_boards
+        self._snapshots: OrderedDict[str, BoardSnapshot] = OrderedDict()
+        self._building: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.builds = 0
+        self.hits = 0
+        self.refreshed_items = 0
+
+    def get(self, monday_client: MondayClient, board_id: str) -> BoardSnapshot:
+        """A fresh snapshot of the board, building or refreshing it if needed."""
+        board_id = str(board_id)
+        with self._lock:
+            build_lock = self._building.setdefault(board_id, threading.Lock())
+        with build_lock:
+            with self._lock:
+                snapshot = self._snapshots.get(board_id)
+                if snapshot is not None and (
+                    time.monotonic() - snapshot.built_at > self.ttl
+                ):
+                    del self._snapshots[board_id]
+                    snapshot = None
+            if snapshot is None:
+                snapshot = build_snapshot(monday_client, board_id)
+                with self._lock:
+                    self.builds += 1
+                    self._snapshots[board_id] = snapshot
+                    while len(self._snapshots) > self.max_boards:
+                        self._snapshots.popitem(last=False)
+            else:
+                if snapshot.dirty:
+                    with self._lock:
+                        self.refreshed_items += len(snapshot.dirty)
+                    refresh_items(monday_client, snapshot)
+                with self._lock:
+                    self.hits += 1
+            with self._lock:
+                if board_id in self._snapshots:
+                    self._snapshots.move_to_end(board_id)
+            return snapshot
+
+    def mark_dirty(self, item_ids: list[str], board_id: Optional[str] = None) -> None:
+        """Mark items for re-fetching in the snapshot of ``board_id`` or those holding them."""
+        with self._lock:
+            snapshots = list(self._snapshots.values())
+        for snapshot in snapshots:
+            with snapshot._lock:
+                for item_id in item_ids:
+                    if snapshot.board_id == str(board_id) or (
+                        snapshot.row_of(item_id) is not None
+                    ):
+                        snapshot.dirty.add(str(item_id))
+
+    def discard(self, board_id: str) -> None:
+        with self._lock:
+            self._snapshots.pop(str(board_id), None)
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            snapshots = list(self._snapshots.values())
+            counts = {
+                "builds": self.builds,
+                "hits": self.hits,
+                "refreshed_items": self.refreshed_items,
+            }
+        return {
+            "boards": len(snapshots),
+            "items": sum(len(s) for s in snapshots),
+            "bytes": sum(s.nbytes() for s in snapshots),
+            **counts,
+        }
+
+
+_registries: "weakref.WeakKeyDictionary[Any, SnapshotRegistry]" = (
+    weakref.WeakKeyDictionary()
+)
+_registries_lock = threading.Lock()
+
+
+def snapshots_for(owner: Any) -> SnapshotRegistry:
+    """Return the snapshot registry belonging to ``owner`` (usually a MondayClient)."""
+    with _registries_lock:
+        registry = _registries.get(owner)
+        if registry is None:
+            registry = _registries[owner] = SnapshotRegistry()
+        return registry
+
+
+def _all_registries() -> list[SnapshotRegistry]:
+    with _registries_lock:
+        return list(_registries.values())
+
+
+def mark_items_dirty(item_ids: list[str], board_id: Optional[str] = None) -> None:
+    """Note items written through this server in every snapshot that may hold them.
+
+    Pages prefetched from the board (from any board if it is not known) are
+    dropped as well.
+    """
+    for registry in _all_registries():
+        registry.mark_dirty([str(item_id) for item_id in item_ids], board_id)
+    if item_ids:
+        discard_pages(board_id)
+
+
+def on_invalidate(prefix: str) -> None:
+    """Drop snapshots of boards whose structure was invalidated in the board cache."""
+    if not prefix.startswith("board:"):
+        return
+    board_id = prefix.split(":")[1]
+    for registry in _all_registries():
+        registry.discard(board_id)
+
+
+def snapshot_metrics() -> dict[str, Any]:
+    totals = {
+        "boards": 0,
+        "items": 0,
+        "bytes": 0,
+        "builds": 0,
+        "hits": 0,
+        "refreshed_items": 0,
+    }
+    for registry in _all_registries():
+        for name, value in registry.metrics().items():
+            totals[name] += value
+    return totals
+
+
+async def handle_monday_search_items(
+    boardId: str,
+    monday_client: MondayClient,
+    filters: Optional[list[dict[str, Any]]] = None,
+    sortBy: Optional[str] = None,
+    descending: bool = False,
+    limit: int = 50,
+    columnIds: Optional[list[str]] = None,
+) -> list[types.TextContent]:
+    """Filter, sort and take the top items of a board from its snapshot."""
+    snapshot = snapshots_for(monday_client).get(monday_client, boardId)
+    result = snapshot.query(filters, sortBy, descending, limit, columnIds)
+    result["snapshot_age_seconds"] = round(time.monotonic() - snapshot.built_at, 1)
+    return [
+        types.TextContent(
+            type="text",
+            text=f"{result['matched']} of {len(snapshot)} items of Monday.com board "
+            f"{boardId} match. {json.dumps(result)}",
+        )
+    ]
@@ -0,0 +1,174 @@
+"""An item with its sub-items, column values and latest updates as one tree.
+
+Everything is fetched with a single nested GraphQL document. Only if Monday.com
+rejects it for exceeding the per-query complexity ceiling are the sub-items'
+updates moved into follow-up queries.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any, Optional
+
+from mcp import types
+
+from mcp_server_monday.coalesce import coalescer_for
+from mcp_server_monday.columns import compact_items
+from mcp_server_monday.item import update_plain_text
+from mcp_server_monday.pagesize import exceeds_max_complexity
+
+if TYPE_CHECKING:
+    from monday import MondayClient
+
+# Sub-items whose updates are fetched per follow-up query after a split.
+SUBITEM_UPDATES_CHUNK = 25
+
+UPDATE_FIELDS = """
+    id
+    body
+    created_at
+    updated_at
+    creator {
+        name
+    }
+"""
+
+
+def _item_fields(
+    column_ids: Optional[list[str]], updates_limit: int, with_updates: bool
+) -> str:
+    column_filter = ""
+    if column_ids:
+        column_filter = f"(ids: [{', '.join(json.dumps(c) for c in column_ids)}])"
+    fields = f"""
+        id
+        name
+        column_values {column_filter} {{
+            id
+            type
+            text
+            value
+        }}
+    """
+    if with_updates and updates_limit > 0:
+        fields += f"updates (limit: {updates_limit}) {{ {UPDATE_FIELDS} }}"
+    return fields
+
+
+def item_tree_query(
+    item_id: str,
+    column_ids: Optional[list[str]],
+    updates_limit: int,
+    subitem_updates: bool = True,
+) -> str:
+    """The nested document for an item, its group, sub-items and their updates."""
+    return f"""
+    query {{
+        items (ids: [{item_id}]) {{
+            {_item_fields(column_ids, updates_limit, True)}
+            board {{
+                id
+            }}
+            group {{
+                id
+                title
+            }}
+            subitems {{
+                {_item_fields(column_ids, updates_limit, subitem_updates)}
+            }}
+        }}
+    }}
+    """
+
+
+def _node(
+    monday_client: MondayClient, item: dict[str, Any], max_length: Optional[int]
+) -> dict[str, Any]:
+    node = {"id": item["id"], "name": item.get("name")}
+    if item.get("group"):
+        node["group"] = item["group"]
+    if item.get("column_values"):
+        node["columns"] = item["column_values"]
+    if item.get("updates"):
+        node["updates"] = [
+            {
+                "id": update["id"],
+                "created_at": update.get("created_at"),
+                "creator": (update.get("creator") or {}).get("name"),
+                "text": update_plain_text(monday_client, update, max_length),
+            }
+            for update in item["updates"]
+        ]
+    if item.get("subitems"):
+        node["subitems"] = [
+            _node(monday_client, subitem, max_length) for subitem in item["subitems"]
+        ]
+    return node
+
+
+def fetch_item_tree(
+    monday_client: MondayClient,
+    item_id: str,
+    column_ids: Optional[list[str]] = None,
+    updates_limit: int = 5,
+    max_update_length: Optional[int] = 500,
+) -> Optional[dict[str, Any]]:
+    """Return the compact tree of an item, or None if it does not exist."""
+    from monday.exceptions import MondayQueryError
+
+    coalescer_for(monday_client).flush(item_ids=[item_id])
+    try:
+        response = monday_client.custom._query(
+            item_tree_query(item_id, column_ids, updates_limit)
+        )
+    except MondayQueryError as e:
+        if not exceeds_max_complexity(e):
+            raise
+        response = monday_client.custom._query(
+            item_tree_query(item_id, column_ids, updates_limit, subitem_updates=False)
+        )
+        items = response.get("data", {}).get("items") or []
+        subitems = {s["id"]: s for item in items for s in item.get("subitems") or []}
+        subitem_ids = list(subitems)
+        for start in range(0, len(subitem_ids), SUBITEM_UPDATES_CHUNK):
+            chunk = subitem_ids[start : start + SUBITEM_UPDATES_CHUNK]
+            updates_response = monday_client.custom._query(
+                f"""
+                query {{
+                    items (ids: [{", ".join(chunk)}]) {{
+                        id
+                        updates (limit: {updates_limit}) {{ {UPDATE_FIELDS} }}
+                    }}
+                }}
+                """
+            )
+            for item in updates_response.get("data", {}).get("items") or []:
+                subitems[item["id"]]["updates"] = item.get("updates")
+
+    items = compact_items(response.get("data", {}).get("items") or [])
+    if not items:
+        return None
+    tree = _node(monday_client, items[0], max_update_length)
+    tree["board_id"] = (items[0].get("board") or {}).get("id")
+    return tree
+
+
+async def handle_monday_get_item_tree(
+    itemId: str,
+    monday_client: MondayClient,
+    columnIds: Optional[list[str]] = None,
+    updatesLimit: int = 5,
+    maxUpdateLength: Optional[int] = 500,
+) -> list[types.TextContent]:
+    """Get an item with its sub-items, column values and latest updates."""
+    tree = fetch_item_tree(
+        monday_client, itemId, columnIds, updatesLimit, maxUpdateLength
+    )
+    if tree is None:
+        return [types.TextContent(type="text", text=f"Item {itemId} not found.")]
+    return [
+        types.TextContent(
+            type="text",
+            text=f"Item tree of Monday.com item {itemId}: {json.dumps(tree)}",
+        )
+    ]
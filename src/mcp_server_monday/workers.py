@@ -0,0 +1,284 @@
+"""Pre-fork serving mode for the Monday.com FastMCP server.
+
+The parent process binds the public port and runs a small router in front of N
+worker processes, each serving the MCP app on a private loopback port. MCP
+sessions stay pinned to the worker that created them: the router learns the
+``mcp-session-id`` a worker hands out on ``initialize`` and routes every later
+request carrying that ID back to the same worker.
+
+The parent binds and listens on the workers' ports (any free ones) before
+starting them, so requests queue while a worker starts, and restarts a worker
+that exits on the same socket; sessions it held are lost, and their clients
+are told to start new ones.
+
+Workers also share a cache invalidation channel through the parent, so that a
+write handled by one worker drops stale board data cached by the others. Each
+worker has one pipe to the parent and one from it.
+"""
+
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import socket
+import threading
+import time
+from collections import OrderedDict
+from multiprocessing.connection import Connection, wait
+from multiprocessing.context import SpawnContext, SpawnProcess
+from typing import Callable
+
+import httpx
+import uvicorn
+from starlette.applications import Starlette
+from starlette.background import BackgroundTask
+from starlette.requests import Request
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+
+logger = logging.getLogger("fastmcp-server-monday.workers")
+
+SESSION_HEADER = "mcp-session-id"
+MAX_TRACKED_SESSIONS = 100_000
+# A worker exiting sooner than this after its start is restarted only after it.
+RESTART_DELAY = 1.0
+
+# Hop-by-hop headers must not be forwarded by a proxy (RFC 9110, section 7.6.1).
+_HOP_BY_HOP_HEADERS = {
+    "connection",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "te",
+    "trailer",
+    "transfer-encoding",
+    "upgrade",
+    "host",
+    "content-length",
+}
+
+
+def _worker_main(
+    index: int,
+    sock: socket.socket,
+    path: str,
+    outbox: Connection,
+    inbox: Connection,
+) -> None:
+    """Entry point of a worker process, serving on the bound ``sock``."""
+    from mcp_server_monday import cache, fastmcp_server
+
+    # Invalidations are published from whichever thread made them.
+    send_lock = threading.Lock()
+
+    def publish(prefix: str) -> None:
+        with send_lock:
+            outbox.send(prefix)
+
+    def listen() -> None:
+        while True:
+            try:
+                prefix = inbox.recv()
+            except EOFError:
+                return
+            cache.invalidate(prefix, broadcast=False)
+
+    cache.add_invalidation_publisher(publish)
+    threading.Thread(target=listen, name="cache-invalidation", daemon=True).start()
+
+    logger.info(f"Worker {index} serving on 127.0.0.1:{sock.getsockname()[1]}")
+    app = fastmcp_server.mcp.http_app(
+        path=path, transport="http", **fastmcp_server.http_transport_kwargs()
+    )
+    server = uvicorn.Server(
+        uvicorn.Config(app, lifespan="on", timeout_graceful_shutdown=0)
+    )
+    asyncio.run(server.serve(sockets=[sock]))
+
+
+class _Worker:
+    """A worker process and the parent's ends of its pipes."""
+
+    def __init__(self, ctx: SpawnContext, index: int, sock: socket.socket, path: str):
+        self.index = index
+        inbox, worker_outbox = ctx.Pipe(duplex=False)
+        worker_inbox, outbox = ctx.Pipe(duplex=False)
+        self.process: SpawnProcess = ctx.Process(
+            target=_worker_main,
+            args=(index, sock, path, worker_outbox, worker_inbox),
+            name=f"mcp-server-monday-worker-{index}",
+            daemon=True,
+        )
+        self.process.start()
+        self.started_at = time.monotonic()
+        worker_outbox.close()
+        worker_inbox.close()
+        self.inbox = inbox
+        self.outbox = outbox
+
+    def close(self) -> None:
+        self.inbox.close()
+        self.outbox.close()
+
+
+def _supervise(
+    workers: list[_Worker],
+    restart: Callable[[int], _Worker],
+    stopping: threading.Event,
+) -> None:
+    """Relay invalidations between workers and restart workers that exit.
+
+    The only thread of the parent using the workers' pipes.
+    """
+    while not stopping.is_set():
+        inboxes = {worker.inbox: worker for worker in workers}
+        sentinels = {worker.process.sentinel: worker for worker in workers}
+        for ready in wait([*inboxes, *sentinels], timeout=1):
+            if ready in sentinels:
+                worker = sentinels[ready]
+                if stopping.is_set():
+                    return
+                worker.process.join(timeout=1)
+                logger.warning(
+                    f"Worker {worker.index} exited with code "
+                    f"{worker.process.exitcode}; restarting it"
+                )
+                worker.close()
+                uptime = time.monotonic() - worker.started_at
+                if uptime < RESTART_DELAY:
+                    time.sleep(RESTART_DELAY - uptime)
+                workers[worker.index] = restart(worker.index)
+                continue
+            worker = inboxes[ready]
+            try:
+                prefix = worker.inbox.recv()
+            except (EOFError, OSError):
+                # Exiting: its sentinel follows.
+                continue
+            for other in workers:
+                if other is not worker:
+                    try:
+                        other.outbox.send(prefix)
+                    except OSError:
+                        pass
+
+
+class SessionRouter:
+    """Routes MCP requests to workers, keeping each session on one worker."""
+
+    def __init__(self, worker_ports: list[int]):
+        self.worker_urls = [f"http://127.0.0.1:{port}" for port in worker_ports]
+        self._sessions: OrderedDict[str, int] = OrderedDict()
+        self._next_worker = itertools.cycle(range(len(worker_ports)))
+        self._client = httpx.AsyncClient(timeout=None)
+
+    def _pick_worker(self, session_id: str | None) -> int:
+        if session_id is None:
+            return next(self._next_worker)
+        worker = self._sessions.get(session_id)
+        if worker is None:
+            # Unknown session (e.g. the router restarted): any worker will reply
+            # 404, which tells the client to start a new session.
+            return hash(session_id) % len(self.worker_urls)
+        self._sessions.move_to_end(session_id)
+        return worker
+
+    def _remember(self, session_id: str, worker: int) -> None:
+        self._sessions[session_id] = worker
+        self._sessions.move_to_end(session_id)
+        if len(self._sessions) > MAX_TRACKED_SESSIONS:
+            self._sessions.popitem(last=False)
+
+    async def handle(self, request: Request) -> Response:
+        session_id = request.headers.get(SESSION_HEADER)
+        worker = self._pick_worker(session_id)
+
+        headers = [
+            (name, value)
+            for name, value in request.headers.items()
+            if name.lower() not in _HOP_BY_HOP_HEADERS
+        ]
+        upstream_request = self._client.build_request(
+            request.method,
+            self.worker_urls[worker] + request.url.path,
+            params=request.query_params,
+            headers=headers,
+            content=request.stream(),
+        )
+        try:
+            upstream = await self._client.send(upstream_request, stream=True)
+        except httpx.HTTPError as e:
+            logger.error(f"Worker {worker} unavailable: {e}")
+            return Response(status_code=502, content=f"Worker unavailable: {e}")
+
+        new_session_id = upstream.headers.get(SESSION_HEADER)
+        if new_session_id and new_session_id != session_id:
+            self._remember(new_session_id, worker)
+        if request.method == "DELETE" and session_id:
+            self._sessions.pop(session_id, None)
+
+        return StreamingResponse(
+            upstream.aiter_raw(),
+            status_code=upstream.status_code,
+            headers={
+                name: value
+                for name, value in upstream.headers.items()
+                if name.lower() not in _HOP_BY_HOP_HEADERS
+            },
+            background=BackgroundTask(upstream.aclose),
+        )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+async def run_workers(workers: int, host: str, port: int, path: str) -> None:
+    """Start ``workers`` server processes behind a session-affine router."""
+    ctx = multiprocessing.get_context("spawn")
+    sockets = []
+    for _ in range(workers):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(("127.0.0.1", 0))
+        sock.listen()
+        sockets.append(sock)
+    worker_ports = [sock.getsockname()[1] for sock in sockets]
+
+    def start(index: int) -> _Worker:
+        return _Worker(ctx, index, sockets[index], path)
+
+    running = [start(index) for index in range(workers)]
+    stopping = threading.Event()
+    supervisor = threading.Thread(
+        target=_supervise,
+        args=(running, start, stopping),
+        name="worker-supervisor",
+        daemon=True,
+    )
+    supervisor.start()
+
+    router = SessionRouter(worker_ports)
+    methods = ["GET", "POST", "DELETE", "PUT", "PATCH", "OPTIONS", "HEAD"]
+    app = Starlette(
+        routes=[Route("/{path:path}", router.handle, methods=methods)],
+        on_shutdown=[router.aclose],
+    )
+    logger.info(
+        f"Routing http://{host}:{port}{path} to {workers} workers on ports "
+        f"{', '.join(map(str, worker_ports))}"
+    )
+    server = uvicorn.Server(
+        uvicorn.Config(app, host=host, port=port, timeout_graceful_shutdown=0)
+    )
+    try:
+        await server.serve()
+    finally:
+        stopping.set()
+        supervisor.join()
+        for worker in running:
+            worker.process.terminate()
+        for worker in running:
+            worker.process.join(timeout=5)
+            worker.close()
+        for sock in sockets:
+            sock.close()
@@ -0,0 +1,146 @@
+"""
+Test that cancelled tool calls stop using upstream capacity within milliseconds
+
+Points the server at a local API that holds every request for several seconds,
+starts tool calls, cancels them with MCP ``notifications/cancelled`` and checks
+that their scheduler slots are free again and their upstream requests aborted
+well before the API would have answered.
+"""
+
+import asyncio
+import logging
+import os
+import select
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+os.environ.setdefault("MONDAY_API_KEY", "test")
+os.environ.pop("MONDAY_RECORD_CASSETTE", None)
+
+CALLS = 3
+UPSTREAM_DELAY = 5.0
+# Far below UPSTREAM_DELAY, with room for a slow test machine.
+BOUND = 0.5
+
+
+class SlowUpstream:
+    """Holds each request for UPSTREAM_DELAY seconds, noting when clients hang up."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.closed_at = []
+        self.lock = threading.Lock()
+        upstream = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                with upstream.lock:
+                    upstream.in_flight += 1
+                try:
+                    # Readable before the reply is sent only once the client
+                    # has closed its end.
+                    readable, _, _ = select.select(
+                        [self.connection], [], [], UPSTREAM_DELAY
+                    )
+                    if readable:
+                        with upstream.lock:
+                            upstream.closed_at.append(time.perf_counter())
+                        self.close_connection = True
+                        return
+                    payload = b'{"data": {"boards": []}}'
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(payload)))
+                    self.end_headers()
+                    self.wfile.write(payload)
+                finally:
+                    with upstream.lock:
+                        upstream.in_flight -= 1
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.endpoint = f"http://127.0.0.1:{self.server.server_port}/v2"
+
+
+async def wait_until(condition, timeout):
+    """Seconds until ``condition()`` held, or ``inf``."""
+    started_at = time.perf_counter()
+    while not condition():
+        if time.perf_counter() - started_at > timeout:
+            return float("inf")
+        await asyncio.sleep(0.001)
+    return time.perf_counter() - started_at
+
+
+async def cancel_calls(upstream):
+    from fastmcp import Client
+
+    from mcp_server_monday.fastmcp_server import get_monday_client, mcp
+    from mcp_server_monday.scheduler import scheduler_for
+
+    monday_client = get_monday_client()
+    for resource in vars(monday_client).values():
+        if hasattr(getattr(resource, "client", None), "endpoint"):
+            resource.client.endpoint = upstream.endpoint
+    scheduler = scheduler_for(monday_client)
+
+    async with Client(mcp) as client:
+        first_request_id = client.session._request_id
+        tasks = [
+            asyncio.create_task(
+                client.call_tool(
+                    "monday_get_board_groups",
+                    {"boardId": f"cancel{i}"},
+                    raise_on_error=False,
+                )
+            )
+            for i in range(CALLS)
+        ]
+        assert await wait_until(lambda: upstream.in_flight == CALLS, 5) < 5
+        assert scheduler.available == scheduler.concurrency - CALLS
+
+        cancelled_at = time.perf_counter()
+        for request_id in range(first_request_id, first_request_id + CALLS):
+            await client.cancel(request_id)
+        slots_free = await wait_until(
+            lambda: scheduler.available == scheduler.concurrency, BOUND
+        )
+        upstream_idle = await wait_until(lambda: upstream.in_flight == 0, BOUND)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    return slots_free, upstream_idle, [t - cancelled_at for t in upstream.closed_at]
+
+
+def test_cancelled_calls_free_upstream_capacity():
+    """Cancelling calls frees their slots and aborts their requests within BOUND"""
+
+    logging.getLogger("mcp").setLevel(logging.WARNING)
+    upstream = SlowUpstream()
+    try:
+        slots_free, upstream_idle, closed = asyncio.run(cancel_calls(upstream))
+    finally:
+        upstream.server.shutdown()
+
+    print(
+        f"✅ slots free after {slots_free * 1000:.1f} ms, upstream idle after "
+        f"{upstream_idle * 1000:.1f} ms"
+    )
+    assert slots_free < BOUND, "scheduler slots were not released"
+    assert upstream_idle < BOUND, "upstream requests were not aborted"
+    assert len(closed) == CALLS, f"{len(closed)} of {CALLS} connections closed"
+    assert max(closed) < BOUND, f"connections closed after {max(closed):.3f}s"
+
+
+if __name__ == "__main__":
+    test_cancelled_calls_free_upstream_capacity()
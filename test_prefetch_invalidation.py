@@ -0,0 +1,74 @@
+"""
+Test that item writes drop prefetched pages
+
+Prefetches the next page of a board listing, writes to an item of the board
+with a tool that does not know the board (move, delete, archive) or one that
+does (create), and checks that the follow-up listing does not get the page
+prefetched before the write.
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+os.environ.setdefault("MONDAY_API_KEY", "test")
+
+from mcp_server_monday.item import (  # noqa: E402
+    handle_monday_archive_item,
+    handle_monday_create_item,
+    handle_monday_delete_item,
+    handle_monday_move_item_to_group,
+)
+from mcp_server_monday.prefetch import prefetcher_for  # noqa: E402
+
+
+class FakeItems:
+    def move_item_to_group(self, item_id, group_id):
+        return {"data": {"move_item_to_group": {"id": item_id}}}
+
+    def delete_item_by_id(self, item_id):
+        return {"data": {"delete_item": {"id": item_id}}}
+
+    def archive_item_by_id(self, item_id):
+        return {"data": {"archive_item": {"id": item_id}}}
+
+    def create_item(self, board_id, group_id, item_name, column_values):
+        return {"data": {"create_item": {"id": "99"}}}
+
+
+class FakeClient:
+    items = FakeItems()
+
+
+WRITES = {
+    "move": lambda client: handle_monday_move_item_to_group(client, "1", "other"),
+    "delete": lambda client: handle_monday_delete_item(client, "1"),
+    "archive": lambda client: handle_monday_archive_item(client, "1"),
+    "create": lambda client: handle_monday_create_item(
+        "100", "New item", client, groupId="topics"
+    ),
+}
+
+
+def test_writes_drop_prefetched_pages():
+    """A page prefetched before an item write is not served after it"""
+
+    for name, write in WRITES.items():
+        client = FakeClient()
+        prefetcher = prefetcher_for(client)
+        prefetcher.enabled = True
+        prefetcher.prefetch("100:25:next", lambda: {"stale": True}, spare=True)
+        prefetcher.prefetch("200:25:next", lambda: {"other": True}, spare=True)
+
+        asyncio.run(write(client))
+
+        assert prefetcher.take("100:25:next") is None, name
+        if name == "create":
+            # Only pages of the board written to are dropped.
+            assert prefetcher.take("200:25:next") == {"other": True}
+        print(f"✅ {name} dropped the prefetched page")
+
+
+if __name__ == "__main__":
+    test_writes_drop_prefetched_pages()
@@ -0,0 +1,128 @@
+"""
+Test that one MCP session can be served by two server instances
+
+Starts two servers in stateless HTTP mode sharing a SQLite session store,
+initializes a session on the first and then alternates its requests between
+them, like a load balancer without sticky routing would.
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import requests
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
+PORTS = (8001, 8002)
+HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json, text/event-stream",
+}
+
+
+def start_server(port, store_url):
+    env = dict(
+        os.environ,
+        MONDAY_API_KEY=os.environ.get("MONDAY_API_KEY", "test"),
+        FASTMCP_HOST="127.0.0.1",
+        FASTMCP_PORT=str(port),
+        FASTMCP_STATELESS_HTTP="true",
+        MCP_SESSION_STORE=store_url,
+        PYTHONPATH=os.pathsep.join(filter(None, [SRC, os.environ.get("PYTHONPATH")])),
+    )
+    return subprocess.Popen(
+        [sys.executable, "-c", "from mcp_server_monday import main; main()"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def wait_for(url, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            requests.get(url, timeout=1)
+            return
+        except requests.ConnectionError:
+            time.sleep(0.2)
+    raise RuntimeError(f"{url} did not start")
+
+
+def parse(response):
+    """The JSON-RPC message of a JSON or event-stream response."""
+    if response.headers.get("content-type", "").startswith("text/event-stream"):
+        for line in response.text.strip().split("\n"):
+            if line.startswith("data: "):
+                return json.loads(line[6:])
+    return response.json()
+
+
+def test_alternating_servers():
+    """Requests of one session alternate between two servers sharing a store"""
+
+    with tempfile.TemporaryDirectory() as directory:
+        store_url = f"sqlite:///{os.path.join(directory, 'sessions.db')}"
+        servers = [start_server(port, store_url) for port in PORTS]
+        try:
+            urls = [f"http://127.0.0.1:{port}/api/mcp/" for port in PORTS]
+            for url in urls:
+                wait_for(url)
+
+            print("🔧 Initialize on the first server...")
+            init_payload = {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "initialize",
+                "params": {
+                    "protocolVersion": "2024-11-05",
+                    "capabilities": {},
+                    "clientInfo": {"name": "test", "version": "1.0.0"},
+                },
+            }
+            response = requests.post(urls[0], json=init_payload, headers=HEADERS)
+            assert response.status_code == 200, response.text
+            session_id = response.headers.get("mcp-session-id")
+            assert session_id
+            print(f"✅ Session ID: {session_id}")
+            headers = dict(HEADERS, **{"mcp-session-id": session_id})
+
+            response = requests.post(
+                urls[1],
+                json={"jsonrpc": "2.0", "method": "notifications/initialized"},
+                headers=headers,
+            )
+            assert response.status_code in (200, 202), response.text
+
+            for request_id in range(2, 8):
+                url = urls[request_id % 2]
+                response = requests.post(
+                    url,
+                    json={"jsonrpc": "2.0", "id": request_id, "method": "tools/list"},
+                    headers=headers,
+                )
+                assert response.status_code == 200, response.text
+                assert response.headers.get("mcp-session-id") == session_id
+                tools = parse(response)["result"]["tools"]
+                assert any(tool["name"] == "monday_list_boards" for tool in tools)
+                print(f"✅ tools/list on {url}: {len(tools)} tools")
+
+            print("\n🔧 End the session on the second server...")
+            requests.delete(urls[1], headers=headers)
+            response = requests.post(
+                urls[0],
+                json={"jsonrpc": "2.0", "id": 8, "method": "tools/list"},
+                headers=headers,
+            )
+            assert response.status_code == 404, response.text
+            print("✅ The first server no longer knows the session")
+        finally:
+            for server in servers:
+                server.terminate()
+                server.wait()
+
+
+if __name__ == "__main__":
+    test_alternating_servers()
@@ -0,0 +1,98 @@
+"""
+Test that a streamed page failing halfway is reported like any upstream failure
+
+Serves half of an items page and then either closes the connection or stalls
+past the read timeout, and checks that the error raised while iterating the
+streamed page is one that adaptive page sizing and serve-stale recognise.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+os.environ.setdefault("MONDAY_API_KEY", "test")
+
+import requests  # noqa: E402
+
+from mcp_server_monday.cache import is_upstream_failure  # noqa: E402
+from mcp_server_monday.client import create_monday_client  # noqa: E402
+from mcp_server_monday.pagesize import is_page_failure  # noqa: E402
+from mcp_server_monday.paging import StreamedItemsPage  # noqa: E402
+
+READ_TIMEOUT = 0.5
+PAGE = json.dumps(
+    {
+        "data": {
+            "boards": [
+                {
+                    "items_page": {
+                        "cursor": "next",
+                        "items": [
+                            {"id": str(i), "name": f"Item {i}"} for i in range(20_000)
+                        ],
+                    }
+                }
+            ]
+        }
+    }
+).encode()
+
+
+class HalfPageHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE[: len(PAGE) // 2])
+        self.wfile.flush()
+        if self.path.endswith("/stall"):
+            time.sleep(READ_TIMEOUT * 4)
+        self.close_connection = True
+
+    def log_message(self, *args):
+        pass
+
+
+def test_stream_failing_halfway():
+    """Closing or stalling mid-page raises a requests error both predicates know"""
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), HalfPageHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        for mode, expected in (
+            ("close", requests.exceptions.ChunkedEncodingError),
+            ("stall", requests.Timeout),
+        ):
+            client = create_monday_client("test")
+            client.custom.client.endpoint = (
+                f"http://127.0.0.1:{server.server_port}/{mode}"
+            )
+            client.custom.client.timeout = READ_TIMEOUT
+            items = []
+            try:
+                for item in StreamedItemsPage(client, "query { boards { id } }"):
+                    items.append(item)
+            except Exception as e:
+                error = e
+            else:
+                raise AssertionError(f"{mode}: the page did not fail")
+            assert items, f"{mode}: no items arrived before the failure"
+            assert isinstance(error, expected), repr(error)
+            assert is_page_failure(error), repr(error)
+            assert is_upstream_failure(error), repr(error)
+            print(f"✅ {mode} after {len(items)} items: {type(error).__name__}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    test_stream_failing_halfway()